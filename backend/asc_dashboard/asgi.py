@@ -1,5 +1,8 @@
 """
 ASGI config for asc_dashboard project.
+
+Not used in production: `manage.py serve` runs the WSGI application, and the views are
+synchronous (see the README on why there are no async read views).
 """
 
 import os
@@ -0,0 +1,54 @@
+"""
+Gunicorn configuration for asc_dashboard.
+
+Used by `manage.py serve`; can also be passed to gunicorn directly:
+
+    gunicorn -c python:asc_dashboard.gunicorn_conf asc_dashboard.wsgi:application
+
+Values come from the SERVE_* settings (see settings.py and .env.example).
+"""
+
+import multiprocessing
+import os
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'asc_dashboard.settings')
+
+from django.conf import settings  # noqa: E402
+
+
+def default_workers():
+    return multiprocessing.cpu_count() * 2 + 1
+
+
+def default_threads():
+    # Threads mostly wait on SQLite and the network; past a handful per process they only
+    # contend for the GIL
+    return min(max(multiprocessing.cpu_count(), 2), 8)
+
+
+wsgi_app = 'asc_dashboard.wsgi:application'
+bind = settings.SERVE_BIND
+workers = settings.SERVE_WORKERS or default_workers()
+worker_class = 'gthread'
+threads = settings.SERVE_THREADS or default_threads()
+
+# Import Django and the URLconf once in the master; workers fork with it loaded
+preload_app = True
+
+# Recycle workers to bound memory growth; jitter keeps them from restarting together
+max_requests = settings.SERVE_MAX_REQUESTS
+max_requests_jitter = max(settings.SERVE_MAX_REQUESTS // 10, 1) if settings.SERVE_MAX_REQUESTS else 0
+
+timeout = settings.SERVE_TIMEOUT
+# On SIGTERM, workers finish in-flight requests for up to this many seconds
+graceful_timeout = settings.SERVE_GRACEFUL_TIMEOUT
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading must not be shared between processes
+    from django.db import connections
+
+    connections.close_all()
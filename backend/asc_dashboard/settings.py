@@ -4,7 +4,8 @@ Django settings for asc_dashboard project.
 
 from pathlib import Path
 from datetime import timedelta
-from decouple import config
+import django
+from decouple import Csv, config
 from django.core.exceptions import ImproperlyConfigured
 import os
 
@@ -48,6 +49,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'surveys.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -78,13 +80,36 @@ TEMPLATES = [
 WSGI_APPLICATION = 'asc_dashboard.wsgi.application'
 
 # Database
+# Take the write lock at BEGIN: a transaction that reads before writing cannot then fail
+# with "database is locked" on upgrade, which busy_timeout does not cover. Django 5.1+ does
+# this through the transaction_mode option; on older versions surveys/sqlite.py issues the
+# BEGIN itself. Empty means SQLite's default (DEFERRED).
+SQLITE_TRANSACTION_MODE = (config('SQLITE_TRANSACTION_MODE', default='IMMEDIATE') or '').strip().upper() or None
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Seconds a worker thread keeps its connection between requests (0: close after each)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'transaction_mode': SQLITE_TRANSACTION_MODE} if django.VERSION >= (5, 1) else {},
     }
 }
 
+# PRAGMAs run on every new SQLite connection (see surveys/sqlite.py); an empty value
+# leaves SQLite's default. WAL lets readers run alongside the single writer, and
+# synchronous=NORMAL is durable across application crashes in WAL mode (a power loss can
+# lose the last commits, not corrupt the file). cache_size is in KiB when negative.
+SQLITE_PRAGMAS = {
+    'journal_mode': config('SQLITE_JOURNAL_MODE', default='wal'),
+    'synchronous': config('SQLITE_SYNCHRONOUS', default='normal'),
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT_MS', default='5000'),
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=str(128 * 1024 * 1024)),
+    'cache_size': config('SQLITE_CACHE_SIZE', default='-20000'),
+    'temp_store': config('SQLITE_TEMP_STORE', default='memory'),
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -133,6 +158,56 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 100
 }
 
+# Serve dashboard statistics from the RatingRollup table when the filters allow it
+# (run `manage.py rebuild_rollups` after editing survey data outside the app).
+DASHBOARD_USE_ROLLUPS = config('DASHBOARD_USE_ROLLUPS', default=True, cast=bool)
+
+# Response compression (surveys/compression.py): codings in server preference order,
+# those whose module is not installed are skipped. Smaller bodies are sent uncompressed.
+COMPRESSION_ENABLED = config('COMPRESSION_ENABLED', default=True, cast=bool)
+COMPRESSION_ENCODINGS = config('COMPRESSION_ENCODINGS', default='zstd,br,gzip', cast=Csv())
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+
+# Dashboard response cache. Entries are keyed on the data version read from the database,
+# so writes from any process invalidate them and the timeout only bounds memory.
+# Multi-process deployments can point DASHBOARD_CACHE_URL at Redis so workers share entries.
+DASHBOARD_CACHE_ENABLED = config('DASHBOARD_CACHE_ENABLED', default=True, cast=bool)
+DASHBOARD_CACHE_TIMEOUT = config('DASHBOARD_CACHE_TIMEOUT', default=3600, cast=int)
+DASHBOARD_CACHE_URL = (config('DASHBOARD_CACHE_URL', default='') or '').strip()
+if DASHBOARD_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': DASHBOARD_CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'asc-dashboard',
+            'OPTIONS': {'MAX_ENTRIES': 2000},
+        }
+    }
+
+# Cold-start budget checked by `manage.py startup_profile`: wall time and peak RSS of a
+# process that loads the WSGI application and its URLconf (what a fresh worker does
+# before serving its first request).
+STARTUP_TIME_BUDGET_MS = config('STARTUP_TIME_BUDGET_MS', default=800, cast=int)
+STARTUP_RSS_BUDGET_MB = config('STARTUP_RSS_BUDGET_MB', default=80, cast=int)
+
+# Production server (`manage.py serve`, see asc_dashboard/gunicorn_conf.py). SERVE_WORKERS=0
+# sizes the pool from the CPU count (2 x CPUs + 1) and SERVE_THREADS=0 runs one thread per
+# CPU (2 to 8) in each worker. Without DASHBOARD_CACHE_URL each worker computes and holds its
+# own copy of every dashboard; SERVE_WORKERS=1 keeps a single copy. Workers are replaced
+# after SERVE_MAX_REQUESTS requests (plus up to 10% jitter) to bound memory growth.
+SERVE_BIND = config('SERVE_BIND', default='0.0.0.0:8000')
+SERVE_WORKERS = config('SERVE_WORKERS', default=0, cast=int)
+SERVE_THREADS = config('SERVE_THREADS', default=0, cast=int)
+SERVE_MAX_REQUESTS = config('SERVE_MAX_REQUESTS', default=1000, cast=int)
+SERVE_TIMEOUT = config('SERVE_TIMEOUT', default=60, cast=int)
+SERVE_GRACEFUL_TIMEOUT = config('SERVE_GRACEFUL_TIMEOUT', default=30, cast=int)
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=14),
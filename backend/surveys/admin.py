@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SurveyResponse, SurveyChoice
+from .models import SurveyResponse, SurveyChoice, WebhookInboxEntry
 
 
 @admin.register(SurveyResponse)
@@ -52,3 +52,11 @@ class SurveyChoiceAdmin(admin.ModelAdmin):
     list_filter = ['question_id']
     search_fields = ['question_id', 'choice_text']
 
+
+
+@admin.register(WebhookInboxEntry)
+class WebhookInboxEntryAdmin(admin.ModelAdmin):
+    list_display = ['id', 'received_at', 'status', 'attempts', 'next_attempt_at', 'response_id', 'processed_at']
+    list_filter = ['status', 'received_at']
+    search_fields = ['response_id', 'last_error']
+    readonly_fields = ['received_at', 'payload', 'attempts', 'last_error', 'response_id', 'processed_at', 'next_attempt_at']
@@ -0,0 +1,369 @@
+"""
+Single-statement aggregation of survey ratings for the dashboard endpoints.
+
+All totals, per-field sums and non-null counts come back from one SQL query; averages
+are derived from sum / count so they match the former values_list() computation exactly.
+With a group_by dimension the same query is grouped, and the overall figures are rolled
+up from the groups instead of being queried again.
+
+summarize_rollups() returns the same shape from the pre-aggregated RatingRollup table.
+summarize_dashboard() adds the Likert averages and per-answer distributions the dashboard
+summary shows, still in one query. histogram_responses() counts answers per value for
+any set of fields (optionally per group) with GROUP BY queries joined by UNION ALL, so
+the payload size depends on the number of distinct answers, not of responses.
+trend_responses()/trend_rollups() group the same statistics into day, week, month or
+academic-term buckets of the recorded date, with optional moving averages.
+"""
+
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db.models import Case, CharField, Count, DateField, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import ExtractYear, TruncDate, TruncMonth, TruncWeek
+
+from .models import SurveyResponse
+
+RATING_FIELDS = [
+    'rating_onboarding', 'rating_initiation', 'rating_mentorship',
+    'rating_team', 'rating_communications', 'rating_expectations',
+    'rating_sponsor', 'rating_workload',
+]
+
+AVERAGED_FIELDS = RATING_FIELDS + ['recommend_asc']
+
+# Ending-survey Likert questions (Q3.9-Q3.11) shown next to the ratings
+SKILL_FIELDS = ['hard_skills_improved', 'soft_skills_improved', 'confidence_job_placement']
+
+DISTRIBUTION_FIELDS = SKILL_FIELDS + AVERAGED_FIELDS
+
+GROUP_BY_EXPRESSIONS = {
+    'mentor': F('project_mentor'),
+    'topic': F('topic'),
+    'month': TruncMonth('recorded_date', output_field=DateField()),
+}
+
+ROLLUP_GROUP_BY_EXPRESSIONS = {
+    'mentor': F('project_mentor'),
+    'topic': F('topic'),
+    'month': TruncMonth('day', output_field=DateField()),
+}
+
+GROUP_BY_CHOICES = sorted(GROUP_BY_EXPRESSIONS)
+
+# Academic terms by first month, in calendar order within a year
+ACADEMIC_TERMS = [(1, 'spring'), (6, 'summer'), (8, 'fall')]
+
+
+def _term_expression(date_field):
+    """year * 10 + term number (1-based): sortable and groupable in SQL."""
+    whens = [
+        When(**{f'{date_field}__month__gte': first_month}, then=Value(number))
+        for number, (first_month, _) in reversed(list(enumerate(ACADEMIC_TERMS, start=1)))
+    ]
+    term = Case(*whens, default=Value(1), output_field=IntegerField())
+    return ExtractYear(date_field) * 10 + term
+
+
+TREND_EXPRESSIONS = {
+    'day': TruncDate('recorded_date'),
+    'week': TruncWeek('recorded_date', output_field=DateField()),
+    'month': TruncMonth('recorded_date', output_field=DateField()),
+    'term': _term_expression('recorded_date'),
+}
+
+ROLLUP_TREND_EXPRESSIONS = {
+    'day': F('day'),
+    'week': TruncWeek('day', output_field=DateField()),
+    'month': TruncMonth('day', output_field=DateField()),
+    'term': _term_expression('day'),
+}
+
+TREND_INTERVALS = list(TREND_EXPRESSIONS)
+
+_COUNT_KEYS = ('total_responses', 'starting_responses', 'ending_responses')
+
+
+def _aggregate_expressions():
+    expressions = {
+        'total_responses': Count('pk'),
+        'starting_responses': Count('pk', filter=Q(survey_type=1)),
+        'ending_responses': Count('pk', filter=Q(survey_type=2)),
+    }
+    expressions.update(_average_expressions(AVERAGED_FIELDS))
+    return expressions
+
+
+def _rollup_expressions():
+    expressions = {
+        'total_responses': Sum('response_count'),
+        'starting_responses': Sum('response_count', filter=Q(survey_type=1)),
+        'ending_responses': Sum('response_count', filter=Q(survey_type=2)),
+    }
+    for field in AVERAGED_FIELDS:
+        expressions[f'sum_{field}'] = Sum(f'sum_{field}')
+        expressions[f'count_{field}'] = Sum(f'count_{field}')
+    return expressions
+
+
+def field_scale(field):
+    """(lowest, highest) answer of a SurveyResponse field, from its validators."""
+    low = high = None
+    for validator in SurveyResponse._meta.get_field(field).validators:
+        if isinstance(validator, MinValueValidator):
+            low = validator.limit_value
+        elif isinstance(validator, MaxValueValidator):
+            high = validator.limit_value
+    return low, high
+
+
+def _scale_values(field):
+    low, high = field_scale(field)
+    return range(low, high + 1)
+
+
+def _average_expressions(fields):
+    expressions = {}
+    for field in fields:
+        expressions[f'sum_{field}'] = Sum(field)
+        expressions[f'count_{field}'] = Count(field)
+    return expressions
+
+
+def _distribution_expressions(fields):
+    """One conditional count per answer value, so every distribution comes from one scan."""
+    return {
+        f'answers_{field}_{value}': Count('pk', filter=Q(**{field: value}))
+        for field in fields
+        for value in _scale_values(field)
+    }
+
+
+def _summary_expressions():
+    expressions = _aggregate_expressions()
+    expressions.update(_average_expressions(SKILL_FIELDS))
+    expressions.update(_distribution_expressions(DISTRIBUTION_FIELDS))
+    return expressions
+
+
+def _average(total, count):
+    if not count:
+        return None
+    return round(total / count, 2)
+
+
+def _format_row(row):
+    """Turn one row of raw sums/counts into the dashboard stats shape."""
+    average_ratings = {}
+    rating_counts = {}
+    for field in RATING_FIELDS:
+        count = row[f'count_{field}'] or 0
+        rating_counts[field] = count
+        if count:
+            average_ratings[field] = _average(row[f'sum_{field}'], count)
+    return {
+        'total_responses': row['total_responses'] or 0,
+        'starting_responses': row['starting_responses'] or 0,
+        'ending_responses': row['ending_responses'] or 0,
+        'average_ratings': average_ratings,
+        'rating_counts': rating_counts,
+        'average_recommendation': _average(row['sum_recommend_asc'], row['count_recommend_asc']),
+        'recommendation_count': row['count_recommend_asc'] or 0,
+    }
+
+
+def _format_averages(row, fields):
+    return {field: _average(row[f'sum_{field}'], row[f'count_{field}']) for field in fields}
+
+
+def _format_distributions(row, fields):
+    return {
+        field: {value: row[f'answers_{field}_{value}'] or 0 for value in _scale_values(field)}
+        for field in fields
+    }
+
+
+def _format_summary(row):
+    stats = _format_row(row)
+    starting, ending = stats['starting_responses'], stats['ending_responses']
+    stats['completion_rate'] = round(ending / starting * 100, 2) if starting else 0
+    return {
+        'stats': stats,
+        'averages': _format_averages(row, SKILL_FIELDS),
+        'distributions': _format_distributions(row, DISTRIBUTION_FIELDS),
+    }
+
+
+def _group_key(group_by, value):
+    if group_by == 'month':
+        return value.strftime('%Y-%m') if value else None
+    return value
+
+
+def _roll_up(rows):
+    """Combine grouped rows into overall totals without another query."""
+    totals = {key: 0 for key in _COUNT_KEYS}
+    for field in AVERAGED_FIELDS:
+        totals[f'sum_{field}'] = 0
+        totals[f'count_{field}'] = 0
+    for row in rows:
+        for key in totals:
+            totals[key] += row[key] or 0
+    return totals
+
+
+def _grouped_rows(queryset, expressions, group_expressions, group_by):
+    if group_by not in group_expressions:
+        raise ValueError(f'Unsupported group_by: {group_by}')
+    return (
+        queryset.order_by()
+        .values(group=group_expressions[group_by])
+        .annotate(**expressions)
+        .order_by('group')
+    )
+
+
+def _grouped_summary(rows, group_by):
+    summary = _format_row(_roll_up(rows))
+    summary['group_by'] = group_by
+    summary['groups'] = [
+        {'key': _group_key(group_by, row['group']), **_format_row(row)}
+        for row in rows
+    ]
+    return summary
+
+
+def _summarize(queryset, expressions, group_expressions, group_by):
+    if not group_by:
+        return _format_row(queryset.aggregate(**expressions))
+    rows = list(_grouped_rows(queryset, expressions, group_expressions, group_by))
+    return _grouped_summary(rows, group_by)
+
+
+def summarize_responses(queryset, group_by=None):
+    """
+    Compute dashboard statistics for a SurveyResponse queryset in a single query.
+
+    group_by may be one of GROUP_BY_CHOICES; the result then also carries a 'groups'
+    list with the same statistics per mentor, topic or month.
+    """
+    return _summarize(queryset, _aggregate_expressions(), GROUP_BY_EXPRESSIONS, group_by)
+
+
+def summarize_rollups(queryset, group_by=None):
+    """Same as summarize_responses(), computed from a RatingRollup queryset."""
+    return _summarize(queryset, _rollup_expressions(), ROLLUP_GROUP_BY_EXPRESSIONS, group_by)
+
+
+def summarize_dashboard(queryset):
+    """
+    Statistics, Likert averages and answer distributions for a SurveyResponse queryset
+    (both survey types) in a single query.
+    """
+    return _format_summary(queryset.aggregate(**_summary_expressions()))
+
+
+def average_fields(queryset, fields=DISTRIBUTION_FIELDS):
+    """{field: average or None} for the given fields, in one query."""
+    return _format_averages(queryset.aggregate(**_average_expressions(fields)), fields)
+
+
+def _histogram_queryset(queryset, fields, group_by):
+    if group_by and group_by not in GROUP_BY_EXPRESSIONS:
+        raise ValueError(f'Unsupported group_by: {group_by}')
+    querysets = []
+    for key, field in fields.items():
+        expressions = {'histogram': Value(key, output_field=CharField()), 'value': F(field)}
+        if group_by:
+            expressions['group'] = GROUP_BY_EXPRESSIONS[group_by]
+        querysets.append(
+            queryset.order_by()
+            .filter(**{f'{field}__isnull': False})
+            .values(**expressions)
+            .annotate(count=Count('pk'))
+        )
+    first, *rest = querysets
+    return first.union(*rest, all=True)
+
+
+def _add_counts(histograms, row):
+    histogram = histograms[row['histogram']]
+    histogram[row['value']] = histogram.get(row['value'], 0) + row['count']
+
+
+def _sorted_histograms(histograms):
+    return {key: dict(sorted(counts.items())) for key, counts in histograms.items()}
+
+
+def _format_histograms(rows, fields, group_by):
+    overall = {key: {} for key in fields}
+    groups = {}
+    for row in rows:
+        _add_counts(overall, row)
+        if group_by:
+            group = _group_key(group_by, row['group'])
+            if group not in groups:
+                groups[group] = {key: {} for key in fields}
+            _add_counts(groups[group], row)
+
+    result = _sorted_histograms(overall)
+    if group_by:
+        result['group_by'] = group_by
+        result['groups'] = [
+            {'key': key, **_sorted_histograms(groups[key])}
+            for key in sorted(groups, key=lambda key: (key is None, key or ''))
+        ]
+    return result
+
+
+def histogram_responses(queryset, fields, group_by=None):
+    """
+    {key: {answer: count}} for each key -> field in `fields` (nulls skipped), from one
+    UNION ALL of GROUP BY queries. With group_by (one of GROUP_BY_CHOICES) the result
+    also has a 'groups' list of the same histograms per mentor, topic or month; the
+    overall histograms are summed from the groups.
+    """
+    return _format_histograms(_histogram_queryset(queryset, fields, group_by), fields, group_by)
+
+
+def _bucket_key(interval, value):
+    if interval == 'term':
+        return f'{value // 10}-{ACADEMIC_TERMS[value % 10 - 1][1]}'
+    if interval == 'month':
+        return value.strftime('%Y-%m')
+    return value.isoformat()
+
+
+def _moving_averages(rows, index, window):
+    span = rows[max(index - window + 1, 0):index + 1]
+    return {
+        field: _average(
+            sum(row[f'sum_{field}'] or 0 for row in span),
+            sum(row[f'count_{field}'] or 0 for row in span),
+        )
+        for field in AVERAGED_FIELDS
+    }
+
+
+def _trend(rows, interval, window):
+    buckets = []
+    for index, row in enumerate(rows):
+        bucket = {'bucket': _bucket_key(interval, row['group']), **_format_row(row)}
+        if window:
+            # Weighted by answers: sums and counts of the last `window` buckets with data
+            bucket['moving_averages'] = _moving_averages(rows, index, window)
+        buckets.append(bucket)
+    return {'interval': interval, 'window': window, 'buckets': buckets}
+
+
+def trend_responses(queryset, interval, window=None):
+    """
+    Dashboard statistics per day, week (starting Monday), month or academic term of
+    recorded_date, in one grouped query. With window=N each bucket also carries the
+    averages over the last N buckets.
+    """
+    rows = _grouped_rows(queryset, _aggregate_expressions(), TREND_EXPRESSIONS, interval)
+    return _trend(list(rows), interval, window)
+
+
+def trend_rollups(queryset, interval, window=None):
+    """Same as trend_responses(), computed from a RatingRollup queryset."""
+    rows = _grouped_rows(queryset, _rollup_expressions(), ROLLUP_TREND_EXPRESSIONS, interval)
+    return _trend(list(rows), interval, window)
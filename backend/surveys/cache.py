@@ -0,0 +1,142 @@
+"""
+Data-versioned cache for dashboard payloads.
+
+Entries are keyed on the endpoint, the normalized query parameters and the data version
+of the survey responses (conditional.survey_responses_version: row count and latest
+updated_at, read from the database). Any committed write - from this process, another
+worker, the importer CLI or the webhook drain worker - changes the version, so older
+entries are never read again and expire after DASHBOARD_CACHE_TIMEOUT; nothing is
+deleted explicitly. The conditional GET validators use the same version, so a cached
+body is always the one its ETag describes. Writes that bypass updated_at (QuerySet.update()
+or raw SQL that does not set it) are not seen; see survey_responses_version.
+
+Concurrent misses for the same key are coalesced ("single flight"): one thread
+computes, the others wait for its result. With several worker processes a shared cache
+backend (DASHBOARD_CACHE_URL) lets them share entries; a process-local cache is still
+correct, each worker just computes its own.
+"""
+
+import hashlib
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .conditional import survey_responses_version
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'dashboard'
+COUNTER_KEYS = {
+    'hits': f'{KEY_PREFIX}:counter:hits',
+    'misses': f'{KEY_PREFIX}:counter:misses',
+    'coalesced': f'{KEY_PREFIX}:counter:coalesced',
+}
+
+# Backends whose entries are not shared between processes
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _timeout():
+    return getattr(settings, 'DASHBOARD_CACHE_TIMEOUT', 3600)
+
+
+def cache_is_process_local():
+    """True when cached payloads are only visible to the process that computed them."""
+    return settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_BACKENDS
+
+
+def current_version():
+    """The data version entries are currently valid for."""
+    version, _ = survey_responses_version()
+    return version
+
+
+def _count(name):
+    key = COUNTER_KEYS[name]
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+
+def cache_counters():
+    """Hit/miss counters (shared across processes when the cache backend is)."""
+    counters = {name: cache.get(key) or 0 for name, key in COUNTER_KEYS.items()}
+    counters['data_version'] = current_version()
+    return counters
+
+
+def normalize_params(params):
+    """Sorted, non-empty query parameters, so equivalent URLs share an entry."""
+    items = []
+    for key in sorted(params.keys()):
+        values = params.getlist(key) if hasattr(params, 'getlist') else [params[key]]
+        values = [value.strip() for value in values if value is not None and str(value).strip()]
+        if values:
+            items.append((key, tuple(values)))
+    return tuple(items)
+
+
+def cache_key(endpoint, params, version=None):
+    if version is None:
+        version = current_version()
+    # The version holds a timestamp; hashing keeps keys valid for every backend
+    digest = hashlib.sha1(repr((version, normalize_params(params))).encode('utf-8')).hexdigest()
+    return f'{KEY_PREFIX}:{endpoint}:{digest}'
+
+
+def get_or_compute(endpoint, params, compute, version=None):
+    """
+    Return (payload, hit) for endpoint/params at the given data version (read from the
+    database when not given), computing and storing it on a miss.
+
+    Pass the version the response's validators were built from, so the payload and its
+    ETag always agree. The version is read before compute() runs, so a payload is never
+    stored under a version newer than the data it was computed from. compute() is only
+    cached when it returns normally; exceptions propagate to the caller and waiting
+    threads retry on their own.
+    """
+    if not getattr(settings, 'DASHBOARD_CACHE_ENABLED', True):
+        return compute(), False
+
+    key = cache_key(endpoint, params, version)
+    payload = cache.get(key)
+    if payload is not None:
+        _count('hits')
+        return payload, True
+
+    with _inflight_lock:
+        event = _inflight.get(key)
+        leader = event is None
+        if leader:
+            event = _inflight[key] = threading.Event()
+
+    if not leader:
+        event.wait(getattr(settings, 'DASHBOARD_CACHE_WAIT_SECONDS', 30))
+        payload = cache.get(key)
+        if payload is not None:
+            _count('coalesced')
+            return payload, True
+
+    try:
+        _count('misses')
+        payload = compute()
+        cache.set(key, payload, _timeout())
+        return payload, False
+    finally:
+        if leader:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+            event.set()
@@ -0,0 +1,207 @@
+"""
+Response compression negotiated from Accept-Encoding (zstd, brotli, gzip).
+
+CompressionMiddleware compresses bodies of at least COMPRESSION_MIN_SIZE bytes, and
+streaming responses (exports) chunk by chunk, flushing after each chunk so rows still
+reach the client as they are produced. Codings whose module is not installed are not
+offered; gzip (zlib) is always available.
+
+Cached dashboard payloads are stored already rendered and compressed per coding (see
+dashboard.cached_body), so repeat hits skip both rendering and compression; the
+middleware leaves responses that already carry a Content-Encoding alone.
+"""
+
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip/zstd are offered
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: only gzip/brotli are offered
+    zstandard = None
+
+# Levels favouring speed: API payloads are compressed per request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+_strong_etag_re = re.compile(r'^\s*"')
+
+
+class _Gzip:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits 31: gzip container
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+class _Zstd:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+# Content-Encoding token -> compressor class, None when its module is not installed
+CODINGS = {
+    'zstd': _Zstd if zstandard is not None else None,
+    'br': _Brotli if brotli is not None else None,
+    'gzip': _Gzip,
+}
+
+
+def available_codings():
+    """Configured codings (COMPRESSION_ENCODINGS, in server preference order) that are installed."""
+    return [
+        coding for coding in settings.COMPRESSION_ENCODINGS
+        if CODINGS.get(coding) is not None
+    ]
+
+
+def _accepted(header):
+    """{coding: q} from an Accept-Encoding header."""
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(request):
+    """The coding to use for request's response, or None for identity."""
+    if not settings.COMPRESSION_ENABLED:
+        return None
+    accepted = _accepted(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    best, best_q = None, 0.0
+    for coding in available_codings():
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        # Ties go to the server's preference order
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(coding, data):
+    """data compressed with coding, in one piece."""
+    compressor = CODINGS[coding]()
+    return compressor.compress(data) + compressor.finish()
+
+
+def compress_stream(coding, chunks):
+    """Compress an iterable of byte chunks, flushing after each one."""
+    compressor = CODINGS[coding]()
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_stream(coding, chunks):
+    """compress_stream() for an async iterable of byte chunks."""
+    compressor = CODINGS[coding]()
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def encode_body(body, coding):
+    """(body, coding actually applied): bodies under COMPRESSION_MIN_SIZE are sent as is."""
+    if coding is None or len(body) < settings.COMPRESSION_MIN_SIZE:
+        return body, None
+    return compress(coding, body), coding
+
+
+def set_content_encoding(response, coding):
+    """Mark response as encoded with coding (or not), varying on Accept-Encoding."""
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if coding is None:
+        return response
+    response['Content-Encoding'] = coding
+    # The same strong ETag must not name different bytes (RFC 9110 8.8.3)
+    etag = response.get('ETag')
+    if etag and _strong_etag_re.match(etag):
+        response['ETag'] = 'W/' + etag
+    return response
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with the best coding the client accepts, like Django's
+    GZipMiddleware but with brotli and zstd and a configurable minimum size.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+        # Vary even when not compressing: another Accept-Encoding may get different bytes
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate(request)
+        if coding is None:
+            return response
+
+        if response.streaming:
+            if getattr(response, 'is_async', False):
+                response.streaming_content = acompress_stream(coding, response.streaming_content)
+            else:
+                response.streaming_content = compress_stream(coding, response.streaming_content)
+            # Length of the compressed stream is unknown
+            del response['Content-Length']
+        else:
+            compressed = compress(coding, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+        return set_content_encoding(response, coding)
@@ -0,0 +1,129 @@
+"""
+Conditional GET (ETag / Last-Modified) for the read endpoints.
+
+Validators come from a cheap data version - two queries on the updated_at index - checked
+before any serializer or heavy query runs, so an unchanged resource costs a 304 with no body.
+The ETag also covers the query string and the Accept and Accept-Encoding headers, since
+they change the representation returned for the same data.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .models import SurveyChoice, SurveyResponse
+
+
+def survey_responses_version():
+    """
+    (version, last_modified) for the whole SurveyResponse table.
+
+    Only writes that change the row count or set updated_at change the version: save()
+    (auto_now), the importer's bulk upsert and the webhook paths all do. QuerySet.update()
+    and raw SQL do not touch updated_at by themselves; they must set it (for example
+    update(..., updated_at=timezone.now())), otherwise ETags and cached dashboards keep
+    describing the old data until the next versioned write.
+    """
+    # Separate queries: SQLite only answers a lone MAX() with an index seek, and scans
+    # when it is combined with COUNT() (the count covers deletes, which leave Max alone)
+    total = SurveyResponse.objects.count()
+    last_modified = SurveyResponse.objects.aggregate(last_modified=Max('updated_at'))['last_modified']
+    stamp = last_modified.isoformat() if last_modified else ''
+    return f'{total}:{stamp}', last_modified
+
+
+def survey_response_version(pk):
+    """(version, last_modified) for one response; (None, None) if it does not exist."""
+    last_modified = SurveyResponse.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if last_modified is None:
+        return None, None
+    return f'{pk}:{last_modified.isoformat()}', last_modified
+
+
+def survey_choices_version():
+    """SurveyChoice has no timestamps; the table is small enough to fingerprint directly."""
+    rows = SurveyChoice.objects.order_by('pk').values_list(
+        'pk', 'question_id', 'choice_value', 'choice_text', 'question_text'
+    )
+    digest = hashlib.sha1(repr(list(rows)).encode('utf-8')).hexdigest()
+    return digest, None
+
+
+def _etag(request, scope, version):
+    material = '|'.join([
+        scope,
+        version,
+        request.get_full_path(),
+        request.META.get('HTTP_ACCEPT', ''),
+        request.META.get('HTTP_ACCEPT_ENCODING', ''),
+    ])
+    return quote_etag(hashlib.sha1(material.encode('utf-8')).hexdigest())
+
+
+def _last_modified_timestamp(last_modified):
+    return int(last_modified.timestamp()) if last_modified else None
+
+
+def conditional_response(request, scope, version, last_modified):
+    """A 304/412 response when the client's validators still match, otherwise None."""
+    if version is None or request.method not in ('GET', 'HEAD'):
+        return None
+    return get_conditional_response(
+        request,
+        etag=_etag(request, scope, version),
+        last_modified=_last_modified_timestamp(last_modified),
+    )
+
+
+def set_validators(request, response, scope, version, last_modified):
+    """Attach ETag/Last-Modified to a successful response and require revalidation."""
+    if version is None or request.method not in ('GET', 'HEAD') or response.status_code != 200:
+        return response
+    response['ETag'] = _etag(request, scope, version)
+    if last_modified:
+        response['Last-Modified'] = http_date(_last_modified_timestamp(last_modified))
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_get(scope, version_func):
+    """
+    Decorator for @api_view functions (place it below @api_view so authentication and
+    permissions run before the validators are compared). The version is left on
+    request.data_version, so the view can key cached content on the same version its
+    validators are built from.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            version, last_modified = version_func()
+            not_modified = conditional_response(request, scope, version, last_modified)
+            if not_modified is not None:
+                return not_modified
+            request.data_version = version
+            response = view(request, *args, **kwargs)
+            return set_validators(request, response, scope, version, last_modified)
+        return wrapper
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET for generic views. Subclasses set conditional_scope and implement
+    get_data_version() returning (version, last_modified).
+    """
+    conditional_scope = None
+
+    def get_data_version(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        version, last_modified = self.get_data_version()
+        not_modified = conditional_response(request, self.conditional_scope, version, last_modified)
+        if not_modified is not None:
+            return not_modified
+        response = super().get(request, *args, **kwargs)
+        return set_validators(request, response, self.conditional_scope, version, last_modified)
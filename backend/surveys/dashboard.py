@@ -0,0 +1,175 @@
+"""
+Payload builders for the read-only dashboard endpoints.
+
+Each builder takes the request's query parameters and returns plain data, so the same
+computation serves the views, the response cache and cache prewarming.
+"""
+
+import logging
+
+from rest_framework.renderers import JSONRenderer
+
+from .aggregation import (
+    AVERAGED_FIELDS,
+    average_fields,
+    histogram_responses,
+    summarize_dashboard,
+    summarize_responses,
+    summarize_rollups,
+    trend_responses,
+    trend_rollups,
+)
+from .cache import current_version, get_or_compute
+from .compression import encode_body
+from .facets import facet_counts
+from .filters import apply_filters, apply_rollup_filters, rollups_cover_filters
+from .models import RatingRollup, SurveyResponse
+
+logger = logging.getLogger(__name__)
+
+# Survey analytics key -> field listed for every ending survey that answered it
+ANALYTICS_FIELDS = {
+    'topics_ending': 'topics_worked_on',  # Topic analysis
+    'confidence_levels': 'confidence_job_placement',  # Confidence analysis (Q3.11)
+    'hard_skills_improvement': 'hard_skills_improved',  # Skills improvement analysis
+    'soft_skills_improvement': 'soft_skills_improved',
+}
+
+# ?mode=histogram: {answer: count} per analytics key, plus every rating and the recommendation
+HISTOGRAM_FIELDS = {**ANALYTICS_FIELDS, **{field: field for field in AVERAGED_FIELDS}}
+
+ANALYTICS_MODES = ('lists', 'histogram')
+
+# Filter dropdown key -> facet whose values are offered
+AVAILABLE_DATA_FACETS = {
+    'mentors': 'mentor',
+    'projects': 'project',
+    'topics': 'topic',
+}
+
+
+def _stats_source(params):
+    """(queryset, is_rollup) for the stats query - only ending surveys."""
+    # Served from the rollup table unless a filter needs the raw responses
+    if rollups_cover_filters(params):
+        return apply_rollup_filters(RatingRollup.objects.filter(survey_type=2), params), True
+    return apply_filters(SurveyResponse.objects.filter(survey_type=2), params), False
+
+
+def _finish_stats(stats):
+    for group in stats.get('groups', []):
+        group['completion_rate'] = 100
+    stats['completion_rate'] = 100  # Since we're only showing ending surveys, completion rate is 100%
+    return stats
+
+
+def build_dashboard_stats(params):
+    group_by = params.get('group_by') or None
+    # Counts, averages and non-null counts in one query
+    queryset, is_rollup = _stats_source(params)
+    summarize = summarize_rollups if is_rollup else summarize_responses
+    return _finish_stats(summarize(queryset, group_by=group_by))
+
+
+def _trend_args(params):
+    # Validated by the view; prewarming and direct callers get the defaults
+    interval = params.get('interval') or 'week'
+    window = int(params.get('window') or 0) or None
+    return interval, window
+
+
+def build_trends(params):
+    queryset, is_rollup = _stats_source(params)
+    trend = trend_rollups if is_rollup else trend_responses
+    return trend(queryset, *_trend_args(params))
+
+
+def _analytics_source(params):
+    # Apply filters - only ending surveys
+    return apply_filters(SurveyResponse.objects.filter(survey_type=2), params)
+
+
+def _analytics_querysets(params):
+    queryset = _analytics_source(params)
+    return {
+        key: queryset.filter(**{f'{field}__isnull': False}).values_list(field, flat=True)
+        for key, field in ANALYTICS_FIELDS.items()
+    }
+
+
+def build_survey_analytics(params):
+    if params.get('mode') == 'histogram':
+        return histogram_responses(
+            _analytics_source(params), HISTOGRAM_FIELDS, group_by=params.get('group_by') or None
+        )
+    return {key: list(queryset) for key, queryset in _analytics_querysets(params).items()}
+
+
+def _available_data(facets):
+    return {
+        key: [item['value'] for item in facets[facet]]
+        for key, facet in AVAILABLE_DATA_FACETS.items()
+    }
+
+
+def build_available_data(params):
+    # All survey responses (both starting and ending); each list honours the other filters
+    return _available_data(facet_counts(params))
+
+
+def build_facets(params):
+    return facet_counts(params)
+
+
+def build_dashboard_summary(params):
+    """
+    Everything the dashboard page shows for a filter selection: statistics over both
+    survey types, Likert averages, answer distributions, unfiltered averages for
+    comparison, and drill-down facet counts for the filter dropdowns.
+    """
+    queryset = apply_filters(SurveyResponse.objects.all(), params)
+    summary = summarize_dashboard(queryset)
+    summary['overall'] = average_fields(SurveyResponse.objects.all())
+    summary['facets'] = facet_counts(params)
+    return summary
+
+
+# Cache endpoint name -> payload builder
+DASHBOARD_ENDPOINTS = {
+    'dashboard_stats': build_dashboard_stats,
+    'survey_analytics': build_survey_analytics,
+    'available_data': build_available_data,
+    'dashboard_summary': build_dashboard_summary,
+    'facets': build_facets,
+    'trends': build_trends,
+}
+
+
+def cached_payload(endpoint, params, version=None):
+    """(payload, hit) for a dashboard endpoint, through the data-versioned cache."""
+    builder = DASHBOARD_ENDPOINTS[endpoint]
+    return get_or_compute(endpoint, params, lambda: builder(params), version)
+
+
+def cached_body(endpoint, params, coding=None, version=None):
+    """
+    ((body, applied coding), hit): the payload rendered as JSON and compressed with coding
+    (see compression.encode_body), cached per coding so hits skip rendering and compression.
+    """
+    if version is None:
+        version = current_version()
+
+    def compute():
+        payload, _ = cached_payload(endpoint, params, version)
+        return encode_body(JSONRenderer().render(payload), coding)
+    return get_or_compute(f'{endpoint}.{coding or "identity"}', params, compute, version)
+
+
+def prewarm_dashboard_cache():
+    """Compute the default (unfiltered) dashboard views for the current data version."""
+    version = current_version()
+    for endpoint in DASHBOARD_ENDPOINTS:
+        try:
+            cached_payload(endpoint, {}, version)
+        except Exception:
+            logger.exception('Prewarming %s failed', endpoint)
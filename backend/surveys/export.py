@@ -0,0 +1,62 @@
+"""
+Export of filtered survey responses.
+
+Rows come straight from values_list() through a server-side iterator, so no model
+instances or serializers are built and memory stays flat regardless of the row count.
+"""
+
+from rest_framework.exceptions import ValidationError
+
+from .filters import apply_filters
+from .models import SurveyResponse
+
+# Rows fetched from the database cursor at a time
+EXPORT_CHUNK_SIZE = 2000
+# Rendered rows are joined into pieces of about this many characters before being sent
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+EXPORT_COLUMNS = [field.name for field in SurveyResponse._meta.concrete_fields]
+
+
+def parse_columns(value):
+    """Columns from a comma-separated ?columns= value (all columns when empty)."""
+    if not value:
+        return list(EXPORT_COLUMNS)
+    columns = [column.strip() for column in value.split(',') if column.strip()]
+    unknown = [column for column in columns if column not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValidationError({'columns': f'Unknown columns: {", ".join(unknown)}'})
+    return list(dict.fromkeys(columns))
+
+
+def export_rows(filters, columns, chunk_size=EXPORT_CHUNK_SIZE):
+    """Value tuples for the filtered responses, oldest first."""
+    queryset = apply_filters(SurveyResponse.objects.all(), filters)
+    return (
+        queryset.order_by('recorded_date', 'id')
+        .values_list(*columns)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def buffered(parts, size=EXPORT_BUFFER_SIZE):
+    """
+    Join small rendered parts into larger pieces (one socket write per piece rather than
+    per row). The first part is passed through alone so headers go out immediately.
+    """
+    parts = iter(parts)
+    first = next(parts, None)
+    if first is None:
+        return
+    yield first
+    pending = []
+    pending_size = 0
+    for part in parts:
+        pending.append(part)
+        pending_size += len(part)
+        if pending_size >= size:
+            yield ''.join(pending)
+            pending = []
+            pending_size = 0
+    if pending:
+        yield ''.join(pending)
@@ -0,0 +1,68 @@
+"""
+Drill-down facet counts for the dashboard filters.
+
+Each dimension (mentor, topic, project, month) is counted with every active filter
+applied except its own, so a dropdown lists the values the other filters leave and how
+many responses picking each one would give, and the current selection can be changed
+without clearing it first. The per-dimension GROUP BY queries are combined with
+UNION ALL, so the whole facet set costs one statement.
+"""
+
+from django.db.models import CharField, Count, DateField, F, Value
+from django.db.models.functions import Cast, TruncMonth
+
+from .filters import apply_filters
+from .models import SurveyResponse
+
+# Facet name -> (grouped expression, query parameters of its own filter)
+FACET_DIMENSIONS = {
+    'mentor': (F('project_mentor'), ('mentor', 'mentorMatch')),
+    'topic': (F('topic'), ('topic', 'topicMatch')),
+    'project': (F('project_title'), ('projectName',)),
+    # Text so all branches of the UNION share a column type; 'YYYY-MM-01' on every backend
+    'month': (
+        Cast(TruncMonth('recorded_date', output_field=DateField()), output_field=CharField()),
+        ('startDate', 'endDate'),
+    ),
+}
+
+
+def _without(params, names):
+    params = params.copy()
+    for name in names:
+        params.pop(name, None)
+    return params
+
+
+def facet_queryset(params):
+    """One UNION ALL query yielding {'facet', 'value', 'count'} rows for every dimension."""
+    querysets = []
+    for name, (expression, own_params) in FACET_DIMENSIONS.items():
+        queryset = apply_filters(SurveyResponse.objects.all(), _without(params, own_params))
+        querysets.append(
+            queryset.order_by()
+            .annotate(facet=Value(name, output_field=CharField()), value=expression)
+            .values('facet', 'value')
+            .annotate(count=Count('pk'))
+        )
+    first, *rest = querysets
+    return first.union(*rest, all=True)
+
+
+def format_facets(rows):
+    """{facet: [{'value', 'count'}, ...]} sorted by value; blank values are dropped."""
+    facets = {name: [] for name in FACET_DIMENSIONS}
+    for row in rows:
+        value = row['value']
+        if not value:
+            continue
+        if row['facet'] == 'month':
+            value = value[:7]
+        facets[row['facet']].append({'value': value, 'count': row['count']})
+    for items in facets.values():
+        items.sort(key=lambda item: item['value'])
+    return facets
+
+
+def facet_counts(params):
+    return format_facets(facet_queryset(params))
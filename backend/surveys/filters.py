@@ -0,0 +1,100 @@
+"""
+Query-string filters shared by the dashboard endpoints.
+
+Filters are written to be index friendly: date filters become half-open ranges on the
+raw recorded_date column (no __date transform), and mentor/topic accept an exact-match
+mode (mentorMatch=exact, topicMatch=exact) for values picked from the dropdowns.
+Substring matching (the default, kept for typed searches) cannot use an index and scans
+the rows left by the other filters. check_query_plans verifies the exact-match and date
+combinations against the indexes on SurveyResponse and RatingRollup.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+EXACT_MATCH = 'exact'
+
+# Query parameter -> (SurveyResponse / RatingRollup field, match-mode parameter)
+TEXT_FILTERS = {
+    'mentor': ('project_mentor', 'mentorMatch'),
+    'topic': ('topic', 'topicMatch'),
+}
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def date_range(filters):
+    """
+    (start_date, end_date) from startDate/endDate, either of which may be None.
+
+    end_date is inclusive, as the dashboard date picker sends it.
+    """
+    start = _parse_date(filters.get('startDate')) if filters.get('startDate') else None
+    end = _parse_date(filters.get('endDate')) if filters.get('endDate') else None
+    return start, end
+
+
+def _day_start(day):
+    """Midnight at the start of day in the configured time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def _text_lookup(filters, name):
+    field, mode_param = TEXT_FILTERS[name]
+    if filters.get(mode_param) == EXACT_MATCH:
+        return {field: filters[name]}
+    return {f'{field}__icontains': filters[name]}
+
+
+def apply_filters(queryset, filters):
+    """Apply filters to the queryset based on request parameters"""
+    if filters.get('mentor'):
+        # Filter by mentor using project_mentor field
+        queryset = queryset.filter(**_text_lookup(filters, 'mentor'))
+
+    if filters.get('topic'):
+        # Filter by topic using topic field
+        queryset = queryset.filter(**_text_lookup(filters, 'topic'))
+
+    if filters.get('projectName'):
+        queryset = queryset.filter(project_title__icontains=filters['projectName'])
+
+    # Whole days in the configured time zone: [start 00:00, day after end 00:00)
+    start_date, end_date = date_range(filters)
+    if start_date:
+        queryset = queryset.filter(recorded_date__gte=_day_start(start_date))
+
+    if end_date:
+        queryset = queryset.filter(recorded_date__lt=_day_start(end_date + timedelta(days=1)))
+
+    return queryset
+
+
+def rollups_cover_filters(filters):
+    """Whether the filters only touch rollup dimensions (project titles are not rolled up)."""
+    return getattr(settings, 'DASHBOARD_USE_ROLLUPS', True) and not filters.get('projectName')
+
+
+def apply_rollup_filters(queryset, filters):
+    """apply_filters() for RatingRollup querysets; keep the two in step"""
+    if filters.get('mentor'):
+        queryset = queryset.filter(**_text_lookup(filters, 'mentor'))
+
+    if filters.get('topic'):
+        queryset = queryset.filter(**_text_lookup(filters, 'topic'))
+
+    start_date, end_date = date_range(filters)
+    if start_date:
+        queryset = queryset.filter(day__gte=start_date)
+
+    if end_date:
+        queryset = queryset.filter(day__lte=end_date)
+
+    return queryset
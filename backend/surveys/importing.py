@@ -0,0 +1,355 @@
+"""
+Vectorized Qualtrics CSV import engine.
+
+Maps a Qualtrics export DataFrame to SurveyResponse column values with whole-column
+pandas operations, then upserts the result in batches with
+bulk_create(update_conflicts=True) instead of one update_or_create per row.
+
+Files are read in fixed-size chunks and each chunk is mapped and committed before the
+next is read, so peak memory depends on the chunk size rather than the file size.
+"""
+
+import time
+
+import pandas as pd
+from django.db import transaction
+from django.utils import timezone
+
+from .mapping import (
+    AGREEMENT,
+    BOOLEAN,
+    DATETIME,
+    FIELDS,
+    FLOAT,
+    INTEGER,
+    RATING,
+    SCALE,
+    TEXT,
+    agreement_code,
+    csv_columns,
+    rating_code,
+    scale_code,
+    survey_type_code,
+    topic_name,
+)
+from .models import SurveyResponse
+from .rollups import refresh_rollup_days, rollup_day
+
+DEFAULT_BATCH_SIZE = 500
+# Rows read from the CSV (and mapped) at a time
+DEFAULT_CHUNK_SIZE = 5000
+
+# Qualtrics exports have two rows under the header: question labels and ImportId JSON
+QUALTRICS_LABEL_ROWS = [1, 2]
+
+# What Python's int() accepts for the values found in a Qualtrics numeric export
+_INT_PATTERN = r'\s*[+-]?\d+\s*'
+_DIGITS_PATTERN = r'\d+'
+
+# Columns read outside FIELDS (survey type, mentor and topic)
+EXTRA_COLUMNS = {'ResponseId', 'Q1.1', 'Q2.3', 'Q2.3.a', 'Q3.3', 'Q3.3.a', 'Q2.6', 'Q3.8'}
+
+# Columns that must exist in the export
+REQUIRED_COLUMNS = sorted(csv_columns() | EXTRA_COLUMNS)
+
+# Integer fields without a usable default: a row missing one is an error
+REQUIRED_FIELDS = [
+    spec.field for spec in FIELDS
+    if spec.kind == INTEGER and not SurveyResponse._meta.get_field(spec.field).null
+]
+
+DATETIME_FIELDS = [spec.field for spec in FIELDS if spec.kind == DATETIME]
+
+# Fields rewritten when a response_id already exists (generated columns follow their sources)
+UPDATE_FIELDS = [
+    field.name for field in SurveyResponse._meta.concrete_fields
+    if not field.primary_key and not field.generated and field.name not in ('response_id', 'created_at')
+]
+
+
+def read_qualtrics_csv_chunks(csv_file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Iterate over a Qualtrics export in DataFrames of chunk_size rows.
+
+    The label and ImportId rows are skipped as records (they may contain quoted
+    newlines), and the index counts data rows from 0 across chunks.
+    """
+    return pd.read_csv(csv_file, dtype=str, skiprows=QUALTRICS_LABEL_ROWS, chunksize=chunk_size)
+
+
+class _RowErrors:
+    """First error message per row, accumulated column by column."""
+
+    def __init__(self, index):
+        self.messages = pd.Series('', index=index, dtype=object)
+
+    def add(self, mask, message):
+        self.messages[mask & (self.messages == '')] = message
+
+    @property
+    def mask(self):
+        return self.messages != ''
+
+
+def _int_column(raw, errors, label):
+    """Vectorized int(value) for non-missing values; unparseable values are row errors."""
+    present = raw.notna()
+    text = raw.where(present).astype(object).str.strip()
+    valid = text.str.fullmatch(_INT_PATTERN).fillna(False).astype(bool)
+    errors.add(present & ~valid, f'invalid integer for {label}')
+    return pd.to_numeric(text.where(valid), errors='coerce').astype('Int64')
+
+
+def _float_column(raw, errors, label):
+    present = raw.notna()
+    values = pd.to_numeric(raw.where(present).astype(object).str.strip(), errors='coerce')
+    errors.add(present & values.isna(), f'invalid number for {label}')
+    return values
+
+
+def _datetime_column(raw, errors, label):
+    """Parse with one inferred format, falling back to per-value parsing for stragglers."""
+    values = pd.to_datetime(raw, errors='coerce')
+    stragglers = raw.notna() & values.isna()
+    if stragglers.any():
+        values[stragglers] = raw[stragglers].map(lambda value: pd.to_datetime(value, errors='coerce'))
+    errors.add(values.isna(), f'invalid date for {label}')
+    if getattr(values.dt, 'tz', None) is None:
+        # Same result as Django making naive datetimes aware on save, without the warnings
+        values = values.dt.tz_localize(timezone.get_default_timezone(), ambiguous='NaT', nonexistent='NaT')
+    return values
+
+
+def _text_column(raw, errors=None, label=None):
+    return raw.where(raw.notna(), '')
+
+
+def _lookup_column(raw, convert, errors=None, label=None):
+    """
+    Apply a cached scalar converter once per distinct value rather than once per row.
+
+    Missing values map to missing; with errors, values the converter rejects are row
+    errors.
+    """
+    present = raw.notna()
+    uniques = raw[present].unique()
+    values = raw.map(dict(zip(uniques, map(convert, uniques))))
+    if errors is not None:
+        errors.add(present & values.isna(), f'invalid value for {label}')
+    return values
+
+
+def _agreement_column(raw, errors, label):
+    return _lookup_column(raw, agreement_code, errors, label).astype('Int64')
+
+
+def _rating_column(raw, errors, label):
+    return _lookup_column(raw, rating_code, errors, label).astype('Int64')
+
+
+def _scale_column(raw, errors, label):
+    return _lookup_column(raw, scale_code, errors, label).astype('Int64')
+
+
+def _boolean_column(raw, errors, label):
+    """0/1 flag; missing stays missing (callers fill non-nullable fields)."""
+    return (_int_column(raw, errors, label) != 0).astype('boolean')
+
+
+# Whole-column equivalent of each mapping.SCALAR_CONVERTERS entry
+COLUMN_CONVERTERS = {
+    TEXT: _text_column,
+    INTEGER: _int_column,
+    FLOAT: _float_column,
+    BOOLEAN: _boolean_column,
+    DATETIME: _datetime_column,
+    AGREEMENT: _agreement_column,
+    RATING: _rating_column,
+    SCALE: _scale_column,
+}
+
+
+def _source_column(df, csv, is_starting, is_ending):
+    """The raw column for a FieldSpec, picking per row for (starting, ending) pairs."""
+    if not isinstance(csv, tuple):
+        return df[csv]
+    starting, ending = csv
+    ending_values = df[ending].where(is_ending) if ending else pd.Series(pd.NA, index=df.index, dtype=object)
+    return df[starting].where(is_starting, ending_values)
+
+
+def map_survey_frame(df):
+    """
+    Map a Qualtrics export DataFrame to SurveyResponse field values.
+
+    Returns (records, errors): records is a DataFrame of model field values indexed like
+    df (valid rows only); errors is a list of (row index, message) for rows that could
+    not be mapped. Rows without Q1.1 are dropped silently.
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f'CSV is missing columns: {", ".join(missing)}')
+
+    df = df[df['Q1.1'].notna()]
+    errors = _RowErrors(df.index)
+    out = pd.DataFrame(index=df.index)
+
+    survey_type = _lookup_column(df['Q1.1'], survey_type_code, errors, 'Q1.1').astype('Int64')
+    is_starting = (survey_type == 1).fillna(False).astype(bool)
+    is_ending = (survey_type == 2).fillna(False).astype(bool)
+
+    for spec in FIELDS:
+        if spec.csv is None:
+            continue
+        label = '/'.join(column for column in spec.csv if column) if isinstance(spec.csv, tuple) else spec.csv
+        raw = _source_column(df, spec.csv, is_starting, is_ending)
+        out[spec.field] = COLUMN_CONVERTERS[spec.kind](raw, errors, label)
+    for field in REQUIRED_FIELDS:
+        errors.add(out[field].isna(), f'missing value for {field}')
+    out['finished'] = out['finished'].fillna(False).astype(bool)
+
+    # CharField coercion as on save(): a missing value is stored as 'nan'
+    out['response_id'] = df['ResponseId'].astype(object).astype(str)
+    out['survey_type'] = survey_type
+
+    mentor_raw = df['Q2.3'].where(is_starting, df['Q3.3'])
+    mentor_is_digits = mentor_raw.astype(object).str.fullmatch(_DIGITS_PATTERN).fillna(False).astype(bool)
+    errors.add(mentor_raw.notna() & ~mentor_is_digits, 'invalid integer for mentor choice')
+    out['mentor_choice'] = pd.to_numeric(mentor_raw.where(mentor_is_digits), errors='coerce').astype('Int64')
+    mentor_name = _text_column(df['Q2.3.a'].where(is_starting, df['Q3.3.a']))
+    out['mentor_name'] = mentor_name
+    # Coded mentor choices cannot be resolved without the choice file, so the free-text
+    # name is used (SurveyResponse.save() applies the same fallback)
+    out['project_mentor'] = mentor_name
+
+    topic_raw = df['Q2.6'].where(is_starting, df['Q3.8'])
+    out['topic'] = _lookup_column(topic_raw, topic_name).where(topic_raw.notna(), '')
+
+    bad = errors.mask
+    row_errors = list(errors.messages[bad].items())
+    return out[~bad], row_errors
+
+
+def _records_to_instances(records):
+    """Build unsaved SurveyResponse instances from mapped records."""
+    columns = list(records.columns)
+    as_object = records.astype(object).where(records.notna(), None)
+    for field in DATETIME_FIELDS:
+        as_object[field] = list(records[field].dt.to_pydatetime())
+    return [SurveyResponse(**dict(zip(columns, row))) for row in as_object.itertuples(index=False, name=None)]
+
+
+def upsert_responses(records, batch_size=DEFAULT_BATCH_SIZE, touched_days=None):
+    """
+    Insert or update mapped records in batches keyed on response_id.
+
+    Each batch prefetches existing response_ids with one IN query (to tell creates from
+    updates) and writes with a single bulk_create(update_conflicts=True) in its own
+    transaction. If a batch is rejected by the database, its rows are retried one at a
+    time so a single bad row does not discard the rest. bulk_create bypasses save()
+    signals, so the rating rollups of every touched day are refreshed once at the end -
+    unless a touched_days set is passed, in which case the days are added to it and the
+    refresh is left to the caller.
+
+    Returns (created, updated, errors) where errors is a list of (row index, message).
+    """
+    # Later duplicates of a response_id win, as with sequential update_or_create
+    records = records[~records['response_id'].duplicated(keep='last')]
+
+    created = updated = 0
+    errors = []
+    deferred = touched_days is not None
+    if not deferred:
+        touched_days = set()
+    for start in range(0, len(records), batch_size):
+        batch = records.iloc[start:start + batch_size]
+        instances = _records_to_instances(batch)
+        existing = dict(
+            SurveyResponse.objects.filter(response_id__in=list(batch['response_id']))
+            .values_list('response_id', 'recorded_date')
+        )
+        touched_days.update(rollup_day(value) for value in existing.values())
+        touched_days.update(rollup_day(instance.recorded_date) for instance in instances)
+        try:
+            with transaction.atomic():
+                SurveyResponse.objects.bulk_create(
+                    instances,
+                    update_conflicts=True,
+                    unique_fields=['response_id'],
+                    update_fields=UPDATE_FIELDS,
+                )
+        except Exception:
+            for index, instance in zip(batch.index, instances):
+                try:
+                    with transaction.atomic():
+                        SurveyResponse.objects.bulk_create(
+                            [instance],
+                            update_conflicts=True,
+                            unique_fields=['response_id'],
+                            update_fields=UPDATE_FIELDS,
+                        )
+                except Exception as e:
+                    errors.append((index, str(e)))
+                    continue
+                if instance.response_id in existing:
+                    updated += 1
+                else:
+                    created += 1
+        else:
+            updated += len(existing)
+            created += len(instances) - len(existing)
+    if not deferred:
+        refresh_rollup_days(touched_days)
+    return created, updated, errors
+
+
+def import_survey_chunks(chunks, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Map and upsert an iterable of Qualtrics export DataFrames, one chunk at a time.
+
+    Each chunk is committed (in batch_size transactions) before the next is processed,
+    so an interrupted import keeps the chunks already done and can simply be re-run.
+    Rollups of the touched days are refreshed once at the end, also when the import
+    fails part way (a chunk usually spans most days, so refreshing per chunk would
+    re-aggregate the same days over and over).
+
+    Returns a dict with row/chunk counts, created/updated counts, per-row errors (CSV
+    row numbers), elapsed seconds and rows per second.
+    """
+    started = time.perf_counter()
+    rows = created = updated = chunk_count = 0
+    errors = []
+    touched_days = set()
+    try:
+        for chunk in chunks:
+            records, map_errors = map_survey_frame(chunk)
+            chunk_created, chunk_updated, write_errors = upsert_responses(
+                records, batch_size=batch_size, touched_days=touched_days,
+            )
+            rows += len(chunk)
+            created += chunk_created
+            updated += chunk_updated
+            chunk_count += 1
+            # +3: the header row and the two Qualtrics label rows precede the data
+            errors.extend((index + 3, message) for index, message in map_errors + write_errors)
+    finally:
+        refresh_rollup_days(touched_days)
+    elapsed = time.perf_counter() - started
+    return {
+        'rows': rows,
+        'chunks': chunk_count,
+        'created': created,
+        'updated': updated,
+        'errors': sorted(errors),
+        'elapsed': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def import_survey_csv(csv_file, chunk_size=DEFAULT_CHUNK_SIZE, batch_size=DEFAULT_BATCH_SIZE):
+    """Import a Qualtrics export (path or file object); see import_survey_chunks()."""
+    return import_survey_chunks(
+        read_qualtrics_csv_chunks(csv_file, chunk_size=chunk_size),
+        batch_size=batch_size,
+    )
+
@@ -0,0 +1,137 @@
+"""
+Durable inbox for Qualtrics webhook deliveries.
+
+The webhook view only appends the raw payload to WebhookInboxEntry and answers 202, so
+a delivery costs one small INSERT instead of mapping and upserting the response.
+drain_inbox() (run by the drain_webhook_inbox command) maps pending entries and upserts
+them, one transaction per batch so a burst of deliveries costs one commit rather than one
+each.
+
+The inbox lives in the same SQLite file, so that INSERT still takes the database write
+lock (at BEGIN, with transaction_mode=IMMEDIATE). While an import or a drain batch holds
+the lock, an enqueue waits for that transaction to commit, for at most the SQLite
+busy_timeout (SQLITE_BUSY_TIMEOUT_MS). If the wait runs out, the view answers 503 and
+Qualtrics retries the delivery. Imports commit every batch_size rows, which keeps the
+wait short.
+
+Processing is idempotent: responses are upserted on response_id and an entry's status
+is written in the same transaction as its response, so re-running a batch after a crash
+cannot double-apply it. Payloads that cannot be mapped are dead-lettered straight away
+(retrying would not change the outcome); database errors are retried with exponential
+backoff (next_attempt_at) until max_attempts and then dead-lettered, so a failing entry
+does not come back on every pass.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import WebhookInboxEntry
+from .rollups import deferred_rollup_refresh
+from .webhook import map_webhook_payload, upsert_webhook_response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 5
+# Delay before the first retry of a failed write; doubled per attempt up to the maximum
+DEFAULT_RETRY_DELAY = 30
+MAX_RETRY_DELAY = 3600
+
+STATUS_FIELDS = ['status', 'attempts', 'last_error', 'response_id', 'processed_at', 'next_attempt_at']
+
+
+def enqueue_payload(payload):
+    """Append a webhook payload to the inbox; returns the new entry."""
+    return WebhookInboxEntry.objects.create(payload=payload)
+
+
+def retry_delay(attempts, base=DEFAULT_RETRY_DELAY):
+    """Seconds to wait after the given number of failed attempts."""
+    return min(base * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+
+
+def _process_entry(entry, now, max_attempts, base_delay):
+    """Map and upsert one entry, updating its status fields in place; returns the outcome."""
+    entry.attempts += 1
+    entry.next_attempt_at = None
+    try:
+        survey_type, response_data = map_webhook_payload(entry.payload, current_time=entry.received_at)
+    except Exception as e:
+        entry.status = WebhookInboxEntry.STATUS_DEAD
+        entry.last_error = f'Mapping failed: {e}'
+        return 'dead'
+
+    if response_data is None:
+        entry.status = WebhookInboxEntry.STATUS_SKIPPED
+        entry.last_error = f'Survey type {survey_type} - only ending surveys are stored'
+        entry.processed_at = now
+        return 'skipped'
+
+    try:
+        # Savepoint: a failed write must not abort the rest of the batch
+        with transaction.atomic():
+            response_obj, created = upsert_webhook_response(response_data)
+    except Exception as e:
+        entry.last_error = str(e)
+        if entry.attempts >= max_attempts:
+            entry.status = WebhookInboxEntry.STATUS_DEAD
+            return 'dead'
+        entry.next_attempt_at = now + timedelta(seconds=retry_delay(entry.attempts, base_delay))
+        return 'retry'
+
+    entry.status = WebhookInboxEntry.STATUS_PROCESSED
+    entry.last_error = ''
+    entry.response_id = response_obj.response_id
+    entry.processed_at = now
+    return 'created' if created else 'updated'
+
+
+def drain_inbox(batch_size=DEFAULT_BATCH_SIZE, max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY):
+    """
+    Process one batch of pending entries that are due, oldest first. An entry whose
+    write failed waits retry_delay seconds before its second attempt, doubling per
+    attempt (up to MAX_RETRY_DELAY).
+
+    Returns counts per outcome: created, updated, skipped, retry and dead. An empty
+    result (all zero) means the inbox had nothing due.
+    """
+    counts = dict.fromkeys(['created', 'updated', 'skipped', 'retry', 'dead'], 0)
+    now = timezone.now()
+    entries = list(
+        WebhookInboxEntry.objects.filter(status=WebhookInboxEntry.STATUS_PENDING)
+        .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
+        .order_by('id')[:batch_size]
+    )
+    if not entries:
+        return counts
+
+    with transaction.atomic(), deferred_rollup_refresh():
+        for entry in entries:
+            outcome = _process_entry(entry, now, max_attempts, retry_delay)
+            counts[outcome] += 1
+            if outcome == 'dead':
+                logger.warning('Webhook inbox entry %s dead-lettered: %s', entry.pk, entry.last_error)
+        WebhookInboxEntry.objects.bulk_update(entries, STATUS_FIELDS)
+
+    logger.info('Webhook inbox batch: %s', counts)
+    return counts
+
+
+def requeue_dead_entries():
+    """Move dead-lettered entries back to pending with a fresh retry budget; returns the count."""
+    return WebhookInboxEntry.objects.filter(status=WebhookInboxEntry.STATUS_DEAD).update(
+        status=WebhookInboxEntry.STATUS_PENDING, attempts=0, last_error='', next_attempt_at=None,
+    )
+
+
+def inbox_counts():
+    """Number of entries per status."""
+    counts = dict.fromkeys([value for value, _ in WebhookInboxEntry.STATUS_CHOICES], 0)
+    for row in WebhookInboxEntry.objects.order_by().values('status').annotate(total=Count('pk')):
+        counts[row['status']] = row['total']
+    return counts
+
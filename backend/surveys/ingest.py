@@ -0,0 +1,186 @@
+"""
+Batch ingestion of webhook-shaped Qualtrics payloads.
+
+The body is either a JSON array of payloads or NDJSON (one payload per line). It is
+parsed incrementally from the request stream, so only the current read buffer and one
+payload are held in memory, and payloads are mapped with the same rules as the webhook
+and upserted in chunked transactions. Results are produced per payload as each chunk
+commits, so they can be streamed back while the rest of the body is still being read.
+"""
+
+import codecs
+import json
+import re
+from itertools import islice
+
+from django.db import DatabaseError, transaction
+
+from .rollups import deferred_rollup_refresh
+from .webhook import map_webhook_payload, upsert_webhook_response
+
+DEFAULT_CHUNK_SIZE = 200
+READ_SIZE = 64 * 1024
+# A single payload larger than this is rejected rather than buffered
+MAX_ITEM_SIZE = 1024 * 1024
+
+RESULT_STATUSES = ['created', 'updated', 'skipped', 'error']
+
+_NON_WHITESPACE = re.compile(r'\S')
+_DECODER = json.JSONDecoder()
+
+
+class _JsonStream:
+    """Text buffer over a binary stream, refilled on demand."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = stream is None
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.stream.read(READ_SIZE)
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        if not chunk:
+            self.eof = True
+            self.buffer += self.decoder.decode(b'', final=True)
+            return False
+        self.buffer += self.decoder.decode(chunk)
+        if len(self.buffer) > MAX_ITEM_SIZE + READ_SIZE:
+            raise ValueError(f'Payload larger than {MAX_ITEM_SIZE} bytes')
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ('' at the end of the body)."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return ''
+
+    def advance(self):
+        self.pos += 1
+
+    def decode_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value ending exactly at the buffer edge may continue in the next read
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def readline(self):
+        """Next line without its newline, or None at the end of the body."""
+        while True:
+            newline = self.buffer.find('\n', self.pos)
+            if newline >= 0:
+                line = self.buffer[self.pos:newline]
+                self.pos = newline + 1
+                return line
+            if not self._fill():
+                line = self.buffer[self.pos:]
+                self.pos = len(self.buffer)
+                return line or None
+
+
+def iter_payloads(stream):
+    """
+    Yield (index, payload, error) for each payload in a JSON array or NDJSON body.
+
+    A malformed NDJSON line is reported and skipped; a malformed array ends the body,
+    since nothing after the error can be located reliably.
+    """
+    reader = _JsonStream(stream)
+    index = 0
+    try:
+        if reader.peek() == '[':
+            reader.advance()
+            if reader.peek() == ']':
+                return
+            while True:
+                yield index, reader.decode_value(), None
+                index += 1
+                separator = reader.peek()
+                reader.advance()
+                if separator == ']':
+                    return
+                if separator != ',':
+                    raise ValueError(f'Expected "," or "]" after item {index - 1}')
+
+        while (line := reader.readline()) is not None:
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except ValueError as e:
+                yield index, None, f'Invalid JSON: {e}'
+            else:
+                yield index, payload, None
+            index += 1
+    except ValueError as e:
+        yield index, None, f'Invalid JSON: {e}'
+
+
+def _ingest_one(index, payload, error, current_time):
+    if error is not None:
+        return {'index': index, 'status': 'error', 'error': error}
+    try:
+        survey_type, response_data = map_webhook_payload(payload, current_time=current_time)
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'error': f'Mapping failed: {e}'}
+    if response_data is None:
+        return {'index': index, 'status': 'skipped', 'survey_type': survey_type}
+    try:
+        # Savepoint: a failed write must not abort the rest of the chunk
+        with transaction.atomic():
+            response_obj, created = upsert_webhook_response(response_data)
+    except Exception as e:
+        return {'index': index, 'status': 'error', 'response_id': response_data['response_id'], 'error': str(e)}
+    return {'index': index, 'status': 'created' if created else 'updated', 'response_id': response_obj.response_id}
+
+
+def ingest_payloads(items, chunk_size=DEFAULT_CHUNK_SIZE, current_time=None):
+    """
+    Map and upsert (index, payload, error) items, one transaction per chunk.
+
+    Yields one result dict per item (index, status and response_id or error), a chunk
+    at a time once its transaction has committed.
+    """
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        results = []
+        try:
+            with transaction.atomic(), deferred_rollup_refresh():
+                for index, payload, error in chunk:
+                    results.append(_ingest_one(index, payload, error, current_time))
+        except DatabaseError as e:
+            # The commit itself failed: nothing in this chunk was written
+            for result in results:
+                if result['status'] in ('created', 'updated'):
+                    result.update(status='error', error=f'Chunk not committed: {e}')
+        yield from results
+
+
+def stream_results_json(results):
+    """Render ingest results as one JSON document, written out as they are produced."""
+    totals = dict.fromkeys(RESULT_STATUSES, 0)
+    yield '{"results":['
+    for count, result in enumerate(results):
+        totals[result['status']] += 1
+        yield (',' if count else '') + json.dumps(result, default=str)
+    yield '],"totals":' + json.dumps(totals) + '}'
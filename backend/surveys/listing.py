@@ -0,0 +1,151 @@
+"""
+Model-free JSON for the response list.
+
+The list used to build a SurveyResponse per row and serialize it field by field with
+SurveyResponseListSerializer. ListJSONWriter writes the same bytes as that serializer
+plus JSONRenderer from values_list() rows instead: every column gets an encoder chosen
+once from its model field (get_FOO_display labels from a static table, datetimes through
+a formatter fixed for the current time zone), and rows are written straight into the
+output buffer.
+"""
+
+import io
+import json
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from .models import SurveyResponse
+from .serializers import SurveyResponseListSerializer, display_source
+
+# What json.dumps(ensure_ascii=False) - and so JSONRenderer - uses for strings
+_encode_string = json.encoder.encode_basestring
+
+_INTEGER_TYPES = {
+    'AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField',
+    'SmallIntegerField', 'PositiveIntegerField', 'PositiveBigIntegerField',
+    'PositiveSmallIntegerField',
+}
+_STRING_TYPES = {'CharField', 'TextField', 'SlugField', 'EmailField', 'URLField'}
+_BOOLEANS = {True: 'true', False: 'false', None: 'null'}
+
+
+def _encode_integer(value):
+    return 'null' if value is None else int.__repr__(value)
+
+
+def _encode_text(value):
+    return 'null' if value is None else _encode_string(value)
+
+
+def _encode_boolean(value):
+    return _BOOLEANS[value]
+
+
+def datetime_encoder():
+    """
+    JSON for datetimes as DRF's DateTimeField writes them (ISO 8601 in the current time
+    zone, 'Z' for UTC), with the time zone handling settled once rather than per value.
+    """
+    field_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+    # The database returns UTC datetimes, which need no conversion into a UTC zone
+    utc = str(field_timezone) in ('UTC', 'Etc/UTC')
+
+    def encode(value):
+        if not value:
+            return 'null'
+        if field_timezone is None:
+            if timezone.is_aware(value):
+                value = timezone.make_naive(value, dt_timezone.utc)
+        elif not timezone.is_aware(value):
+            value = timezone.make_aware(value, field_timezone)
+        elif not utc or value.utcoffset():
+            value = value.astimezone(field_timezone)
+        text = value.isoformat()
+        if text.endswith('+00:00'):
+            text = text[:-6] + 'Z'
+        return '"' + text + '"'
+    return encode
+
+
+def _display_encoder(model_field):
+    labels = {value: _encode_string(str(label)) for value, label in model_field.flatchoices}
+
+    def encode(value):
+        if value is None:
+            return 'null'
+        # get_FOO_display() falls back to the value itself, which CharField makes a string
+        return labels.get(value) or _encode_string(str(value))
+    return encode
+
+
+def _column_encoder(model_field):
+    internal_type = model_field.get_internal_type()
+    if internal_type == 'DateTimeField':
+        return datetime_encoder()
+    if internal_type == 'BooleanField':
+        return _encode_boolean
+    if internal_type in _INTEGER_TYPES:
+        return _encode_integer
+    if internal_type in _STRING_TYPES:
+        return _encode_text
+    raise TypeError(f'No JSON encoder for {internal_type} ({model_field.name})')
+
+
+class ListJSONWriter:
+    """
+    Writes SurveyResponseListSerializer's JSON for values_list(*writer.columns) rows.
+    fields/omit restrict the output like the serializer's sparse fieldsets.
+    """
+
+    def __init__(self, fields=None, omit=None):
+        opts = SurveyResponse._meta
+        self.columns = []
+        plan = []
+        for name, field in SurveyResponseListSerializer(fields=fields, omit=omit).fields.items():
+            column = display_source(field.source)
+            model_field = opts.get_field(column or field.source)
+            encode = _display_encoder(model_field) if column else _column_encoder(model_field)
+            if model_field.attname not in self.columns:
+                self.columns.append(model_field.attname)
+            prefix = ('{' if not plan else ',') + _encode_string(name) + ':'
+            plan.append((prefix, self.columns.index(model_field.attname), encode))
+        self._plan = plan
+
+    def write_rows(self, rows, buffer):
+        """Write a JSON array of rows to a text buffer."""
+        write = buffer.write
+        plan = self._plan
+        write('[')
+        separator = ''
+        for row in rows:
+            write(separator)
+            separator = ','
+            if not plan:
+                write('{}')
+                continue
+            for prefix, index, encode in plan:
+                write(prefix)
+                write(encode(row[index]))
+            write('}')
+        write(']')
+
+    def render(self, rows, envelope=None):
+        """
+        The JSONRenderer bytes for the rows, or for envelope (a paginated response's data)
+        with the rows as its final 'results' entry.
+        """
+        buffer = io.StringIO()
+        if envelope is None:
+            self.write_rows(rows, buffer)
+        else:
+            head = JSONRenderer().render({**envelope, 'results': []}).decode('utf-8')
+            # 'results' is the envelope's last key, so its rendering ends with "[]}"
+            buffer.write(head[:-3])
+            self.write_rows(rows, buffer)
+            buffer.write('}')
+        text = buffer.getvalue()
+        # JSONRenderer escapes these line terminators, which are invalid in JavaScript strings
+        return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode('utf-8')
@@ -0,0 +1,60 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from surveys.compression import available_codings, compress
+from surveys.dashboard import DASHBOARD_ENDPOINTS
+from surveys.models import SurveyResponse
+from surveys.serializers import SurveyResponseListSerializer
+
+RESPONSE_PAGE_SIZES = [100, 1000]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compress the unfiltered dashboard payloads and /responses/ pages from the current '
+        'database with each available coding and report bytes saved and CPU time per payload'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Timed compressions per payload (default: 5)')
+
+    def handle(self, *args, **options):
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1')
+        codings = available_codings()
+        if not codings:
+            raise CommandError('No compression coding is enabled (COMPRESSION_ENCODINGS)')
+
+        renderer = JSONRenderer()
+        payloads = [(endpoint, renderer.render(build({}))) for endpoint, build in DASHBOARD_ENDPOINTS.items()]
+        for size in RESPONSE_PAGE_SIZES:
+            rows = SurveyResponseListSerializer(SurveyResponse.objects.all()[:size], many=True).data
+            payloads.append((f'responses ({len(rows)} rows)', renderer.render(rows)))
+
+        totals = {coding: [0, 0.0] for coding in codings}
+        original_total = 0
+        for name, body in payloads:
+            original_total += len(body)
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name}: {len(body):,} bytes'))
+            for coding in codings:
+                timings = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    compressed = compress(coding, body)
+                    timings.append(time.perf_counter() - started)
+                elapsed = statistics.median(timings)
+                totals[coding][0] += len(compressed)
+                totals[coding][1] += elapsed
+                self.stdout.write(
+                    f'  {coding:<5} {len(compressed):>10,} bytes '
+                    f'(saves {1 - len(compressed) / len(body):6.1%})  {elapsed * 1000:7.2f} ms'
+                )
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'All payloads: {original_total:,} bytes'))
+        for coding, (size, elapsed) in totals.items():
+            self.stdout.write(
+                f'  {coding:<5} {size:>10,} bytes (saves {1 - size / original_total:6.1%})  '
+                f'{elapsed * 1000:7.2f} ms CPU'
+            )
@@ -0,0 +1,57 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from surveys.listing import ListJSONWriter
+from surveys.models import SurveyResponse
+from surveys.serializers import SurveyResponseListSerializer
+
+
+def serializer_path(queryset):
+    """Model instances, SurveyResponseListSerializer and JSONRenderer (the previous list path)."""
+    return JSONRenderer().render(SurveyResponseListSerializer(queryset, many=True).data)
+
+
+def fast_path(queryset):
+    """values_list() tuples written by ListJSONWriter."""
+    writer = ListJSONWriter()
+    return writer.render(queryset.values_list(*writer.columns))
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare rows per second of the serializer and model-free JSON paths of the response '
+        'list on the current database (query included), and check their output is identical'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=0, help='Rows per run (default: all)')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per path (default: 5)')
+
+    def handle(self, *args, **options):
+        if options['rows'] < 0 or options['repeat'] < 1:
+            raise CommandError('--rows must not be negative and --repeat must be at least 1')
+        queryset = SurveyResponse.objects.all()
+        if options['rows']:
+            queryset = queryset[:options['rows']]
+        rows = queryset.count()
+        if not rows:
+            raise CommandError('No survey responses to serialize; import some data first')
+
+        outputs = {}
+        for name, path in [('serializer', serializer_path), ('model-free', fast_path)]:
+            timings = []
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                # A fresh queryset each run, so nothing comes from the result cache
+                outputs[name] = path(queryset.all())
+                timings.append(time.perf_counter() - started)
+            elapsed = statistics.median(timings)
+            self.stdout.write(
+                f'{name:<11} {rows} rows in {elapsed * 1000:8.1f} ms  {rows / elapsed:12,.0f} rows/s'
+            )
+
+        if outputs['serializer'] != outputs['model-free']:
+            raise CommandError('The two paths produced different output')
+        self.stdout.write(self.style.SUCCESS(f'Identical output ({len(outputs["serializer"]):,} bytes)'))
@@ -0,0 +1,129 @@
+import random
+import time
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from surveys.importing import REQUIRED_COLUMNS, map_survey_frame
+from surveys.mapping import AGREEMENT_SCALE, agreement_code, rating_code, survey_type_code, topic_name
+from surveys.webhook import map_webhook_payload
+
+AGREEMENT_LABELS = [label.capitalize() for label in AGREEMENT_SCALE]
+RATING_LABELS = ['1 (Poor)', '2 (Fair)', '3 (Good)']
+MENTORS = ['Dr. Smith', 'Dr. Jones', 'Other']
+TOPICS = ['Machine Learning and AI', 'Business Intelligence and Analytics', '3']
+
+
+def synthetic_payload(rng, index):
+    """An ending-survey webhook payload with realistic answer text."""
+    payload = {
+        'ResponseId': f'R_bench{index}',
+        'Q1.1': 'Ending Project',
+        'StartDate': '2025-05-01 10:00:00',
+        'EndDate': '2025-05-01 10:12:00',
+        'RecordedDate': '2025-05-01 10:12:01',
+        'Status': '0',
+        'Progress': '100',
+        'Duration (in seconds)': str(rng.randint(60, 1800)),
+        'Finished': '1',
+        'DistributionChannel': 'anonymous',
+        'UserLanguage': 'EN',
+        'Q_RecaptchaScore': '0.9',
+        'Q3.1': f'A{index:08d}',
+        'Q3.2': 'Project title',
+        'Q3.3': rng.choice(MENTORS),
+        'Q3.3.a': 'Dr. Other',
+        'Q3.5': 'Learned a lot',
+        'Q3.8': rng.choice(TOPICS),
+        'Q3.13': str(rng.randint(1, 5)),
+    }
+    for key in ('Q3.9', 'Q3.10', 'Q3.11'):
+        payload[key] = rng.choice(AGREEMENT_LABELS)
+    for letter in 'abcdefgh':
+        payload[f'Q3.12.{letter}'] = rng.choice(RATING_LABELS)
+    return payload
+
+
+def synthetic_frame(rng, rows):
+    """A Qualtrics export DataFrame (as read with dtype=str) of ending surveys."""
+    data = {column: [None] * rows for column in REQUIRED_COLUMNS}
+    for index in range(rows):
+        data['ResponseId'][index] = f'R_bench{index}'
+        data['Q1.1'][index] = '2'
+        data['StartDate'][index] = '2025-05-01 10:00:00'
+        data['EndDate'][index] = '2025-05-01 10:12:00'
+        data['RecordedDate'][index] = '2025-05-01 10:12:01'
+        data['Status'][index] = '0'
+        data['Progress'][index] = '100'
+        data['Duration (in seconds)'][index] = str(rng.randint(60, 1800))
+        data['Finished'][index] = '1'
+        data['Q3.1'][index] = f'A{index:08d}'
+        data['Q3.3'][index] = '1'
+        data['Q3.8'][index] = rng.choice(TOPICS[-1:] + ['1', '2'])
+        for column in ('Q3.9', 'Q3.10', 'Q3.11'):
+            data[column][index] = str(rng.randint(1, 5))
+        for number in range(1, 9):
+            data[f'Q3.12_{number}'][index] = str(rng.randint(1, 3))
+        data['Q3.13'][index] = str(rng.randint(1, 5))
+    return pd.DataFrame(data)
+
+
+class Command(BaseCommand):
+    help = 'Measure the cost of mapping webhook payloads and CSV rows onto SurveyResponse fields'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--payloads',
+            type=int,
+            default=5000,
+            help='Webhook payloads mapped one at a time (default: 5000)',
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=20000,
+            help='CSV rows mapped as one DataFrame (default: 20000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for the synthetic answers (default: 0)',
+        )
+
+    def handle(self, *args, **options):
+        if options['payloads'] < 1 or options['rows'] < 1:
+            raise CommandError('--payloads and --rows must be at least 1')
+        rng = random.Random(options['seed'])
+        # Nothing is written, so no database access is needed
+        now = timezone.now()
+
+        payloads = [synthetic_payload(rng, index) for index in range(options['payloads'])]
+        started = time.perf_counter()
+        for payload in payloads:
+            map_webhook_payload(payload, current_time=now)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'Webhook: {len(payloads)} payloads in {elapsed:.3f}s '
+            f'({elapsed / len(payloads) * 1e6:.1f} us per payload)'
+        )
+
+        frame = synthetic_frame(rng, options['rows'])
+        started = time.perf_counter()
+        records, errors = map_survey_frame(frame)
+        elapsed = time.perf_counter() - started
+        if errors:
+            raise CommandError(f'Synthetic CSV rows failed to map: {errors[:3]}')
+        self.stdout.write(
+            f'CSV: {len(records)} rows in {elapsed:.3f}s '
+            f'({elapsed / len(records) * 1e6:.1f} us per row)'
+        )
+
+        for name, converter in [
+            ('agreement', agreement_code),
+            ('rating', rating_code),
+            ('survey type', survey_type_code),
+            ('topic', topic_name),
+        ]:
+            info = converter.cache_info()
+            self.stdout.write(f'  {name} lookups: {info.hits} cached, {info.misses} computed')
@@ -0,0 +1,93 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from surveys.models import SurveyResponse
+from surveys.renderers import ColumnarJSONRenderer, MessagePackRenderer
+from surveys.serializers import SurveyResponseListSerializer
+
+MENTORS = ['Dr. Smith', 'Dr. Jones', 'Dr. Garcia', 'Other']
+TOPICS = ['Machine Learning and AI', 'Business Intelligence and Analytics', 'Data Engineering']
+RATING_FIELDS = [field for field in SurveyResponseListSerializer.Meta.fields if field.startswith('rating_')]
+
+# Distinct synthetic rows serialized; larger row counts repeat them with new ids
+TEMPLATE_ROWS = 1000
+
+
+def synthetic_response(rng, index, now):
+    """An unsaved ending-survey response with realistic list-view values."""
+    response = SurveyResponse(
+        id=index + 1,
+        response_id=f'R_bench{index}',
+        survey_type=2,
+        a_number=f'A{index:08d}',
+        project_title=f'Project {index % 200}',
+        project_mentor=rng.choice(MENTORS),
+        topic=rng.choice(TOPICS),
+        recorded_date=now - timedelta(minutes=index),
+        finished=True,
+        hard_skills_improved=rng.randint(1, 5),
+        soft_skills_improved=rng.randint(1, 5),
+        confidence_job_placement=rng.randint(1, 5),
+        recommend_asc=rng.randint(1, 5),
+    )
+    for field in RATING_FIELDS:
+        setattr(response, field, rng.choice([1, 2, 3, None]))
+    return response
+
+
+def list_rows(rng, rows):
+    """Serialized list rows, as the response list renders them."""
+    now = timezone.now()
+    templates = SurveyResponseListSerializer(
+        [synthetic_response(rng, index, now) for index in range(min(rows, TEMPLATE_ROWS))],
+        many=True,
+    ).data
+    return [
+        {**templates[index % len(templates)], 'id': index + 1}
+        for index in range(rows)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and encode time of the response list renderers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[10000, 100000],
+            help='Row counts to render (default: 10000 100000)',
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Timed renders per payload (default: 5)')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+
+    def handle(self, *args, **options):
+        if min(options['rows']) < 1 or options['repeat'] < 1:
+            raise CommandError('--rows and --repeat must be at least 1')
+        rng = random.Random(options['seed'])
+        renderers = [JSONRenderer(), ColumnarJSONRenderer(), MessagePackRenderer()]
+
+        for rows in options['rows']:
+            data = list_rows(rng, rows)
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{rows} rows'))
+            baseline = None
+            for renderer in renderers:
+                timings = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    body = renderer.render(data)
+                    timings.append(time.perf_counter() - started)
+                elapsed = statistics.median(timings)
+                if baseline is None:
+                    baseline = (len(body), elapsed)
+                self.stdout.write(
+                    f'  {renderer.format:<9} {len(body):>12,} bytes ({len(body) / baseline[0]:5.1%})  '
+                    f'{elapsed * 1000:8.1f} ms ({elapsed / baseline[1]:5.1%})  '
+                    f'{rows / elapsed:12,.0f} rows/s'
+                )
@@ -0,0 +1,118 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.http import QueryDict
+from surveys.filters import EXACT_MATCH, TEXT_FILTERS, apply_filters, apply_rollup_filters, rollups_cover_filters
+from surveys.models import RatingRollup, SurveyResponse
+
+# Filter combinations the dashboard sends (dropdown values use exact matching)
+FILTER_CASES = [
+    '',
+    'startDate=2025-01-01',
+    'startDate=2025-01-01&endDate=2025-06-30',
+    'mentor=M&mentorMatch=exact',
+    'mentor=M&mentorMatch=exact&startDate=2025-01-01&endDate=2025-06-30',
+    'topic=T&topicMatch=exact',
+    'topic=T&topicMatch=exact&startDate=2025-01-01&endDate=2025-06-30',
+    'mentor=M&mentorMatch=exact&topic=T&topicMatch=exact',
+]
+
+# Substring searches (typed text) cannot use an index; their plans are shown, not checked
+SUBSTRING_CASES = [
+    'mentor=M',
+    'topic=T',
+    'projectName=P',
+]
+
+
+def search_columns(filters, date_column):
+    """Columns an index search should constrain: the exact-match filters, else the date range."""
+    exact = [
+        field for name, (field, mode_param) in TEXT_FILTERS.items()
+        if filters.get(name) and filters.get(mode_param) == EXACT_MATCH
+    ]
+    if exact:
+        return exact
+    if filters.get('startDate') or filters.get('endDate'):
+        return [date_column]
+    return []
+
+
+class Command(BaseCommand):
+    help = (
+        'Show SQLite query plans for the dashboard filters and fail if a filtered query scans '
+        'a table or index instead of searching an index on its filter columns'
+    )
+
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def querysets(self, filters):
+        """(name, queryset, date column) for each query the filters are applied to."""
+        yield (
+            'stats',
+            apply_filters(SurveyResponse.objects.filter(survey_type=2), filters).order_by().values('pk'),
+            'recorded_date',
+        )
+        if rollups_cover_filters(filters):
+            yield (
+                'rollups',
+                apply_rollup_filters(RatingRollup.objects.filter(survey_type=2), filters).order_by().values('pk'),
+                'day',
+            )
+        yield (
+            'responses',
+            apply_filters(SurveyResponse.objects.all(), filters).order_by('-recorded_date', '-id').values('pk')[:100],
+            'recorded_date',
+        )
+
+    def problems(self, plan, filters, date_column):
+        """Why plan is not an index search on the filter columns (empty when it is)."""
+        problems = []
+        for step in plan:
+            if not step.startswith('SCAN '):
+                continue
+            # Unfiltered, the list walks the keyset index in order and stops after a page
+            if not filters and ' USING ' in step:
+                continue
+            problems.append(step)
+        searches = [step for step in plan if step.startswith('SEARCH ')]
+        columns = search_columns(filters, date_column)
+        if columns and not any(
+            re.search(rf'\b{column}\s*[=<>]', step) for step in searches for column in columns
+        ):
+            problems.append(f'no index search on {" or ".join(columns)}')
+        return problems
+
+    def show(self, title, plan, style):
+        self.stdout.write(style(title))
+        for step in plan:
+            self.stdout.write(f'    {step}')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('EXPLAIN QUERY PLAN checks are only implemented for SQLite')
+
+        failures = []
+        for case in FILTER_CASES:
+            filters = QueryDict(case)
+            for name, queryset, date_column in self.querysets(filters):
+                plan = self.explain(queryset)
+                problems = self.problems(plan, filters, date_column)
+                title = f'{name} [{case or "no filters"}]'
+                self.show(title, plan, self.style.ERROR if problems else self.style.SUCCESS)
+                if problems:
+                    failures.append(f'{title}: {"; ".join(problems)}')
+
+        for case in SUBSTRING_CASES:
+            filters = QueryDict(case)
+            for name, queryset, _ in self.querysets(filters):
+                self.show(f'{name} [{case}] (substring match, not checked)', self.explain(queryset), self.style.WARNING)
+
+        if failures:
+            raise CommandError('Filtered queries without an index search:\n' + '\n'.join(failures))
+        self.stdout.write(self.style.SUCCESS('All exact-match and date filter combinations search an index'))
@@ -0,0 +1,122 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError
+from surveys.inbox import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_RETRY_DELAY,
+    drain_inbox,
+    inbox_counts,
+    requeue_dead_entries,
+)
+
+
+class Command(BaseCommand):
+    help = 'Map and store Qualtrics webhook payloads waiting in the webhook inbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Entries processed per transaction (default: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help=f'Failed writes before an entry is dead-lettered (default: {DEFAULT_MAX_ATTEMPTS})',
+        )
+        parser.add_argument(
+            '--retry-delay',
+            type=float,
+            default=DEFAULT_RETRY_DELAY,
+            help=f'Seconds before a failed write is retried, doubled per attempt (default: {DEFAULT_RETRY_DELAY})',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep running and poll for new entries (for the worker service)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='Seconds between polls of an empty inbox with --loop (default: 2)',
+        )
+        parser.add_argument(
+            '--requeue-dead',
+            action='store_true',
+            help='Move dead-lettered entries back to pending before draining',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Only print the number of entries per status',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            self.stdout.write(self.style.ERROR('--batch-size must be at least 1'))
+            return
+        if options['retry_delay'] < 0:
+            self.stdout.write(self.style.ERROR('--retry-delay must not be negative'))
+            return
+
+        if options['status']:
+            for name, total in inbox_counts().items():
+                self.stdout.write(f'{name}: {total}')
+            return
+
+        if options['requeue_dead']:
+            requeued = requeue_dead_entries()
+            self.stdout.write(f'Requeued {requeued} dead-lettered entries')
+
+        self.stopping = False
+        if options['loop']:
+            # Finish the current batch on SIGTERM/SIGINT instead of dying mid-transaction
+            signal.signal(signal.SIGTERM, self.request_stop)
+            signal.signal(signal.SIGINT, self.request_stop)
+
+        totals = dict.fromkeys(['created', 'updated', 'skipped', 'retry', 'dead'], 0)
+        while not self.stopping:
+            try:
+                counts = drain_inbox(
+                    batch_size=options['batch_size'],
+                    max_attempts=options['max_attempts'],
+                    retry_delay=options['retry_delay'],
+                )
+            except OperationalError as e:
+                # Typically "database is locked" while an import runs; the batch rolled back
+                if not options['loop']:
+                    raise
+                self.stdout.write(self.style.WARNING(f'Batch failed, retrying: {e}'))
+                time.sleep(options['interval'])
+                continue
+
+            for name, total in counts.items():
+                totals[name] += total
+            processed = sum(counts.values())
+            if processed:
+                self.stdout.write(
+                    f"Batch: {counts['created']} created, {counts['updated']} updated, "
+                    f"{counts['skipped']} skipped, {counts['retry']} to retry, {counts['dead']} dead-lettered"
+                )
+
+            drained = processed < options['batch_size'] or processed == counts['retry']
+            if drained:
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Webhook inbox drained: {totals['created']} created, {totals['updated']} updated, "
+                f"{totals['skipped']} skipped, {totals['dead']} dead-lettered"
+            )
+        )
+
+    def request_stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,130 @@
+import http.client
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# Requests the dashboard page makes on load
+DEFAULT_PATHS = [
+    '/api/dashboard/stats/',
+    '/api/dashboard/analytics/',
+    '/api/available-data/',
+    '/api/responses/?page_size=100',
+]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+class Command(BaseCommand):
+    help = 'Send concurrent authenticated GET requests to a running server and report throughput and latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Server base URL (default: http://127.0.0.1:8000)',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='Path to request, repeatable; requests cycle through them (default: the dashboard endpoints)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='Concurrent clients, each with a keep-alive connection (default: 8)',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=10.0,
+            help='Seconds to run (default: 10)',
+        )
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError('--concurrency must be at least 1 and --duration positive')
+        base = urlsplit(options['url'])
+        if base.scheme not in ('http', 'https') or not base.hostname:
+            raise CommandError(f"Unsupported URL: {options['url']}")
+        paths = options['paths'] or DEFAULT_PATHS
+
+        # Same service account the dashboard login issues tokens for
+        user, _ = get_user_model().objects.get_or_create(
+            username='asc_dashboard_service',
+            defaults={'is_active': True, 'is_staff': False, 'is_superuser': False},
+        )
+        headers = {
+            'Authorization': f'Bearer {RefreshToken.for_user(user).access_token}',
+            'Host': base.netloc,
+        }
+        connection_class = http.client.HTTPSConnection if base.scheme == 'https' else http.client.HTTPConnection
+
+        latencies = []
+        statuses = Counter()
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['duration']
+
+        def client(offset):
+            connection = None
+            timings = []
+            codes = Counter()
+            count = offset
+            while time.perf_counter() < deadline:
+                path = paths[count % len(paths)]
+                count += 1
+                started = time.perf_counter()
+                try:
+                    if connection is None:
+                        connection = connection_class(base.hostname, base.port, timeout=30)
+                    connection.request('GET', path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                    codes[response.status] += 1
+                    if response.will_close:
+                        connection.close()
+                        connection = None
+                except (OSError, http.client.HTTPException) as e:
+                    codes[type(e).__name__] += 1
+                    if connection is not None:
+                        connection.close()
+                    connection = None
+                    continue
+                timings.append(time.perf_counter() - started)
+            if connection is not None:
+                connection.close()
+            with lock:
+                latencies.extend(timings)
+                statuses.update(codes)
+
+        threads = [threading.Thread(target=client, args=(index,)) for index in range(options['concurrency'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        total = sum(statuses.values())
+        self.stdout.write(
+            f'{total} requests in {elapsed:.1f}s with {options["concurrency"]} clients: '
+            f'{len(latencies) / elapsed:.1f} req/s'
+        )
+        self.stdout.write(
+            f'Latency ms: p50 {percentile(latencies, 0.5) * 1000:.1f}, '
+            f'p95 {percentile(latencies, 0.95) * 1000:.1f}, p99 {percentile(latencies, 0.99) * 1000:.1f}'
+        )
+        self.stdout.write('Responses: ' + ', '.join(f'{code}: {count}' for code, count in sorted(statuses.items(), key=str)))
+        if not statuses or any(not isinstance(code, int) or code >= 500 for code in statuses):
+            raise CommandError('Some requests failed')
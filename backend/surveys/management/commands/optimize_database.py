@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = 'Refresh SQLite query planner statistics and checkpoint the WAL (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Run a full ANALYZE instead of PRAGMA optimize (after large imports or deletes)',
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='Also VACUUM to reclaim free pages (blocks writers while it runs)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('optimize_database only supports SQLite')
+
+        with connection.cursor() as cursor:
+            started = time.perf_counter()
+            if options['analyze']:
+                cursor.execute('ANALYZE')
+                self.stdout.write(f'ANALYZE: {time.perf_counter() - started:.2f}s')
+            else:
+                # Only re-analyzes tables whose statistics are stale; usually a no-op
+                cursor.execute('PRAGMA optimize')
+                self.stdout.write(f'PRAGMA optimize: {time.perf_counter() - started:.2f}s')
+
+            if options['vacuum']:
+                started = time.perf_counter()
+                cursor.execute('VACUUM')
+                self.stdout.write(f'VACUUM: {time.perf_counter() - started:.2f}s')
+
+            journal_mode = cursor.execute('PRAGMA journal_mode').fetchone()[0]
+            if journal_mode == 'wal':
+                # Fold the WAL back into the database file and truncate it
+                busy, wal_pages, checkpointed = cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()
+                if busy:
+                    self.stdout.write(self.style.WARNING(
+                        f'WAL checkpoint incomplete ({checkpointed}/{wal_pages} pages): readers were active'
+                    ))
+                else:
+                    self.stdout.write(f'WAL checkpoint: {checkpointed} pages')
+
+            page_size = cursor.execute('PRAGMA page_size').fetchone()[0]
+            page_count = cursor.execute('PRAGMA page_count').fetchone()[0]
+            free_pages = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Database optimized: {page_count * page_size / 1024 / 1024:.1f} MB, '
+            f'{free_pages * page_size / 1024 / 1024:.1f} MB free, journal mode {journal_mode}'
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from surveys.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Regenerate the rating rollup table from all survey responses'
+
+    def handle(self, *args, **options):
+        try:
+            buckets = rebuild_rollups()
+            self.stdout.write(
+                self.style.SUCCESS(f'Rebuilt {buckets} rating rollup buckets')
+            )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Failed to rebuild rollups: {str(e)}')
+            )
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Run the API under gunicorn with preforked workers (production replacement for runserver)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bind', help=f'Address to listen on (default: SERVE_BIND, {settings.SERVE_BIND})')
+        parser.add_argument('--workers', type=int, help='Worker processes (default: SERVE_WORKERS, or 2 x CPUs + 1)')
+        parser.add_argument('--threads', type=int, help='Threads per worker (default: SERVE_THREADS, or one per CPU from 2 to 8)')
+        parser.add_argument(
+            '--max-requests',
+            type=int,
+            help=f'Requests before a worker is replaced, 0 to disable (default: SERVE_MAX_REQUESTS, {settings.SERVE_MAX_REQUESTS})',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Print the gunicorn command line and exit')
+
+    def handle(self, *args, **options):
+        if importlib.util.find_spec('gunicorn') is None:
+            raise CommandError('gunicorn is not installed (pip install -r requirements.txt)')
+
+        from asc_dashboard import gunicorn_conf
+
+        workers = options['workers'] or gunicorn_conf.workers
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
+
+        command = [sys.executable, '-m', 'gunicorn', '--config', 'python:asc_dashboard.gunicorn_conf']
+        # Command line options override the config module
+        if options['bind']:
+            command += ['--bind', options['bind']]
+        if options['workers']:
+            command += ['--workers', str(options['workers'])]
+        if options['threads']:
+            command += ['--threads', str(options['threads'])]
+        if options['max_requests'] is not None:
+            command += ['--max-requests', str(options['max_requests'])]
+            command += ['--max-requests-jitter', str(max(options['max_requests'] // 10, 0))]
+
+        cache_backend = settings.CACHES['default']['BACKEND']
+        if workers > 1 and settings.DASHBOARD_CACHE_ENABLED and cache_backend.endswith('LocMemCache'):
+            # Entries stay correct (they follow the database's data version), but each
+            # worker computes and holds its own copy of every dashboard
+            self.stderr.write(self.style.NOTICE(
+                f'{workers} workers with the in-process dashboard cache: every worker computes the '
+                'dashboards separately. Set DASHBOARD_CACHE_URL to a Redis server to share them.'
+            ))
+
+        self.stdout.write(
+            f"Starting gunicorn: {workers} workers x {options['threads'] or gunicorn_conf.threads} threads "
+            f"on {options['bind'] or gunicorn_conf.bind}"
+        )
+        if options['dry_run']:
+            self.stdout.write(' '.join(command))
+            return
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Replace this process so systemd's SIGTERM reaches the gunicorn master directly
+        os.chdir(settings.BASE_DIR)
+        os.execv(sys.executable, command)
@@ -0,0 +1,109 @@
+import json
+import re
+import subprocess
+import sys
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Only needed by the CSV import path; loading them at startup is a regression
+LAZY_MODULES = ['pandas', 'numpy']
+
+# Run in a fresh interpreter: load the WSGI application and its URLconf, which is what a
+# new worker does before it can serve a request
+PROBE = '''
+import json, os, resource, sys, time
+started = time.perf_counter()
+from asc_dashboard.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - started
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    'elapsed_ms': elapsed * 1000,
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    'max_rss_mb': max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024),
+    'lazy_modules': [name for name in %r if name in sys.modules],
+}))
+''' % (LAZY_MODULES,)
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+class Command(BaseCommand):
+    help = 'Measure cold-start import time and memory of the WSGI application and fail if over budget'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Cold starts measured; the fastest is compared with the budget (default: 3)',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Top-level packages listed by import time (default: 10)',
+        )
+        parser.add_argument(
+            '--time-budget',
+            type=int,
+            default=settings.STARTUP_TIME_BUDGET_MS,
+            help=f'Cold start budget in ms (default: STARTUP_TIME_BUDGET_MS, {settings.STARTUP_TIME_BUDGET_MS})',
+        )
+        parser.add_argument(
+            '--rss-budget',
+            type=int,
+            default=settings.STARTUP_RSS_BUDGET_MB,
+            help=f'Peak RSS budget in MB (default: STARTUP_RSS_BUDGET_MB, {settings.STARTUP_RSS_BUDGET_MB})',
+        )
+
+    def probe(self, *interpreter_options):
+        completed = subprocess.run(
+            [sys.executable, *interpreter_options, '-c', PROBE],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode:
+            raise CommandError(f'Startup probe failed:\n{completed.stderr}')
+        return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError('--runs must be at least 1')
+
+        # -X importtime slows imports down, so timings come from separate plain runs
+        _, importtime = self.probe('-X', 'importtime')
+        self_us = Counter()
+        total_us = 0
+        for match in _IMPORTTIME_LINE.finditer(importtime):
+            self_time, cumulative, indent, module = match.groups()
+            self_us[module.split('.')[0]] += int(self_time)
+            if not indent:
+                total_us += int(cumulative)
+        self.stdout.write(f'-X importtime total: {total_us / 1000:.0f} ms')
+        for package, micros in self_us.most_common(options['top']):
+            self.stdout.write(f'    {package:<28} {micros / 1000:8.1f} ms')
+
+        results = [self.probe()[0] for _ in range(options['runs'])]
+        elapsed = min(result['elapsed_ms'] for result in results)
+        max_rss = min(result['max_rss_mb'] for result in results)
+        lazy_loaded = results[0]['lazy_modules']
+        self.stdout.write(
+            f'Cold start: {elapsed:.0f} ms (budget {options["time_budget"]} ms), '
+            f'peak RSS {max_rss:.1f} MB (budget {options["rss_budget"]} MB)'
+        )
+
+        failures = []
+        if elapsed > options['time_budget']:
+            failures.append(f'cold start {elapsed:.0f} ms > {options["time_budget"]} ms')
+        if max_rss > options['rss_budget']:
+            failures.append(f'peak RSS {max_rss:.1f} MB > {options["rss_budget"]} MB')
+        if lazy_loaded:
+            failures.append(f'{", ".join(lazy_loaded)} imported at startup (should be imported lazily)')
+        if failures:
+            raise CommandError('Startup budget exceeded: ' + '; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('Startup within budget'))
@@ -0,0 +1,165 @@
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, connections, transaction
+from django.http import QueryDict
+from django.test.utils import override_settings
+from django.utils import timezone
+from surveys.dashboard import build_available_data, build_dashboard_stats
+from surveys.webhook import map_webhook_payload, upsert_webhook_response
+
+# Django and SQLite out of the box: rollback journal, deferred transactions, the sqlite3
+# module's 5 second busy timeout and a new connection per request
+BASELINE = {
+    'pragmas': {'journal_mode': 'delete', 'synchronous': 'full', 'busy_timeout': '5000'},
+    'transaction_mode': None,
+    'persistent': False,
+}
+
+READ_FILTERS = ['', 'startDate=2025-01-01', 'startDate=2025-03-01&endDate=2025-06-30']
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def write_payload(rng, index):
+    """An ending-survey webhook payload; ids repeat so writes mix inserts and updates."""
+    day = rng.randint(1, 28)
+    return {
+        'ResponseId': f'R_stress{rng.randint(0, 999)}',
+        'Q1.1': 'Ending Project',
+        'RecordedDate': f'2025-04-{day:02d} 12:00:00',
+        'Q3.3': 'Dr. Stress',
+        'Q3.8': 'Machine Learning and AI',
+        'Q3.9': 'Somewhat agree',
+        'Q3.12.a': '2 (Fair)',
+        'Q3.13': str(index % 11),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Run concurrent dashboard readers and webhook writers against a copy of the database, '
+        'with SQLite defaults and with the configured tuning, and report lock errors and latency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help='Reader threads (default: 4)')
+        parser.add_argument('--writers', type=int, default=2, help='Writer threads (default: 2)')
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per profile (default: 10)')
+        parser.add_argument(
+            '--profile',
+            choices=['baseline', 'tuned', 'both'],
+            default='both',
+            help='baseline: SQLite/Django defaults; tuned: current settings (default: both)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('stress_database only supports SQLite')
+        if options['readers'] < 0 or options['writers'] < 0 or options['readers'] + options['writers'] < 1:
+            raise CommandError('Need at least one reader or writer thread')
+
+        tuned = {
+            'pragmas': settings.SQLITE_PRAGMAS,
+            'transaction_mode': settings.DATABASES[DEFAULT_DB_ALIAS].get('OPTIONS', {}).get('transaction_mode'),
+            'persistent': settings.DATABASES[DEFAULT_DB_ALIAS].get('CONN_MAX_AGE', 0) != 0,
+        }
+        profiles = [('baseline', BASELINE), ('tuned', tuned)]
+        if options['profile'] != 'both':
+            profiles = [profile for profile in profiles if profile[0] == options['profile']]
+
+        source = str(settings.DATABASES[DEFAULT_DB_ALIAS]['NAME'])
+        original = connections.settings[DEFAULT_DB_ALIAS].copy()
+        workdir = tempfile.mkdtemp(prefix='stress_database_')
+        try:
+            for name, profile in profiles:
+                path = os.path.join(workdir, f'{name}.sqlite3')
+                # The backup API gives a consistent copy even while the app is writing
+                with sqlite3.connect(source) as src, sqlite3.connect(path) as dst:
+                    src.backup(dst)
+                self.use_database(dict(original, NAME=path, OPTIONS={'transaction_mode': profile['transaction_mode']}))
+                with override_settings(SQLITE_PRAGMAS=profile['pragmas']):
+                    self.report(name, self.run_profile(profile, options))
+                connections.close_all()
+        finally:
+            self.use_database(original)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def use_database(self, settings_dict):
+        """Point new connections (in every thread) at settings_dict."""
+        connections.close_all()
+        connections.settings[DEFAULT_DB_ALIAS] = settings_dict
+        try:
+            del connections[DEFAULT_DB_ALIAS]
+        except AttributeError:
+            pass  # not yet opened in this thread
+
+    def run_profile(self, profile, options):
+        deadline = time.perf_counter() + options['duration']
+        results = {'read': [], 'write': [], 'locked': 0, 'failed': 0}
+        lock = threading.Lock()
+        now = timezone.now()
+
+        def worker(kind, seed):
+            rng = random.Random(seed)
+            timings = []
+            locked = failed = 0
+            count = 0
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    if kind == 'read':
+                        params = QueryDict(READ_FILTERS[count % len(READ_FILTERS)])
+                        build_dashboard_stats(params)
+                        build_available_data(params)
+                    else:
+                        _, response_data = map_webhook_payload(write_payload(rng, count), current_time=now)
+                        with transaction.atomic():
+                            upsert_webhook_response(response_data)
+                except OperationalError as e:
+                    if 'locked' in str(e):
+                        locked += 1
+                    else:
+                        failed += 1
+                else:
+                    timings.append(time.perf_counter() - started)
+                count += 1
+                if not profile['persistent']:
+                    # CONN_MAX_AGE=0: each request opens a new connection
+                    connection.close()
+            connection.close()
+            with lock:
+                results[kind].extend(timings)
+                results['locked'] += locked
+                results['failed'] += failed
+
+        threads = [threading.Thread(target=worker, args=('read', index)) for index in range(options['readers'])]
+        threads += [threading.Thread(target=worker, args=('write', 1000 + index)) for index in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results['elapsed'] = options['duration']
+        return results
+
+    def report(self, name, results):
+        self.stdout.write(self.style.MIGRATE_HEADING(name))
+        for kind in ('read', 'write'):
+            timings = sorted(results[kind])
+            self.stdout.write(
+                f'  {kind}s: {len(timings)} ok ({len(timings) / results["elapsed"]:.1f}/s), '
+                f'p50 {percentile(timings, 0.5) * 1000:.1f} ms, p99 {percentile(timings, 0.99) * 1000:.1f} ms'
+            )
+        style = self.style.ERROR if results['locked'] else self.style.SUCCESS
+        self.stdout.write(style(f'  "database is locked" errors: {results["locked"]}, other errors: {results["failed"]}'))
@@ -0,0 +1,281 @@
+"""
+Qualtrics -> SurveyResponse field mapping shared by every ingestion path.
+
+FIELDS declares each mapped model field once: how its value is converted, which CSV
+export column it comes from and which webhook payload key. The table is compiled at
+import time - WEBHOOK_STEPS is a flat list of (field, key, converter, default) used for
+single payloads, and importing.py applies the same converters to whole DataFrame
+columns. Answer scales are dict lookups, cached per distinct answer, and answers
+outside a question's scale (the model validators' range) convert to missing, which the
+CSV import reports as a row error.
+
+Webhook payloads keep the original view's reading of numbers: 0 means the value is
+missing, so status, progress and duration fall back to their defaults.
+
+Nothing here imports pandas at module level: the webhook view and worker load this
+module, and pandas is only needed by the CSV import path.
+
+Fields whose source depends on the survey type list a (starting, ending) pair of CSV
+columns. Mentor and topic are derived from several columns and are handled by
+mentor_name() and topic_name().
+"""
+
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+
+from django.utils import timezone
+
+# Converter kinds
+TEXT = 'text'
+INTEGER = 'integer'
+FLOAT = 'float'
+BOOLEAN = 'boolean'
+DATETIME = 'datetime'
+AGREEMENT = 'agreement'
+RATING = 'rating'
+SCALE = 'scale'
+
+# Webhook default meaning "when the payload was received"
+NOW = object()
+
+# field: model field; kind: converter kind; csv: export column, (starting, ending)
+# columns or None; webhook: payload key or None (default is then stored as is);
+# default: webhook value when the key is missing, empty or unparseable
+FieldSpec = namedtuple('FieldSpec', ['field', 'kind', 'csv', 'webhook', 'default'])
+
+FIELDS = [
+    # Qualtrics metadata
+    FieldSpec('start_date', DATETIME, 'StartDate', 'StartDate', NOW),
+    FieldSpec('end_date', DATETIME, 'EndDate', 'EndDate', NOW),
+    FieldSpec('recorded_date', DATETIME, 'RecordedDate', 'RecordedDate', NOW),
+    FieldSpec('status', INTEGER, 'Status', 'Status', 1),
+    FieldSpec('progress', INTEGER, 'Progress', 'Progress', 100),
+    FieldSpec('duration_seconds', INTEGER, 'Duration (in seconds)', 'Duration (in seconds)', 0),
+    FieldSpec('finished', BOOLEAN, 'Finished', 'Finished', True),
+    FieldSpec('distribution_channel', TEXT, 'DistributionChannel', 'DistributionChannel', 'qualtrics'),
+    FieldSpec('user_language', TEXT, 'UserLanguage', 'UserLanguage', 'EN'),
+    FieldSpec('recaptcha_score', FLOAT, 'Q_RecaptchaScore', 'Q_RecaptchaScore', None),
+    # Both surveys, different questions
+    FieldSpec('a_number', TEXT, ('Q2.1', 'Q3.1'), 'Q3.1', ''),
+    FieldSpec('project_title', TEXT, ('Q2.2', 'Q3.2'), 'Q3.2', ''),
+    FieldSpec('mentor_other_text', TEXT, ('Q2.3_20_TEXT', None), 'Q3.3.a', ''),
+    # Starting project survey (webhooks only store ending surveys)
+    FieldSpec('is_first_project', BOOLEAN, 'Q2.4', None, None),
+    FieldSpec('topics_working_on', INTEGER, 'Q2.6', None, None),
+    FieldSpec('confidence_topics', SCALE, 'Q2.7', None, None),
+    FieldSpec('enough_resources', SCALE, 'Q2.8', None, None),
+    FieldSpec('hope_to_gain', TEXT, 'Q2.9', None, ''),
+    FieldSpec('additional_comments_starting', TEXT, 'Q2.10', None, ''),
+    # Ending project survey
+    FieldSpec('gained_learned', TEXT, 'Q3.5', 'Q3.5', ''),
+    FieldSpec('what_went_well', TEXT, 'Q3.6', 'Q3.6', ''),
+    FieldSpec('what_could_improve', TEXT, 'Q3.7', 'Q3.7', ''),
+    FieldSpec('topics_worked_on', INTEGER, 'Q3.8', None, None),
+    FieldSpec('hard_skills_improved', AGREEMENT, 'Q3.9', 'Q3.9', None),
+    FieldSpec('soft_skills_improved', AGREEMENT, 'Q3.10', 'Q3.10', None),
+    FieldSpec('confidence_job_placement', AGREEMENT, 'Q3.11', 'Q3.11', None),
+    FieldSpec('rating_onboarding', RATING, 'Q3.12_1', 'Q3.12.a', None),
+    FieldSpec('rating_initiation', RATING, 'Q3.12_2', 'Q3.12.b', None),
+    FieldSpec('rating_mentorship', RATING, 'Q3.12_3', 'Q3.12.c', None),
+    FieldSpec('rating_team', RATING, 'Q3.12_4', 'Q3.12.d', None),
+    FieldSpec('rating_communications', RATING, 'Q3.12_5', 'Q3.12.e', None),
+    FieldSpec('rating_expectations', RATING, 'Q3.12_6', 'Q3.12.f', None),
+    FieldSpec('rating_sponsor', RATING, 'Q3.12_7', 'Q3.12.g', None),
+    FieldSpec('rating_workload', RATING, 'Q3.12_8', 'Q3.12.h', None),
+    FieldSpec('recommend_asc', SCALE, 'Q3.13', 'Q3.13', None),
+    FieldSpec('additional_comments_ending', TEXT, 'Q3.14', 'Q3.14', ''),
+]
+
+# Q3.9-Q3.11 answer text -> code (normalized to -1 .. 1 by the database)
+AGREEMENT_SCALE = {
+    'strongly disagree': 1,
+    'somewhat disagree': 2,
+    'neither agree nor disagree': 3,
+    'somewhat agree': 4,
+    'strongly agree': 5,
+}
+AGREEMENT_MAX = 5
+
+# Q2.7, Q2.8 and Q3.13 are 1-5 scales; Q3.12 ratings are 1-3
+SCALE_MAX = 5
+RATING_MAX = 3
+
+# Q1.1 answer text -> survey type
+SURVEY_TYPES = {
+    'starting': 1,
+    'ending': 2,
+}
+
+# Legacy numeric topic codes (old export format)
+TOPIC_MAPPING = {
+    1: 'Data Engineering and Visualization',
+    2: 'Business Intelligence and Analytics',
+    3: 'Machine Learning and AI',
+    4: 'Predictive and Advanced Analytics',
+    5: 'Software Development and Web Design',
+}
+
+
+def _cached_text(function):
+    """Memoize a str -> value converter per distinct answer; non-strings are str()'d."""
+    cached = lru_cache(maxsize=4096)(function)
+
+    def convert(value):
+        return cached(value if isinstance(value, str) else str(value))
+
+    convert.cache_info = cached.cache_info
+    return convert
+
+
+def to_text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_nonzero_int(value):
+    """to_int() with 0 read as missing (webhook payloads)."""
+    return to_int(value) or None
+
+
+def to_nonzero_float(value):
+    """to_float() with 0 read as missing (webhook payloads)."""
+    return to_float(value) or None
+
+
+def to_bool(value):
+    number = to_int(value)
+    return None if number is None else bool(number)
+
+
+def to_datetime(value):
+    """ISO 8601 (what Qualtrics sends) via the stdlib; anything else via pandas."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        import pandas as pd
+
+        try:
+            parsed = pd.to_datetime(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if pd.isna(parsed):
+            return None
+        parsed = parsed.to_pydatetime()
+    if timezone.is_naive(parsed):
+        # Same as Django applies on save, without the naive-datetime warning
+        parsed = timezone.make_aware(parsed, timezone.get_default_timezone())
+    return parsed
+
+
+@_cached_text
+def agreement_code(text):
+    """Agreement answer (label or 1-5 code) -> 1-5."""
+    text = text.strip().lower()
+    code = AGREEMENT_SCALE.get(text)
+    if code is not None:
+        return code
+    if text.isdigit():
+        code = int(text)
+        return code if 1 <= code <= AGREEMENT_MAX else None
+    # Labels with extra wording, e.g. "Strongly agree (5)" or just "Neither"
+    for label, label_code in AGREEMENT_SCALE.items():
+        if label in text:
+            return label_code
+    return 3 if 'neither' in text else None
+
+
+@_cached_text
+def rating_code(text):
+    """Rating answer such as "2 (Fair)" or "2" -> 2; None outside 1-3."""
+    code = to_int(text.split('(')[0].strip())
+    return code if code is not None and 1 <= code <= RATING_MAX else None
+
+
+@_cached_text
+def scale_code(text):
+    """1-5 scale answer -> code; None outside 1-5."""
+    code = to_int(text.strip())
+    return code if code is not None and 1 <= code <= SCALE_MAX else None
+
+
+@_cached_text
+def survey_type_code(text):
+    """Q1.1 answer (label or code) -> 1 (starting), 2 (ending) or None."""
+    text = text.strip().lower()
+    if text.isdigit():
+        return int(text)
+    for label, code in SURVEY_TYPES.items():
+        if label in text:
+            return code
+    return None
+
+
+@_cached_text
+def topic_name(text):
+    """Topic answer -> name; legacy numeric codes are looked up in TOPIC_MAPPING."""
+    stripped = text.strip()
+    if stripped.isdigit():
+        return TOPIC_MAPPING.get(int(stripped), '')
+    return text
+
+
+def mentor_name(choice, other_text):
+    """Mentor from a mentor answer, or its "Other" text box when "Other" was chosen."""
+    choice = choice or ''
+    return other_text if choice.strip().lower() == 'other' else choice
+
+
+SCALAR_CONVERTERS = {
+    TEXT: to_text,
+    INTEGER: to_int,
+    FLOAT: to_float,
+    BOOLEAN: to_bool,
+    DATETIME: to_datetime,
+    AGREEMENT: agreement_code,
+    RATING: rating_code,
+    SCALE: scale_code,
+}
+
+# Webhooks read 0 as missing (see the module docstring)
+WEBHOOK_CONVERTERS = {
+    **SCALAR_CONVERTERS,
+    INTEGER: to_nonzero_int,
+    FLOAT: to_nonzero_float,
+}
+
+
+def _compile_webhook_steps():
+    steps = []
+    constants = {}
+    for spec in FIELDS:
+        if spec.webhook is None:
+            constants[spec.field] = spec.default
+        else:
+            steps.append((spec.field, spec.webhook, WEBHOOK_CONVERTERS[spec.kind], spec.default))
+    return steps, constants
+
+
+WEBHOOK_STEPS, WEBHOOK_CONSTANTS = _compile_webhook_steps()
+
+
+def csv_columns():
+    """Every export column read by FIELDS."""
+    columns = set()
+    for spec in FIELDS:
+        sources = spec.csv if isinstance(spec.csv, tuple) else (spec.csv,)
+        columns.update(column for column in sources if column)
+    return columns
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:13
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+
+ROLLUP_FIELDS = [
+    'rating_onboarding', 'rating_initiation', 'rating_mentorship', 'rating_team',
+    'rating_communications', 'rating_expectations', 'rating_sponsor', 'rating_workload',
+    'hard_skills_improved', 'soft_skills_improved', 'confidence_job_placement',
+    'recommend_asc',
+]
+
+
+def populate_rollups(apps, schema_editor):
+    SurveyResponse = apps.get_model('surveys', 'SurveyResponse')
+    RatingRollup = apps.get_model('surveys', 'RatingRollup')
+    expressions = {'response_count': Count('pk')}
+    for field in ROLLUP_FIELDS:
+        expressions[f'sum_{field}'] = Coalesce(Sum(field), 0)
+        expressions[f'count_{field}'] = Count(field)
+        expressions[f'sumsq_{field}'] = Coalesce(Sum(F(field) * F(field)), 0)
+    rows = (
+        SurveyResponse.objects.order_by()
+        .annotate(day=TruncDate('recorded_date'))
+        .values('day', 'survey_type', 'project_mentor', 'topic')
+        .annotate(**expressions)
+    )
+    RatingRollup.objects.bulk_create((RatingRollup(**row) for row in rows), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0002_surveyresponse_normalized_communications_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RatingRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(help_text='recorded_date in the configured time zone')),
+                ('survey_type', models.IntegerField(choices=[(1, 'Starting Project'), (2, 'Ending Project')])),
+                ('project_mentor', models.CharField(blank=True, max_length=200)),
+                ('topic', models.CharField(blank=True, max_length=200)),
+                ('response_count', models.IntegerField(default=0)),
+                ('sum_rating_onboarding', models.IntegerField(default=0)),
+                ('count_rating_onboarding', models.IntegerField(default=0)),
+                ('sumsq_rating_onboarding', models.IntegerField(default=0)),
+                ('sum_rating_initiation', models.IntegerField(default=0)),
+                ('count_rating_initiation', models.IntegerField(default=0)),
+                ('sumsq_rating_initiation', models.IntegerField(default=0)),
+                ('sum_rating_mentorship', models.IntegerField(default=0)),
+                ('count_rating_mentorship', models.IntegerField(default=0)),
+                ('sumsq_rating_mentorship', models.IntegerField(default=0)),
+                ('sum_rating_team', models.IntegerField(default=0)),
+                ('count_rating_team', models.IntegerField(default=0)),
+                ('sumsq_rating_team', models.IntegerField(default=0)),
+                ('sum_rating_communications', models.IntegerField(default=0)),
+                ('count_rating_communications', models.IntegerField(default=0)),
+                ('sumsq_rating_communications', models.IntegerField(default=0)),
+                ('sum_rating_expectations', models.IntegerField(default=0)),
+                ('count_rating_expectations', models.IntegerField(default=0)),
+                ('sumsq_rating_expectations', models.IntegerField(default=0)),
+                ('sum_rating_sponsor', models.IntegerField(default=0)),
+                ('count_rating_sponsor', models.IntegerField(default=0)),
+                ('sumsq_rating_sponsor', models.IntegerField(default=0)),
+                ('sum_rating_workload', models.IntegerField(default=0)),
+                ('count_rating_workload', models.IntegerField(default=0)),
+                ('sumsq_rating_workload', models.IntegerField(default=0)),
+                ('sum_hard_skills_improved', models.IntegerField(default=0)),
+                ('count_hard_skills_improved', models.IntegerField(default=0)),
+                ('sumsq_hard_skills_improved', models.IntegerField(default=0)),
+                ('sum_soft_skills_improved', models.IntegerField(default=0)),
+                ('count_soft_skills_improved', models.IntegerField(default=0)),
+                ('sumsq_soft_skills_improved', models.IntegerField(default=0)),
+                ('sum_confidence_job_placement', models.IntegerField(default=0)),
+                ('count_confidence_job_placement', models.IntegerField(default=0)),
+                ('sumsq_confidence_job_placement', models.IntegerField(default=0)),
+                ('sum_recommend_asc', models.IntegerField(default=0)),
+                ('count_recommend_asc', models.IntegerField(default=0)),
+                ('sumsq_recommend_asc', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Rating Rollup',
+                'verbose_name_plural': 'Rating Rollups',
+                'ordering': ['day'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'survey_type', 'project_mentor', 'topic'), name='unique_rating_rollup_bucket')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
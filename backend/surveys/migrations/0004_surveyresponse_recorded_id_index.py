@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0003_ratingrollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['recorded_date', 'id'], name='surveyresp_recorded_id_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0004_surveyresponse_recorded_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ratingrollup',
+            index=models.Index(fields=['survey_type', 'day'], name='rollup_type_day_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey_type', 'recorded_date'], name='surveyresp_type_recorded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey_type', 'project_mentor', 'recorded_date'], name='surveyresp_type_mentor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['survey_type', 'topic', 'recorded_date'], name='surveyresp_type_topic_idx'),
+        ),
+    ]
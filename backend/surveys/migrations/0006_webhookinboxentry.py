@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0005_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WebhookInboxEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('payload', models.JSONField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processed', 'Processed'), ('skipped', 'Skipped (not an ending survey)'), ('dead', 'Dead letter')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('response_id', models.CharField(blank=True, help_text='SurveyResponse written for this payload', max_length=100)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Webhook Inbox Entry',
+                'verbose_name_plural': 'Webhook Inbox Entries',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'id'], name='inbox_status_id_idx')],
+            },
+        ),
+    ]
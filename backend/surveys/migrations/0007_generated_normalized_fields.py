@@ -0,0 +1,48 @@
+# Normalized columns become stored generated columns. A regular column cannot be
+# altered into a generated one, so each is dropped and added back; adding a stored
+# generated column computes it for every existing row, which is the backfill.
+
+from django.db import migrations, models
+
+# Normalized field -> (source field, scale max); all scales start at 1
+NORMALIZED_FIELDS = {
+    'normalized_hard_skills': ('hard_skills_improved', 5, 'Normalized Q3.9 (-1 to 1)'),
+    'normalized_soft_skills': ('soft_skills_improved', 5, 'Normalized Q3.10 (-1 to 1)'),
+    'normalized_confidence': ('confidence_job_placement', 5, 'Normalized Q3.11 (-1 to 1)'),
+    'normalized_onboarding': ('rating_onboarding', 3, 'Normalized Q3.12_1 (-1 to 1)'),
+    'normalized_initiation': ('rating_initiation', 3, 'Normalized Q3.12_2 (-1 to 1)'),
+    'normalized_mentorship': ('rating_mentorship', 3, 'Normalized Q3.12_3 (-1 to 1)'),
+    'normalized_team': ('rating_team', 3, 'Normalized Q3.12_4 (-1 to 1)'),
+    'normalized_communications': ('rating_communications', 3, 'Normalized Q3.12_5 (-1 to 1)'),
+    'normalized_expectations': ('rating_expectations', 3, 'Normalized Q3.12_6 (-1 to 1)'),
+    'normalized_sponsor': ('rating_sponsor', 3, 'Normalized Q3.12_7 (-1 to 1)'),
+    'normalized_workload': ('rating_workload', 3, 'Normalized Q3.12_8 (-1 to 1)'),
+}
+
+
+def _generated(source, max_val, help_text):
+    return models.GeneratedField(
+        expression=(models.F(source) - 1) * 2.0 / (max_val - 1) - 1,
+        output_field=models.FloatField(blank=True, null=True),
+        db_persist=True,
+        help_text=help_text,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0006_webhookinboxentry'),
+    ]
+
+    operations = [
+        migrations.RemoveField(model_name='surveyresponse', name=name)
+        for name in NORMALIZED_FIELDS
+    ] + [
+        migrations.AddField(
+            model_name='surveyresponse',
+            name=name,
+            field=_generated(source, max_val, help_text),
+        )
+        for name, (source, max_val, help_text) in NORMALIZED_FIELDS.items()
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0007_generated_normalized_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='webhookinboxentry',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='Earliest retry after a failed write', null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0008_webhookinboxentry_next_attempt_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ratingrollup',
+            index=models.Index(fields=['survey_type', 'project_mentor', 'day'], name='rollup_type_mentor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ratingrollup',
+            index=models.Index(fields=['survey_type', 'topic', 'day'], name='rollup_type_topic_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['project_mentor', 'recorded_date', 'id'], name='surveyresp_mentor_recorded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['topic', 'recorded_date', 'id'], name='surveyresp_topic_recorded_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('surveys', '0010_normalize_ending_surveys_only'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='surveyresponse',
+            index=models.Index(fields=['updated_at'], name='surveyresp_updated_idx'),
+        ),
+    ]
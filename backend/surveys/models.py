@@ -1,8 +1,28 @@
 from django.db import models
+from django.db.models import Case, F, When
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
 
 
+def normalized_field(source, max_val, help_text, min_val=1):
+    """
+    A stored column holding source rescaled from min_val..max_val to -1..1, computed by
+    the database on every write, so bulk_create, bulk_update and QuerySet.update() keep it
+    current too. Only ending surveys are normalized (as save() used to); the column is NULL
+    for starting surveys and when source is NULL.
+    """
+    return models.GeneratedField(
+        expression=Case(
+            When(survey_type=2, then=(F(source) - min_val) * 2.0 / (max_val - min_val) - 1),
+            default=None,
+            output_field=models.FloatField(),
+        ),
+        output_field=models.FloatField(null=True, blank=True),
+        db_persist=True,
+        help_text=help_text,
+    )
+
+
 class SurveyResponse(models.Model):
     """Main model for storing ASC survey responses"""
     
@@ -123,24 +143,39 @@ class SurveyResponse(models.Model):
     # Additional feedback
     additional_comments_ending = models.TextField(blank=True)
     
-    # Normalized fields (scaled from -1 to 1)
-    normalized_hard_skills = models.FloatField(null=True, blank=True, help_text="Normalized Q3.9 (-1 to 1)")
-    normalized_soft_skills = models.FloatField(null=True, blank=True, help_text="Normalized Q3.10 (-1 to 1)")
-    normalized_confidence = models.FloatField(null=True, blank=True, help_text="Normalized Q3.11 (-1 to 1)")
-    normalized_onboarding = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_1 (-1 to 1)")
-    normalized_initiation = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_2 (-1 to 1)")
-    normalized_mentorship = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_3 (-1 to 1)")
-    normalized_team = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_4 (-1 to 1)")
-    normalized_communications = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_5 (-1 to 1)")
-    normalized_expectations = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_6 (-1 to 1)")
-    normalized_sponsor = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_7 (-1 to 1)")
-    normalized_workload = models.FloatField(null=True, blank=True, help_text="Normalized Q3.12_8 (-1 to 1)")
+    # Normalized fields (scaled from -1 to 1), generated by the database
+    normalized_hard_skills = normalized_field('hard_skills_improved', 5, "Normalized Q3.9 (-1 to 1)")
+    normalized_soft_skills = normalized_field('soft_skills_improved', 5, "Normalized Q3.10 (-1 to 1)")
+    normalized_confidence = normalized_field('confidence_job_placement', 5, "Normalized Q3.11 (-1 to 1)")
+    normalized_onboarding = normalized_field('rating_onboarding', 3, "Normalized Q3.12_1 (-1 to 1)")
+    normalized_initiation = normalized_field('rating_initiation', 3, "Normalized Q3.12_2 (-1 to 1)")
+    normalized_mentorship = normalized_field('rating_mentorship', 3, "Normalized Q3.12_3 (-1 to 1)")
+    normalized_team = normalized_field('rating_team', 3, "Normalized Q3.12_4 (-1 to 1)")
+    normalized_communications = normalized_field('rating_communications', 3, "Normalized Q3.12_5 (-1 to 1)")
+    normalized_expectations = normalized_field('rating_expectations', 3, "Normalized Q3.12_6 (-1 to 1)")
+    normalized_sponsor = normalized_field('rating_sponsor', 3, "Normalized Q3.12_7 (-1 to 1)")
+    normalized_workload = normalized_field('rating_workload', 3, "Normalized Q3.12_8 (-1 to 1)")
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['-recorded_date']
+        indexes = [
+            # Keyset pagination on /responses/ (newest first)
+            models.Index(fields=['recorded_date', 'id'], name='surveyresp_recorded_id_idx'),
+            # Dashboard queries: survey type plus an optional date range
+            models.Index(fields=['survey_type', 'recorded_date'], name='surveyresp_type_recorded_idx'),
+            # Exact-match mentor/topic filters, optionally with a date range
+            models.Index(fields=['survey_type', 'project_mentor', 'recorded_date'], name='surveyresp_type_mentor_idx'),
+            models.Index(fields=['survey_type', 'topic', 'recorded_date'], name='surveyresp_type_topic_idx'),
+            # The same filters on /responses/ (every survey type, newest first)
+            models.Index(fields=['project_mentor', 'recorded_date', 'id'], name='surveyresp_mentor_recorded_idx'),
+            models.Index(fields=['topic', 'recorded_date', 'id'], name='surveyresp_topic_recorded_idx'),
+            # Data version for conditional GET and the dashboard cache: Max(updated_at) is
+            # one index seek and the row count scans this narrow index
+            models.Index(fields=['updated_at'], name='surveyresp_updated_idx'),
+        ]
         verbose_name = "Survey Response"
         verbose_name_plural = "Survey Responses"
     
@@ -167,18 +202,6 @@ class SurveyResponse(models.Model):
         # we can just return that field instead of mapping from integers
         return self.topic or ''
     
-    def normalize_value(self, value, min_val=1, max_val=5):
-        """Normalize value from min_val-max_val range to -1 to 1"""
-        if value is None:
-            return None
-        return 2 * (value - min_val) / (max_val - min_val) - 1
-    
-    def normalize_rating(self, value, min_val=1, max_val=3):
-        """Normalize rating from min_val-max_val range to -1 to 1"""
-        if value is None:
-            return None
-        return 2 * (value - min_val) / (max_val - min_val) - 1
-    
     def save(self, *args, **kwargs):
         # Auto-populate project_mentor and topic fields with string values
         # For starting surveys, use Q2.3 (mentor) and Q2.6 (topic)
@@ -188,33 +211,6 @@ class SurveyResponse(models.Model):
         
         # Topic is already set directly from the webhook data
         
-        # Auto-populate normalized fields for ending surveys
-        if self.survey_type == 2:
-            if self.hard_skills_improved is not None:
-                self.normalized_hard_skills = self.normalize_value(self.hard_skills_improved)
-            if self.soft_skills_improved is not None:
-                self.normalized_soft_skills = self.normalize_value(self.soft_skills_improved)
-            if self.confidence_job_placement is not None:
-                self.normalized_confidence = self.normalize_value(self.confidence_job_placement)
-            
-            # Normalize rating fields
-            if self.rating_onboarding is not None:
-                self.normalized_onboarding = self.normalize_rating(self.rating_onboarding)
-            if self.rating_initiation is not None:
-                self.normalized_initiation = self.normalize_rating(self.rating_initiation)
-            if self.rating_mentorship is not None:
-                self.normalized_mentorship = self.normalize_rating(self.rating_mentorship)
-            if self.rating_team is not None:
-                self.normalized_team = self.normalize_rating(self.rating_team)
-            if self.rating_communications is not None:
-                self.normalized_communications = self.normalize_rating(self.rating_communications)
-            if self.rating_expectations is not None:
-                self.normalized_expectations = self.normalize_rating(self.rating_expectations)
-            if self.rating_sponsor is not None:
-                self.normalized_sponsor = self.normalize_rating(self.rating_sponsor)
-            if self.rating_workload is not None:
-                self.normalized_workload = self.normalize_rating(self.rating_workload)
-        
         super().save(*args, **kwargs)
 
 
@@ -234,3 +230,84 @@ class SurveyChoice(models.Model):
     def __str__(self):
         return f"{self.question_id}: {self.choice_value} - {self.choice_text}"
 
+
+
+# Response fields summarized in RatingRollup (sum, count and sum of squares each)
+ROLLUP_FIELDS = [
+    'rating_onboarding', 'rating_initiation', 'rating_mentorship', 'rating_team',
+    'rating_communications', 'rating_expectations', 'rating_sponsor', 'rating_workload',
+    'hard_skills_improved', 'soft_skills_improved', 'confidence_job_placement',
+    'recommend_asc',
+]
+
+
+class RatingRollup(models.Model):
+    """Pre-aggregated ratings per (day, survey type, mentor, topic) bucket"""
+    
+    day = models.DateField(help_text="recorded_date in the configured time zone")
+    survey_type = models.IntegerField(choices=[(1, 'Starting Project'), (2, 'Ending Project')])
+    project_mentor = models.CharField(max_length=200, blank=True)
+    topic = models.CharField(max_length=200, blank=True)
+    response_count = models.IntegerField(default=0)
+    
+    class Meta:
+        ordering = ['day']
+        indexes = [
+            models.Index(fields=['survey_type', 'day'], name='rollup_type_day_idx'),
+            models.Index(fields=['survey_type', 'project_mentor', 'day'], name='rollup_type_mentor_idx'),
+            models.Index(fields=['survey_type', 'topic', 'day'], name='rollup_type_topic_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'survey_type', 'project_mentor', 'topic'],
+                name='unique_rating_rollup_bucket',
+            ),
+        ]
+        verbose_name = "Rating Rollup"
+        verbose_name_plural = "Rating Rollups"
+    
+    def __str__(self):
+        return f"{self.day} - {self.get_survey_type_display()} - {self.project_mentor} - {self.topic}"
+
+
+# sum_<field>, count_<field> (non-null values) and sumsq_<field> for every rollup field
+for _field in ROLLUP_FIELDS:
+    RatingRollup.add_to_class(f'sum_{_field}', models.IntegerField(default=0))
+    RatingRollup.add_to_class(f'count_{_field}', models.IntegerField(default=0))
+    RatingRollup.add_to_class(f'sumsq_{_field}', models.IntegerField(default=0))
+del _field
+
+
+class WebhookInboxEntry(models.Model):
+    """Raw Qualtrics webhook payload, stored on receipt and processed by drain_webhook_inbox"""
+    
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSED = 'processed'
+    STATUS_SKIPPED = 'skipped'
+    STATUS_DEAD = 'dead'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSED, 'Processed'),
+        (STATUS_SKIPPED, 'Skipped (not an ending survey)'),
+        (STATUS_DEAD, 'Dead letter'),
+    ]
+    
+    received_at = models.DateTimeField(auto_now_add=True)
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    response_id = models.CharField(max_length=100, blank=True, help_text="SurveyResponse written for this payload")
+    processed_at = models.DateTimeField(null=True, blank=True)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, help_text="Earliest retry after a failed write")
+    
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'id'], name='inbox_status_id_idx'),
+        ]
+        verbose_name = "Webhook Inbox Entry"
+        verbose_name_plural = "Webhook Inbox Entries"
+    
+    def __str__(self):
+        return f"#{self.pk} {self.status} ({self.received_at})"
@@ -0,0 +1,139 @@
+"""Keyset (cursor) pagination for survey responses."""
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class RecordedDateKeysetPagination(BasePagination):
+    """
+    Newest-first pages positioned on (recorded_date, id).
+
+    Each page is one indexed range scan (see the surveyresp_recorded_id_idx index), with
+    no COUNT(*) and no OFFSET, so page 500 costs the same as page 1. Cursors are opaque
+    tokens carrying the boundary row of the previous page.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    invalid_cursor_message = 'Invalid cursor'
+
+    @classmethod
+    def requested(cls, request):
+        """Keyset mode is used for ?cursor=... or ?pagination=cursor."""
+        return cls.cursor_query_param in request.query_params or request.query_params.get('pagination') == 'cursor'
+
+    def get_page_size(self, request):
+        default = settings.REST_FRAMEWORK.get('PAGE_SIZE') or 100
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, default))
+        except (TypeError, ValueError):
+            return default
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, row, reverse):
+        # Attribute access only, so pages of values_list(named=True) rows work too
+        payload = {'d': row.recorded_date.isoformat(), 'i': row.id, 'r': reverse}
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        return token.decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            recorded_date = parse_datetime(payload['d'])
+            pk = int(payload['i'])
+            reverse = bool(payload['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if recorded_date is None:
+            raise NotFound(self.invalid_cursor_message)
+        return recorded_date, pk, reverse
+
+    def _page_queryset(self, queryset, request):
+        """(queryset of page_size + 1 rows, page_size, cursor) for the requested page."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        queryset = queryset.order_by()
+
+        if cursor is None:
+            queryset = queryset.order_by('-recorded_date', '-id')
+        else:
+            recorded_date, pk, reverse = cursor
+            # (recorded_date, id) past the boundary row. The plain range on recorded_date
+            # lets SQLite seek the index; the OR only settles ties on the boundary date.
+            if reverse:
+                # Rows newer than the first row of the page we came from
+                queryset = queryset.filter(recorded_date__gte=recorded_date).filter(
+                    Q(recorded_date__gt=recorded_date) | Q(id__gt=pk)
+                ).order_by('recorded_date', 'id')
+            else:
+                queryset = queryset.filter(recorded_date__lte=recorded_date).filter(
+                    Q(recorded_date__lt=recorded_date) | Q(id__lt=pk)
+                ).order_by('-recorded_date', '-id')
+        return queryset[:page_size + 1], page_size, cursor
+
+    def _set_page(self, rows, page_size, cursor):
+        reverse = cursor is not None and cursor[2]
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        if reverse:
+            self.has_next = cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+        return rows
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, page_size, cursor = self._page_queryset(queryset, request)
+        return self._set_page(list(queryset), page_size, cursor)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(self.page[-1], reverse=False)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(self.page[0], reverse=True)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
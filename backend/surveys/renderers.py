@@ -0,0 +1,119 @@
+"""
+Renderers for bulk survey response output: streamed exports (CSV, NDJSON) and the
+compact alternatives to JSON offered by the response list (columnar JSON, MessagePack).
+"""
+
+import csv
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+import msgpack
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class _Echo:
+    """File-like object whose write() returns the text, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _plain(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Renders rows of values for a fixed column list. Exports call stream() to produce a
+    StreamingHttpResponse body; render() covers the non-streamed responses DRF sends
+    through the same renderer (errors, mostly) by treating the data as rows of dicts.
+    """
+    charset = 'utf-8'
+
+    def stream(self, columns, rows):
+        raise NotImplementedError
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        records = data if isinstance(data, list) else [data]
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        rows = ([record.get(column) for column in columns] for record in records)
+        return ''.join(self.stream(columns, rows)).encode(self.charset)
+
+
+class CSVRenderer(StreamingRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+    def stream(self, columns, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([_plain(value) for value in row])
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """One JSON object per line."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def stream(self, columns, rows):
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row)), default=_plain) + '\n'
+
+
+def _columns(records):
+    """{field: [value per record]}; field names are listed once instead of per row."""
+    fields = list(dict.fromkeys(key for record in records for key in record))
+    return {field: [record.get(field) for record in records] for field in fields}
+
+
+def _columnar(data):
+    """data with its list of records (bare, or in a page's 'results') turned into columns."""
+    if isinstance(data, list):
+        return _columns(data)
+    if isinstance(data, dict) and isinstance(data.get('results'), list):
+        return {**data, 'results': _columns(data['results'])}
+    return data
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    JSON with the records as one array per field: [{"id": 1, "topic": "x"}, ...] becomes
+    {"id": [1, ...], "topic": ["x", ...]}. Pages keep count/next/previous around it.
+    """
+    media_type = 'application/vnd.asc.columnar+json'
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(_columnar(data), accepted_media_type, renderer_context)
+
+
+def _msgpack_default(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f'Cannot serialize {type(value).__name__} to MessagePack')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """The same structure as the JSON responses, encoded as MessagePack."""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+
+
+# Offered by the response list; JSON stays the default
+LIST_RENDERERS = [JSONRenderer, ColumnarJSONRenderer, MessagePackRenderer]
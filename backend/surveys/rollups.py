@@ -0,0 +1,118 @@
+"""
+Maintenance of the RatingRollup table.
+
+Rollups are refreshed per day: every bucket of an affected day is re-aggregated from
+SurveyResponse and replaced. That keeps buckets exact when an update moves a response
+to another mentor, topic or date, and makes every refresh idempotent.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import ROLLUP_FIELDS, RatingRollup, SurveyResponse
+
+KEY_FIELDS = ('day', 'survey_type', 'project_mentor', 'topic')
+
+# Days refreshed per statement, to stay well under SQLite's bound-parameter limit
+DAY_CHUNK_SIZE = 200
+
+_deferred = threading.local()
+
+
+def _bucket_expressions():
+    expressions = {'response_count': Count('pk')}
+    for field in ROLLUP_FIELDS:
+        expressions[f'sum_{field}'] = Coalesce(Sum(field), 0)
+        expressions[f'count_{field}'] = Count(field)
+        expressions[f'sumsq_{field}'] = Coalesce(Sum(F(field) * F(field)), 0)
+    return expressions
+
+
+def aggregate_buckets(queryset):
+    """Group SurveyResponse rows into rollup buckets (one dict per bucket)."""
+    return (
+        queryset.order_by()
+        .annotate(day=TruncDate('recorded_date'))
+        .values(*KEY_FIELDS)
+        .annotate(**_bucket_expressions())
+    )
+
+
+def rollup_day(recorded_date):
+    """The rollup day of a recorded_date value, as stored by SurveyResponse.save()."""
+    if recorded_date is None:
+        return None
+    if isinstance(recorded_date, str):
+        recorded_date = parse_datetime(recorded_date)
+        if recorded_date is None:
+            return None
+    if not isinstance(recorded_date, datetime):
+        return None
+    if timezone.is_naive(recorded_date):
+        recorded_date = timezone.make_aware(recorded_date)
+    return timezone.localdate(recorded_date)
+
+
+def _days_filter(days):
+    """
+    Responses recorded on the given (sorted) days. The half-open range over the whole
+    span can use the recorded_date index; __date__in alone would scan the table.
+    """
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(days[0], time.min), tz)
+    end = timezone.make_aware(datetime.combine(days[-1] + timedelta(days=1), time.min), tz)
+    return Q(recorded_date__gte=start, recorded_date__lt=end, recorded_date__date__in=days)
+
+
+@contextmanager
+def deferred_rollup_refresh():
+    """
+    Collect the days passed to refresh_rollup_days() inside the block and refresh each
+    once on exit, for callers saving many responses one at a time (the save signals
+    would otherwise re-aggregate the same day for every row). Nothing is refreshed if
+    the block raises.
+    """
+    if getattr(_deferred, 'days', None) is not None:
+        # Already deferred by an outer block, which will do the refresh
+        yield
+        return
+    _deferred.days = days = set()
+    try:
+        yield
+    finally:
+        _deferred.days = None
+    refresh_rollup_days(days)
+
+
+def refresh_rollup_days(days):
+    """Recompute every rollup bucket for the given days from SurveyResponse."""
+    days = sorted({day for day in days if day is not None})
+    pending = getattr(_deferred, 'days', None)
+    if pending is not None:
+        pending.update(days)
+        return
+    for start in range(0, len(days), DAY_CHUNK_SIZE):
+        chunk = days[start:start + DAY_CHUNK_SIZE]
+        with transaction.atomic():
+            buckets = [
+                RatingRollup(**row)
+                for row in aggregate_buckets(SurveyResponse.objects.filter(_days_filter(chunk)))
+            ]
+            RatingRollup.objects.filter(day__in=chunk).delete()
+            RatingRollup.objects.bulk_create(buckets)
+
+
+def rebuild_rollups():
+    """Regenerate the whole rollup table. Returns the number of buckets written."""
+    with transaction.atomic():
+        RatingRollup.objects.all().delete()
+        buckets = [RatingRollup(**row) for row in aggregate_buckets(SurveyResponse.objects.all())]
+        RatingRollup.objects.bulk_create(buckets, batch_size=500)
+    return len(buckets)
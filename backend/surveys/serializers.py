@@ -1,3 +1,5 @@
+import re
+
 from django.contrib.auth import get_user_model
 from decouple import config
 from rest_framework import serializers
@@ -12,7 +14,68 @@ class SurveyChoiceSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class SurveyResponseSerializer(serializers.ModelSerializer):
+# Columns the database computes (the normalized ratings)
+GENERATED_FIELDS = [field.attname for field in SurveyResponse._meta.concrete_fields if field.generated]
+
+# get_FOO_display sources read the FOO column
+_DISPLAY_SOURCE_RE = re.compile(r'get_(\w+)_display')
+
+
+def display_source(source):
+    """FOO for a get_FOO_display serializer source, otherwise None."""
+    match = _DISPLAY_SOURCE_RE.fullmatch(source)
+    return match.group(1) if match else None
+
+
+def _split_names(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer whose output can be limited to a subset of its fields (sparse fieldsets):
+    pass fields=[...] to keep only those, omit=[...] to drop some. Views take both from
+    ?fields=a,b and ?omit=c via parse_fieldset(), and restrict the query to the matching
+    columns with model_fields().
+    """
+
+    def __init__(self, *args, fields=None, omit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = set(self.fields) if fields is None else set(fields)
+        keep -= set(omit or ())
+        for name in list(self.fields):
+            if name not in keep:
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fieldset(cls, params):
+        """
+        (fields, omit) from ?fields= / ?omit= (None when absent or empty); ValidationError
+        for names the serializer does not have.
+        """
+        available = set(cls().fields)
+        fieldset = {}
+        for param in ('fields', 'omit'):
+            names = _split_names(params.get(param)) or None
+            unknown = [name for name in names or () if name not in available]
+            if unknown:
+                raise serializers.ValidationError({param: f'Unknown fields: {", ".join(unknown)}'})
+            fieldset[param] = names
+        return fieldset['fields'], fieldset['omit']
+
+    @classmethod
+    def model_fields(cls, fields=None, omit=None):
+        """Names of the model columns the restricted serializer reads, for QuerySet.only()."""
+        columns = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        needed = []
+        for field in cls(fields=fields, omit=omit).fields.values():
+            source = display_source(field.source) or field.source.split('.')[0]
+            if source in columns:
+                needed.append(source)
+        return list(dict.fromkeys(needed))
+
+
+class SurveyResponseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     survey_type_display = serializers.CharField(source='get_survey_type_display', read_only=True)
     
     class Meta:
@@ -20,8 +83,14 @@ class SurveyResponseSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['created_at', 'updated_at']
 
+    def save(self, **kwargs):
+        instance = super().save(**kwargs)
+        # The normalized columns were computed by the database during the write
+        instance.refresh_from_db(fields=GENERATED_FIELDS)
+        return instance
+
 
-class SurveyResponseListSerializer(serializers.ModelSerializer):
+class SurveyResponseListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Simplified serializer for list views"""
     survey_type_display = serializers.CharField(source='get_survey_type_display', read_only=True)
     
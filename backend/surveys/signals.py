@@ -0,0 +1,32 @@
+"""Keep the rating rollups in step with SurveyResponse save()/delete()."""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import SurveyResponse
+from .rollups import refresh_rollup_days, rollup_day
+
+
+@receiver(pre_save, sender=SurveyResponse)
+def remember_previous_rollup_day(sender, instance, raw=False, **kwargs):
+    """An update may move the response to another day; that day's buckets need refreshing too."""
+    instance._previous_rollup_day = None
+    if raw or instance.pk is None:
+        return
+    previous = SurveyResponse.objects.filter(pk=instance.pk).values_list('recorded_date', flat=True).first()
+    instance._previous_rollup_day = rollup_day(previous)
+
+
+@receiver(post_save, sender=SurveyResponse)
+def refresh_rollups_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_rollup_days({
+        getattr(instance, '_previous_rollup_day', None),
+        rollup_day(instance.recorded_date),
+    })
+
+
+@receiver(post_delete, sender=SurveyResponse)
+def refresh_rollups_on_delete(sender, instance, **kwargs):
+    refresh_rollup_days({rollup_day(instance.recorded_date)})
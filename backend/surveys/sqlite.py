@@ -0,0 +1,54 @@
+"""
+SQLite connection tuning.
+
+apply_pragmas() runs on every new database connection (connected in SurveysConfig.ready)
+and applies settings.SQLITE_PRAGMAS. With CONN_MAX_AGE the cost is paid once per worker
+thread rather than once per request.
+
+On Django versions without the transaction_mode database option (before 5.1) it also
+makes the connection begin transactions with settings.SQLITE_TRANSACTION_MODE.
+"""
+
+import re
+
+import django
+from django.conf import settings
+
+# PRAGMA values are interpolated into SQL, so only plain words and numbers are accepted
+_PRAGMA_VALUE = re.compile(r'-?\w+')
+
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+
+def pragma_statements(pragmas):
+    """PRAGMA statements for a {name: value} mapping, skipping empty values."""
+    statements = []
+    for name, value in pragmas.items():
+        value = str(value).strip()
+        if not value:
+            continue
+        if not _PRAGMA_VALUE.fullmatch(name) or not _PRAGMA_VALUE.fullmatch(value):
+            raise ValueError(f'Invalid SQLite pragma {name}={value!r}')
+        statements.append(f'PRAGMA {name} = {value}')
+    return statements
+
+
+def apply_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+            cursor.execute(statement)
+    if django.VERSION < (5, 1) and settings.SQLITE_TRANSACTION_MODE:
+        use_transaction_mode(connection, settings.SQLITE_TRANSACTION_MODE)
+
+
+def use_transaction_mode(connection, mode):
+    """Begin connection's transactions with BEGIN <mode> (Django 5.1's transaction_mode)."""
+    if mode not in TRANSACTION_MODES:
+        raise ValueError(f'Invalid SQLite transaction mode {mode!r}')
+
+    def start_transaction_under_autocommit():
+        connection.cursor().execute(f'BEGIN {mode}')
+
+    connection._start_transaction_under_autocommit = start_transaction_under_autocommit
@@ -13,6 +13,7 @@ urlpatterns = [
     
     # Survey responses
     path('responses/', views.SurveyResponseListCreateView.as_view(), name='survey-response-list'),
+    path('responses/export/', views.export_responses, name='survey-response-export'),
     path('responses/<int:pk>/', views.SurveyResponseDetailView.as_view(), name='survey-response-detail'),
     
     # Survey choices
@@ -23,9 +24,14 @@ urlpatterns = [
     
     # Webhook endpoint for Qualtrics
     path('webhook/qualtrics/', views.qualtrics_webhook, name='qualtrics-webhook'),
+    path('webhook/qualtrics/batch/', views.qualtrics_webhook_batch, name='qualtrics-webhook-batch'),
     
     # Dashboard endpoints
     path('dashboard/stats/', views.dashboard_stats, name='dashboard-stats'),
     path('dashboard/analytics/', views.survey_analytics, name='survey-analytics'),
+    path('dashboard/summary/', views.dashboard_summary, name='dashboard-summary'),
+    path('dashboard/facets/', views.dashboard_facets, name='dashboard-facets'),
+    path('dashboard/trends/', views.dashboard_trends, name='dashboard-trends'),
+    path('dashboard/cache/', views.dashboard_cache_stats, name='dashboard-cache-stats'),
     path('available-data/', views.available_data, name='available-data'),
 ]
@@ -1,19 +1,37 @@
 import logging
-import pandas as pd
 import hmac
 from decouple import config
 from django.conf import settings as django_settings
-from django.db import transaction
 from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from rest_framework import generics, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 from .jwt_cookies import set_jwt_cookies, clear_jwt_cookies
+from .aggregation import GROUP_BY_CHOICES, TREND_INTERVALS
+from .cache import cache_counters
+from .conditional import (
+    ConditionalGetMixin,
+    conditional_get,
+    survey_choices_version,
+    survey_response_version,
+    survey_responses_version,
+)
+from .compression import negotiate, set_content_encoding
+from .dashboard import ANALYTICS_MODES, cached_body, prewarm_dashboard_cache
+from .export import buffered, export_rows, parse_columns
+from .filters import apply_filters
+from .inbox import enqueue_payload
+from .listing import ListJSONWriter
+from .ingest import DEFAULT_CHUNK_SIZE, ingest_payloads, iter_payloads, stream_results_json
 from .models import SurveyResponse, SurveyChoice
+from .pagination import RecordedDateKeysetPagination
+from .renderers import LIST_RENDERERS, CSVRenderer, NDJSONRenderer
 from .serializers import (
     SurveyResponseSerializer,
     SurveyResponseListSerializer,
@@ -21,10 +39,13 @@ from .serializers import (
     QualtricsImportSerializer,
     DashboardTokenObtainPairSerializer,
 )
-from datetime import datetime
+from .webhook import payload_from_request
 
 logger = logging.getLogger(__name__)
 
+# Largest ?window= accepted by dashboard_trends (a year of weekly buckets)
+MAX_TREND_WINDOW = 52
+
 
 def _http_header_value(request, header_name):
     """Resolve a request header the way Django exposes it in META."""
@@ -112,61 +133,129 @@ def logout_view(request):
     return response
 
 
-def apply_filters(queryset, filters):
-    """Apply filters to the queryset based on request parameters"""
-    if filters.get('mentor'):
-        # Filter by mentor using project_mentor field
-        queryset = queryset.filter(project_mentor__icontains=filters['mentor'])
-    
-    if filters.get('topic'):
-        # Filter by topic using topic field
-        queryset = queryset.filter(topic__icontains=filters['topic'])
-    
-    if filters.get('projectName'):
-        queryset = queryset.filter(project_title__icontains=filters['projectName'])
-    
-    if filters.get('startDate'):
-        try:
-            start_date = datetime.strptime(filters['startDate'], '%Y-%m-%d').date()
-            queryset = queryset.filter(recorded_date__date__gte=start_date)
-        except ValueError:
-            pass
-    
-    if filters.get('endDate'):
-        try:
-            end_date = datetime.strptime(filters['endDate'], '%Y-%m-%d').date()
-            queryset = queryset.filter(recorded_date__date__lte=end_date)
-        except ValueError:
-            pass
-    
-    return queryset
+def _cached_response(request, endpoint):
+    """
+    A dashboard endpoint's cached JSON, compressed for the client when large enough.
+    Keyed on the data version conditional_get built the ETag from, so the body always
+    matches its validators.
+    """
+    (body, coding), hit = cached_body(endpoint, request.GET, negotiate(request), request.data_version)
+    response = HttpResponse(body, content_type=JSONRenderer.media_type)
+    set_content_encoding(response, coding)
+    response['X-Cache'] = 'HIT' if hit else 'MISS'
+    return response
 
 
-class SurveyResponseListCreateView(generics.ListCreateAPIView):
-    """List all survey responses or create a new one"""
+class SurveyResponseListCreateView(ConditionalGetMixin, generics.ListCreateAPIView):
+    """
+    List all survey responses or create a new one.
+    JSON by default; columnar JSON or MessagePack via Accept or ?format=columnar|msgpack.
+    ?fields=a,b / ?omit=c limit the fields returned and the columns read
+    """
     queryset = SurveyResponse.objects.all()  # Both starting and ending surveys
+    conditional_scope = 'responses'
+    renderer_classes = LIST_RENDERERS
+    
+    def get_data_version(self):
+        return survey_responses_version()
+    
+    @property
+    def paginator(self):
+        """Keyset pagination on request (?cursor= / ?pagination=cursor), page numbers otherwise."""
+        if not hasattr(self, '_paginator'):
+            if self.request is not None and RecordedDateKeysetPagination.requested(self.request):
+                self._paginator = RecordedDateKeysetPagination()
+            else:
+                self._paginator = self.pagination_class() if self.pagination_class else None
+        return self._paginator
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method == 'GET':
+            queryset = apply_filters(queryset, self.request.query_params)
+        return queryset
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return SurveyResponseListSerializer
         return SurveyResponseSerializer
+    
+    def list(self, request, *args, **kwargs):
+        fields, omit = SurveyResponseListSerializer.parse_fieldset(request.query_params)
+        queryset = self.filter_queryset(self.get_queryset())
+        if request.accepted_renderer.format != 'json':
+            if fields is not None or omit is not None:
+                # Pages are ordered (and cursors keyed) on recorded_date, so it is always read
+                queryset = queryset.only(*SurveyResponseListSerializer.model_fields(fields, omit), 'recorded_date')
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                return Response(self.get_serializer(queryset, many=True, fields=fields, omit=omit).data)
+            serializer = self.get_serializer(page, many=True, fields=fields, omit=omit)
+            return self.get_paginated_response(serializer.data)
+        
+        # JSON is written straight from value tuples, without model instances (listing.py)
+        writer = ListJSONWriter(fields, omit)
+        columns = writer.columns + [name for name in ('id', 'recorded_date') if name not in writer.columns]
+        queryset = queryset.values_list(*columns, named=True)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            body = writer.render(queryset)
+        else:
+            body = writer.render(page, envelope=self.get_paginated_response([]).data)
+        return HttpResponse(body, content_type=request.accepted_renderer.media_type)
+
+
+@api_view(['GET'])
+@renderer_classes([CSVRenderer, NDJSONRenderer])
+def export_responses(request):
+    """
+    Stream the filtered responses as CSV (default) or NDJSON, chosen with ?format= or
+    Accept. Accepts the dashboard filters plus ?columns=a,b,c; the header goes out
+    before the query runs and rows follow as the database cursor produces them.
+    """
+    columns = parse_columns(request.query_params.get('columns'))
+    renderer = request.accepted_renderer
+    rows = export_rows(request.query_params, columns)
+    response = StreamingHttpResponse(
+        buffered(renderer.stream(columns, rows)),
+        content_type=f'{renderer.media_type}; charset={renderer.charset}',
+    )
+    response['Content-Disposition'] = f'attachment; filename="survey_responses.{renderer.format}"'
+    return response
 
 
-class SurveyResponseDetailView(generics.RetrieveUpdateDestroyAPIView):
-    """Retrieve, update or delete a survey response"""
+class SurveyResponseDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
+    """Retrieve (limited by ?fields= / ?omit= like the list), update or delete a survey response"""
     queryset = SurveyResponse.objects.all()
     serializer_class = SurveyResponseSerializer
+    conditional_scope = 'response'
+    
+    def get_data_version(self):
+        return survey_response_version(self.kwargs['pk'])
+    
+    def retrieve(self, request, *args, **kwargs):
+        fields, omit = SurveyResponseSerializer.parse_fieldset(request.query_params)
+        queryset = self.filter_queryset(self.get_queryset())
+        if fields is not None or omit is not None:
+            queryset = queryset.only(*SurveyResponseSerializer.model_fields(fields, omit))
+        instance = generics.get_object_or_404(queryset, pk=self.kwargs['pk'])
+        self.check_object_permissions(request, instance)
+        return Response(self.get_serializer(instance, fields=fields, omit=omit).data)
 
 
-class SurveyChoiceListView(generics.ListAPIView):
+class SurveyChoiceListView(ConditionalGetMixin, generics.ListAPIView):
     """List all survey choices for reference"""
     queryset = SurveyChoice.objects.all()
     serializer_class = SurveyChoiceSerializer
+    conditional_scope = 'choices'
+    
+    def get_data_version(self):
+        return survey_choices_version()
 
 
 @api_view(['POST'])
 def import_qualtrics_csv(request):
-    """Import Qualtrics CSV data"""
+    """Import Qualtrics CSV data (mapped and committed in chunks, see importing.py)"""
     if request.method == 'POST':
         serializer = QualtricsImportSerializer(data=request.data)
         
@@ -174,81 +263,22 @@ def import_qualtrics_csv(request):
             csv_file = serializer.validated_data['csv_file']
             
             try:
-                # Read CSV file
-                df = pd.read_csv(csv_file)
-                
-                # Skip the first two rows (headers and descriptions)
-                df = df.iloc[2:].reset_index(drop=True)
+                # Imported here so pandas is only loaded by workers that import CSVs
+                from .importing import import_survey_csv
+
+                # Read, map and commit the file in chunks rather than all at once
+                result = import_survey_csv(csv_file)
                 
-                imported_count = 0
                 errors = []
+                for row_number, message in result['errors']:
+                    logger.warning('CSV import skipped row %s: %s', row_number, message)
+                    errors.append(f'Row {row_number}: could not be imported')
                 
-                with transaction.atomic():
-                    for index, row in df.iterrows():
-                        try:
-                            # Map CSV columns to model fields
-                            response_data = {
-                                'start_date': pd.to_datetime(row['StartDate']),
-                                'end_date': pd.to_datetime(row['EndDate']),
-                                'status': int(row['Status']) if pd.notna(row['Status']) else None,
-                                'progress': int(row['Progress']) if pd.notna(row['Progress']) else None,
-                                'duration_seconds': int(row['Duration (in seconds)']) if pd.notna(row['Duration (in seconds)']) else None,
-                                'finished': bool(int(row['Finished'])) if pd.notna(row['Finished']) else False,
-                                'recorded_date': pd.to_datetime(row['RecordedDate']),
-                                'response_id': row['ResponseId'],
-                                'distribution_channel': row['DistributionChannel'],
-                                'user_language': row['UserLanguage'],
-                                'recaptcha_score': float(row['Q_RecaptchaScore']) if pd.notna(row['Q_RecaptchaScore']) else None,
-                                'survey_type': int(row['Q1.1']) if pd.notna(row['Q1.1']) else None,
-                                'a_number': row['Q2.1'] if pd.notna(row['Q2.1']) else '',
-                                'project_title': row['Q2.2'] if pd.notna(row['Q2.2']) else '',
-                                'mentor_choice': int(row['Q2.3']) if pd.notna(row['Q2.3']) else None,
-                                'mentor_other_text': row['Q2.3_20_TEXT'] if pd.notna(row['Q2.3_20_TEXT']) else '',
-                                'mentor_name': row['Q2.3.a'] if pd.notna(row['Q2.3.a']) else '',
-                                'is_first_project': bool(int(row['Q2.4'])) if pd.notna(row['Q2.4']) else None,
-                                'topics_working_on': int(row['Q2.6']) if pd.notna(row['Q2.6']) else None,
-                                'confidence_topics': int(row['Q2.7']) if pd.notna(row['Q2.7']) else None,
-                                'enough_resources': int(row['Q2.8']) if pd.notna(row['Q2.8']) else None,
-                                'hope_to_gain': row['Q2.9'] if pd.notna(row['Q2.9']) else '',
-                                'additional_comments_starting': row['Q2.10'] if pd.notna(row['Q2.10']) else '',
-                                # Ending survey fields
-                                'gained_learned': row['Q3.5'] if pd.notna(row['Q3.5']) else '',
-                                'what_went_well': row['Q3.6'] if pd.notna(row['Q3.6']) else '',
-                                'what_could_improve': row['Q3.7'] if pd.notna(row['Q3.7']) else '',
-                                'topics_worked_on': int(row['Q3.8']) if pd.notna(row['Q3.8']) else None,
-                                'hard_skills_improved': int(row['Q3.9']) if pd.notna(row['Q3.9']) else None,
-                                'soft_skills_improved': int(row['Q3.10']) if pd.notna(row['Q3.10']) else None,
-                                'confidence_job_placement': int(row['Q3.11']) if pd.notna(row['Q3.11']) else None,
-                                # Rating fields
-                                'rating_onboarding': int(row['Q3.12_1']) if pd.notna(row['Q3.12_1']) else None,
-                                'rating_initiation': int(row['Q3.12_2']) if pd.notna(row['Q3.12_2']) else None,
-                                'rating_mentorship': int(row['Q3.12_3']) if pd.notna(row['Q3.12_3']) else None,
-                                'rating_team': int(row['Q3.12_4']) if pd.notna(row['Q3.12_4']) else None,
-                                'rating_communications': int(row['Q3.12_5']) if pd.notna(row['Q3.12_5']) else None,
-                                'rating_expectations': int(row['Q3.12_6']) if pd.notna(row['Q3.12_6']) else None,
-                                'rating_sponsor': int(row['Q3.12_7']) if pd.notna(row['Q3.12_7']) else None,
-                                'rating_workload': int(row['Q3.12_8']) if pd.notna(row['Q3.12_8']) else None,
-                                'recommend_asc': int(row['Q3.13']) if pd.notna(row['Q3.13']) else None,
-                                'additional_comments_ending': row['Q3.14'] if pd.notna(row['Q3.14']) else '',
-                            }
-                            
-                            # Create or update the response
-                            response_obj, created = SurveyResponse.objects.update_or_create(
-                                response_id=response_data['response_id'],
-                                defaults=response_data
-                            )
-                            
-                            if created:
-                                imported_count += 1
-                                
-                        except Exception:
-                            logger.warning('CSV import skipped row %s', index + 3, exc_info=True)
-                            errors.append(f'Row {index + 3}: could not be imported')
-                            continue
-                
+                prewarm_dashboard_cache()
                 return Response({
-                    'message': f'Successfully imported {imported_count} survey responses',
-                    'imported_count': imported_count,
+                    'message': f"Successfully imported {result['created']} survey responses",
+                    'imported_count': result['created'],
+                    'updated_count': result['updated'],
                     'errors': errors[:10] if errors else [],  # Limit errors shown
                     'total_errors': len(errors)
                 }, status=status.HTTP_201_CREATED)
@@ -264,51 +294,17 @@ def import_qualtrics_csv(request):
 
 
 @api_view(['GET'])
+@conditional_get('dashboard_stats', survey_responses_version)
 def dashboard_stats(request):
-    """Get dashboard statistics"""
+    """Get dashboard statistics (optionally broken down with ?group_by=mentor|topic|month)"""
+    group_by = request.GET.get('group_by') or None
+    if group_by and group_by not in GROUP_BY_CHOICES:
+        return Response(
+            {'error': f"group_by must be one of: {', '.join(GROUP_BY_CHOICES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
     try:
-        # Apply filters - only ending surveys
-        queryset = apply_filters(SurveyResponse.objects.filter(survey_type=2), request.GET)
-        
-        total_responses = queryset.count()
-        starting_responses = 0  # We're only showing ending surveys
-        ending_responses = queryset.count()
-        
-        # Average ratings for ending surveys
-        ending_surveys = queryset  # Already filtered to ending surveys
-        
-        avg_ratings = {}
-        rating_fields = [
-            'rating_onboarding', 'rating_initiation', 'rating_mentorship',
-            'rating_team', 'rating_communications', 'rating_expectations',
-            'rating_sponsor', 'rating_workload'
-        ]
-        
-        for field in rating_fields:
-            try:
-                values = list(ending_surveys.exclude(**{field: None}).values_list(field, flat=True))
-                if values:
-                    avg_ratings[field] = round(sum(values) / len(values), 2)
-            except Exception as e:
-                avg_ratings[field] = None
-        
-        # Average recommendation score
-        try:
-            recommend_scores = list(ending_surveys.exclude(recommend_asc=None).values_list('recommend_asc', flat=True))
-            avg_recommendation = round(sum(recommend_scores) / len(recommend_scores), 2) if recommend_scores else None
-        except Exception as e:
-            avg_recommendation = None
-        
-        completion_rate = 100  # Since we're only showing ending surveys, completion rate is 100%
-        
-        return Response({
-            'total_responses': total_responses,
-            'starting_responses': starting_responses,
-            'ending_responses': ending_responses,
-            'average_ratings': avg_ratings,
-            'average_recommendation': avg_recommendation,
-            'completion_rate': completion_rate
-        })
+        return _cached_response(request, 'dashboard_stats')
     except Exception:
         logger.exception('dashboard_stats failed')
         return Response({
@@ -327,43 +323,32 @@ def test_api(request):
     """Test endpoint to verify API is working"""
     return Response({
         'message': 'API is working!',
-        'timestamp': pd.Timestamp.now().isoformat(),
+        'timestamp': timezone.localtime().isoformat(),
         'total_responses': SurveyResponse.objects.count()
     })
 
 
 @api_view(['GET'])
+@conditional_get('survey_analytics', survey_responses_version)
 def survey_analytics(request):
-    """Get detailed analytics for the dashboard"""
+    """
+    Get detailed analytics for the dashboard: one value per answering ending survey, or
+    with ?mode=histogram {answer: count} maps (optionally per ?group_by=mentor|topic|month)
+    """
+    mode = request.GET.get('mode') or 'lists'
+    group_by = request.GET.get('group_by') or None
+    if mode not in ANALYTICS_MODES:
+        return Response(
+            {'error': f"mode must be one of: {', '.join(ANALYTICS_MODES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if group_by and (mode != 'histogram' or group_by not in GROUP_BY_CHOICES):
+        return Response(
+            {'error': f"group_by requires mode=histogram and must be one of: {', '.join(GROUP_BY_CHOICES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
     try:
-        # Apply filters - only ending surveys
-        queryset = apply_filters(SurveyResponse.objects.filter(survey_type=2), request.GET)
-        
-        # Topic analysis - only ending surveys
-        topics_ending = list(queryset.filter(
-            topics_worked_on__isnull=False
-        ).values_list('topics_worked_on', flat=True))
-        
-        # Confidence analysis (from ending surveys - Q3.11)
-        confidence_data = list(queryset.filter(
-            confidence_job_placement__isnull=False
-        ).values_list('confidence_job_placement', flat=True))
-        
-        # Skills improvement analysis
-        hard_skills_data = list(queryset.filter(
-            hard_skills_improved__isnull=False
-        ).values_list('hard_skills_improved', flat=True))
-        
-        soft_skills_data = list(queryset.filter(
-            soft_skills_improved__isnull=False
-        ).values_list('soft_skills_improved', flat=True))
-        
-        return Response({
-            'topics_ending': topics_ending,
-            'confidence_levels': confidence_data,
-            'hard_skills_improvement': hard_skills_data,
-            'soft_skills_improvement': soft_skills_data,
-        })
+        return _cached_response(request, 'survey_analytics')
     except Exception:
         logger.exception('survey_analytics failed')
         return Response({
@@ -376,32 +361,11 @@ def survey_analytics(request):
 
 
 @api_view(['GET'])
+@conditional_get('available_data', survey_responses_version)
 def available_data(request):
     """Get available data for filter dropdowns"""
     try:
-        # Get all survey responses (both starting and ending)
-        queryset = SurveyResponse.objects.all()
-        
-        # Get unique mentors from project_mentor field
-        mentors = list(queryset.exclude(
-            Q(project_mentor='') | Q(project_mentor__isnull=True)
-        ).values_list('project_mentor', flat=True).distinct())
-        
-        # Get unique project titles
-        projects = list(queryset.exclude(
-            Q(project_title='') | Q(project_title__isnull=True)
-        ).values_list('project_title', flat=True).distinct())
-        
-        # Get unique topics from topic field
-        topics = list(queryset.exclude(
-            Q(topic='') | Q(topic__isnull=True)
-        ).values_list('topic', flat=True).distinct())
-        
-        return Response({
-            'mentors': sorted(mentors),
-            'projects': sorted(projects),
-            'topics': sorted(topics)
-        })
+        return _cached_response(request, 'available_data')
     except Exception:
         logger.exception('available_data failed')
         return Response({
@@ -412,205 +376,140 @@ def available_data(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@conditional_get('dashboard_summary', survey_responses_version)
+def dashboard_summary(request):
+    """Stats, distributions and filter options for the dashboard page in one response"""
+    try:
+        return _cached_response(request, 'dashboard_summary')
+    except Exception:
+        logger.exception('dashboard_summary failed')
+        return Response({
+            'error': 'Error calculating dashboard summary.',
+            'stats': None,
+            'averages': {},
+            'distributions': {},
+            'overall': {},
+            'facets': {'mentor': [], 'topic': [], 'project': [], 'month': []},
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@conditional_get('trends', survey_responses_version)
+def dashboard_trends(request):
+    """
+    Rating and recommendation averages of ending surveys per ?interval=day|week|month|term
+    (default week), with moving averages over the last ?window=N buckets
+    """
+    interval = request.GET.get('interval') or 'week'
+    if interval not in TREND_INTERVALS:
+        return Response(
+            {'error': f"interval must be one of: {', '.join(TREND_INTERVALS)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    try:
+        window = int(request.GET.get('window') or 0)
+    except ValueError:
+        window = -1
+    if not 0 <= window <= MAX_TREND_WINDOW:
+        return Response(
+            {'error': f'window must be an integer between 0 (none) and {MAX_TREND_WINDOW}.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    try:
+        return _cached_response(request, 'trends')
+    except Exception:
+        logger.exception('dashboard_trends failed')
+        return Response({
+            'error': 'Error calculating trends.',
+            'interval': interval,
+            'window': window or None,
+            'buckets': [],
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@conditional_get('facets', survey_responses_version)
+def dashboard_facets(request):
+    """Filter values with response counts, each dimension filtered by the other active filters"""
+    try:
+        return _cached_response(request, 'facets')
+    except Exception:
+        logger.exception('dashboard_facets failed')
+        return Response({
+            'error': 'Error calculating filter counts.',
+            'mentor': [],
+            'topic': [],
+            'project': [],
+            'month': [],
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+def dashboard_cache_stats(request):
+    """Hit/miss counters and current data version of the dashboard cache"""
+    return Response(cache_counters())
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def qualtrics_webhook(request):
-    """Webhook endpoint to receive new survey responses from Qualtrics"""
+    """
+    Webhook endpoint to receive new survey responses from Qualtrics.
+
+    The payload is stored in the webhook inbox and mapped later by drain_webhook_inbox.
+    Queuing waits on the SQLite write lock for at most its busy timeout; a delivery that
+    cannot be queued gets a 503 and is retried by Qualtrics.
+    """
     ok, err_body, err_status = _qualtrics_webhook_auth(request)
     if not ok:
         return Response(err_body, status=err_status)
     try:
-        data = request.data
-
-        # Handle different data formats that Qualtrics might send
-        if not isinstance(data, dict):
-            data = dict(data) if hasattr(data, 'items') else {}
-
-        # If data is empty, try to get it from request.POST (form data)
-        if not data and request.POST:
-            data = dict(request.POST)
-            for key, value in data.items():
-                if isinstance(value, list) and len(value) == 1:
-                    data[key] = value[0]
-
-        # Helper function to safely parse datetime
-        def safe_datetime(value):
-            if not value or value == '':
-                return None
-            try:
-                return pd.to_datetime(value)
-            except:
-                return None
-        
-        # Helper function to safely parse integer
-        def safe_int(value):
-            if not value or value == '' or value == '0':
-                return None
-            try:
-                return int(value)
-            except:
-                return None
-        
-        # Helper function to safely parse float
-        def safe_float(value):
-            if not value or value == '' or value == '0':
-                return None
-            try:
-                return float(value)
-            except:
-                return None
-        
-        # Helper function to safely parse boolean
-        def safe_bool(value):
-            if not value or value == '':
-                return None
-            try:
-                return bool(int(value))
-            except:
-                return None
-        
-        # Helper function to map Q1.1 survey type
-        def map_survey_type(value):
-            if not value:
-                return None
-            value_lower = str(value).lower().strip()
-            if 'starting' in value_lower:
-                return 1  # Starting survey
-            elif 'ending' in value_lower:
-                return 2  # Ending survey
-            else:
-                return None
-        
-        # Helper function to map Q3.9-Q3.11 agreement scale
-        def map_agreement_scale(value):
-            if not value:
-                return None
-            value_lower = str(value).lower().strip()
-            if 'strongly disagree' in value_lower:
-                return 1  # Will be normalized to -1
-            elif 'somewhat disagree' in value_lower:
-                return 2  # Will be normalized to -0.5
-            elif 'neither agree nor disagree' in value_lower or 'neither' in value_lower:
-                return 3  # Will be normalized to 0
-            elif 'somewhat agree' in value_lower:
-                return 4  # Will be normalized to 0.5
-            elif 'strongly agree' in value_lower:
-                return 5  # Will be normalized to 1
-            else:
-                return None
-        
-        # Helper function to map Q3.12 rating scale (1-3)
-        def map_rating_scale(value):
-            if value is None or value == '':
-                return None
-            value_str = str(value).strip()
-            # Handle formats like "1 (Poor)", "2 (Neutral)", "2 (Fair)" or just "1" or "0"
-            if '(' in value_str:
-                # Extract number from "1 (Poor)" or "2 (Neutral)" format
-                number_part = value_str.split('(')[0].strip()
-                try:
-                    return int(number_part)
-                except:
-                    return None
-            else:
-                try:
-                    return int(value_str)
-                except:
-                    return None
-        
-        
-        # Get current timestamp for required datetime fields
-        current_time = timezone.now()
-        
-        # Check if this is an ending survey - only process ending surveys
-        survey_type = map_survey_type(data.get('Q1.1'))
-        if survey_type != 2:  # Not an ending survey
-            return Response({
-                'success': True,
-                'message': f'Survey type {survey_type} ({"Starting" if survey_type == 1 else "Unknown"}) - not processing. Only ending surveys are stored.',
-                'survey_type': survey_type,
-                'skipped': True
-            }, status=status.HTTP_200_OK)
-        
-        # Extract survey response data from Qualtrics webhook format
-        # Qualtrics typically sends data in this format
-        response_data = {
-            # Required fields with auto-populated defaults
-            'start_date': safe_datetime(data.get('StartDate')) or current_time,
-            'end_date': safe_datetime(data.get('EndDate')) or current_time,
-            'status': safe_int(data.get('Status')) or 1,
-            'progress': safe_int(data.get('Progress')) or 100,
-            'duration_seconds': safe_int(data.get('Duration (in seconds)')) or 0,
-            'finished': safe_bool(data.get('Finished')) if data.get('Finished') is not None else True,
-            'recorded_date': safe_datetime(data.get('RecordedDate')) or current_time,
-            # Handle both ResponseId and ResponseID field names
-            'response_id': data.get('ResponseId') or data.get('ResponseID', ''),
-            'distribution_channel': data.get('DistributionChannel', 'qualtrics'),
-            'user_language': data.get('UserLanguage', 'EN'),
-            'recaptcha_score': safe_float(data.get('Q_RecaptchaScore')),
-            'survey_type': survey_type,  # Already validated as 2 (ending survey)
-            'a_number': data.get('Q3.1', ''),  # A Number (string)
-            'project_title': data.get('Q3.2', ''),  # Project title (string)
-            'mentor_choice': None,  # No longer needed - we use project_mentor string directly
-            'mentor_other_text': data.get('Q3.3.a', ''),  # "Other" mentor text (string)
-            # Extract mentor name: if Q3.3 is "Other", use Q3.3.a, otherwise use Q3.3
-            'mentor_name': data.get('Q3.3.a', '') if data.get('Q3.3', '').strip().lower() == 'other' else data.get('Q3.3', ''),
-            'project_mentor': data.get('Q3.3.a', '') if data.get('Q3.3', '').strip().lower() == 'other' else data.get('Q3.3', ''),  # Display Q3.3.a when "Other" is selected
-            'is_first_project': None,  # Not used for ending surveys
-            'topics_working_on': None,  # Not used for ending surveys
-            'topics_worked_on': None,  # No longer needed - we use topic string directly
-            'topic': data.get('Q3.8', ''),  # Topic name string from JSON
-            'confidence_topics': None,  # Not used for ending surveys
-            'enough_resources': None,  # Not used for ending surveys
-            'hope_to_gain': '',  # Not used for ending surveys
-            'additional_comments_starting': '',  # Not used for ending surveys
-            # Ending survey fields - using string values directly
-            'gained_learned': data.get('Q3.5', ''),  # Q3.5 or Q3.2 for gained/learned
-            'what_went_well': data.get('Q3.6', ''),
-            'what_could_improve': data.get('Q3.7', ''),
-            'hard_skills_improved': map_agreement_scale(data.get('Q3.9')),
-            'soft_skills_improved': map_agreement_scale(data.get('Q3.10')),
-            'confidence_job_placement': map_agreement_scale(data.get('Q3.11')),
-            # Rating fields - using the new mapping function
-            'rating_onboarding': map_rating_scale(data.get('Q3.12.a')),
-            'rating_initiation': map_rating_scale(data.get('Q3.12.b')),
-            'rating_mentorship': map_rating_scale(data.get('Q3.12.c')),
-            'rating_team': map_rating_scale(data.get('Q3.12.d')),
-            'rating_communications': map_rating_scale(data.get('Q3.12.e')),
-            'rating_expectations': map_rating_scale(data.get('Q3.12.f')),
-            'rating_sponsor': map_rating_scale(data.get('Q3.12.g')),
-            'rating_workload': map_rating_scale(data.get('Q3.12.h')),
-            'recommend_asc': safe_int(data.get('Q3.13')),
-            'additional_comments_ending': data.get('Q3.14', ''),
-        }
-        
-        # Create or update the response
-        response_obj, created = SurveyResponse.objects.update_or_create(
-            response_id=response_data['response_id'],
-            defaults=response_data
-        )
-        
-        if created:
-            message = f"New survey response created with ID: {response_obj.id}"
-        else:
-            message = f"Survey response updated with ID: {response_obj.id}"
-        
-        logger.info(
-            'Qualtrics webhook: stored response_id=%s created=%s',
-            response_obj.response_id,
-            created,
+        entry = enqueue_payload(payload_from_request(request))
+    except Exception:
+        # Not queued: a 5xx makes Qualtrics retry the delivery later
+        logger.exception('Qualtrics webhook could not be queued')
+        return Response(
+            {'success': False, 'error': 'Webhook could not be queued.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
         )
-        return Response({
-            'success': True,
-            'message': message,
-            'response_id': response_obj.response_id,
-            'survey_type': response_obj.survey_type,
-            'created': created
-        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
-    except Exception:
-        logger.exception('Qualtrics webhook failed')
+    logger.info('Qualtrics webhook: queued inbox entry %s', entry.pk)
+    return Response({
+        'success': True,
+        'message': 'Survey response queued for processing',
+        'inbox_id': entry.pk,
+    }, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def qualtrics_webhook_batch(request):
+    """
+    Batch variant of the Qualtrics webhook for backfills: a JSON array or NDJSON body of
+    webhook payloads, mapped with the same rules and upserted in chunked transactions.
+
+    The body is read incrementally while the per-item results are streamed back as
+    {"results": [...], "totals": {...}}, so neither is held in memory in full.
+    """
+    ok, err_body, err_status = _qualtrics_webhook_auth(request)
+    if not ok:
+        return Response(err_body, status=err_status)
+
+    try:
+        chunk_size = int(request.query_params.get('chunk_size', DEFAULT_CHUNK_SIZE))
+    except ValueError:
+        chunk_size = 0
+    if chunk_size < 1:
         return Response(
-            {'success': False, 'error': 'Webhook processing failed.'},
+            {'success': False, 'error': 'chunk_size must be a positive integer.'},
             status=status.HTTP_400_BAD_REQUEST,
         )
+
+    # request.stream, not request.data: DRF would parse (and buffer) the whole body
+    results = ingest_payloads(
+        iter_payloads(request.stream),
+        chunk_size=chunk_size,
+        current_time=timezone.now(),
+    )
+    return StreamingHttpResponse(stream_results_json(results), content_type='application/json')
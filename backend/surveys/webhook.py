@@ -0,0 +1,84 @@
+"""
+Mapping of Qualtrics webhook payloads onto SurveyResponse fields (see mapping.py).
+
+Used by the inbox drain (see inbox.py) and the batch endpoint (see ingest.py); the
+single-response webhook view itself only stores payloads.
+"""
+
+from django.utils import timezone
+
+from .mapping import NOW, WEBHOOK_CONSTANTS, WEBHOOK_STEPS, mentor_name, survey_type_code, topic_name
+from .models import SurveyResponse
+
+
+def payload_from_request(request):
+    """The webhook body as a flat dict, whether Qualtrics sent JSON or form data."""
+    data = request.data
+
+    # Handle different data formats that Qualtrics might send
+    if not isinstance(data, dict):
+        data = dict(data) if hasattr(data, 'items') else {}
+
+    # If data is empty, try to get it from request.POST (form data)
+    if not data and request.POST:
+        data = dict(request.POST)
+        for key, value in data.items():
+            if isinstance(value, list) and len(value) == 1:
+                data[key] = value[0]
+
+    return data
+
+
+def map_webhook_payload(data, current_time=None):
+    """
+    (survey_type, response_data) for a webhook payload.
+
+    response_data is None for anything other than an ending survey, which are not stored.
+    Raises ValueError when the payload cannot be stored at all.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Payload is not a JSON object')
+
+    # Check if this is an ending survey - only process ending surveys
+    answer = data.get('Q1.1')
+    survey_type = survey_type_code(answer) if answer else None
+    if survey_type != 2:  # Not an ending survey
+        return survey_type, None
+
+    # Handle both ResponseId and ResponseID field names
+    response_id = data.get('ResponseId') or data.get('ResponseID', '')
+    if not response_id:
+        raise ValueError('Payload has no ResponseId')
+
+    # Get current timestamp for required datetime fields
+    if current_time is None:
+        current_time = timezone.now()
+
+    response_data = dict(WEBHOOK_CONSTANTS)
+    for field, key, convert, default in WEBHOOK_STEPS:
+        value = data.get(key)
+        if value is not None and value != '':
+            value = convert(value)
+        if value is None or value == '':
+            value = current_time if default is NOW else default
+        response_data[field] = value
+
+    mentor = mentor_name(data.get('Q3.3'), response_data['mentor_other_text'])
+    topic = data.get('Q3.8')
+    response_data.update({
+        'response_id': response_id,
+        'survey_type': survey_type,
+        'mentor_choice': None,  # No longer needed - we use project_mentor string directly
+        'mentor_name': mentor,
+        'project_mentor': mentor,
+        'topic': topic_name(topic) if topic else '',
+    })
+    return survey_type, response_data
+
+
+def upsert_webhook_response(response_data):
+    """Create or update the response mapped from a payload; returns (response, created)."""
+    return SurveyResponse.objects.update_or_create(
+        response_id=response_data['response_id'],
+        defaults=response_data,
+    )
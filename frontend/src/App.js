@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import api, { clearAuth } from './api/apiClient';
 import SummaryNumbers from './components/SummaryNumbers';
 import FilterControls from './components/FilterControls';
@@ -6,15 +6,29 @@ import SubmissionsList from './components/SubmissionsList';
 import Login from './components/Login';
 import './App.css';
 
+// Dashboard filters -> API query parameters. Mentor and topic come from the dropdowns,
+// so they are matched exactly (which the server can answer from its indexes).
+function filterParams(filters) {
+  const params = {};
+  if (filters.mentor) {
+    params.mentor = filters.mentor;
+    params.mentorMatch = 'exact';
+  }
+  if (filters.topic) {
+    params.topic = filters.topic;
+    params.topicMatch = 'exact';
+  }
+  if (filters.projectName) params.projectName = filters.projectName;
+  if (filters.startDate) params.startDate = filters.startDate;
+  if (filters.endDate) params.endDate = filters.endDate;
+  return params;
+}
+
 function App() {
   const [authChecked, setAuthChecked] = useState(false);
   const [isAuthenticated, setIsAuthenticated] = useState(false);
-  const [allResponses, setAllResponses] = useState([]);
-  const [filteredData, setFilteredData] = useState({
-    stats: null,
-    analytics: null
-  });
-  const [availableData, setAvailableData] = useState(null);
+  const [summary, setSummary] = useState(null);
+  const [submissions, setSubmissions] = useState([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
   const [filters, setFilters] = useState({});
@@ -47,10 +61,16 @@ function App() {
     setLoading(false);
   };
 
-  // Load all data on mount and when explicitly refreshed.
-  // When `silent` is true, skip the full-page loading state so scroll position is preserved
-  // (e.g. after editing a submission in the list).
+  // Only the latest request may update state when filters change quickly
+  const latestRequest = useRef(0);
+
+  // Load the summary and the first page of submissions for the current filters.
+  // Statistics, distributions and filter options are computed by the server
+  // (/dashboard/summary/), so the browser never downloads the full dataset.
+  // When `silent` is true, skip the full-page loading state so scroll position and
+  // the filter panel are preserved (e.g. after editing a submission or changing a filter).
   const fetchAllData = useCallback(async (silent = false) => {
+    const requestId = ++latestRequest.current;
     let showLoadingOverlay = false;
     try {
       if (!silent) {
@@ -58,30 +78,18 @@ function App() {
         showLoadingOverlay = true;
       }
       setError(null);
-      
-      await api.get('/test/');
 
-      const responsesResponse = await api.get('/responses/');
-      
-      const responses = responsesResponse.data.results || responsesResponse.data;
-      setAllResponses(responses);
-      
-      // Calculate available data from the responses
-      const responseMentors = [...new Set(responses.map(r => r.project_mentor).filter(Boolean))];
-      const responseTopics = [...new Set(responses.map(r => r.topic).filter(Boolean))];
-      const projects = [...new Set(responses.map(r => r.project_title).filter(Boolean))].sort();
-      
-      // Use actual mentor and topic data from responses
-      const allMentorOptions = responseMentors;
-      const allTopicOptions = responseTopics;
-      
-      // Set initial available data (will be updated dynamically based on filters)
-      setAvailableData({
-        mentors: allMentorOptions,
-        topics: allTopicOptions,
-        projects
-      });
+      const params = filterParams(filters);
+      const [summaryResponse, responsesResponse] = await Promise.all([
+        api.get('/dashboard/summary/', { params }),
+        api.get('/responses/', { params }),
+      ]);
+      if (requestId !== latestRequest.current) return;
+
+      setSummary(summaryResponse.data);
+      setSubmissions(responsesResponse.data.results || responsesResponse.data);
     } catch (err) {
+      if (requestId !== latestRequest.current) return;
       const errorMessage = err.response?.data?.error || err.message || 'Unknown error';
       setError(`Failed to fetch dashboard data: ${errorMessage}. Make sure the Django backend is running at https://ascprojectsurvey.com/api`);
       console.error('Error fetching data:', err);
@@ -90,229 +98,48 @@ function App() {
         setLoading(false);
       }
     }
-  }, []);
+  }, [filters]);
 
-  // Load data once on mount (only if authenticated)
+  // Load data on sign-in with the loading screen, then silently whenever filters change
+  const initialLoadDone = useRef(false);
   useEffect(() => {
-    if (isAuthenticated) {
-      fetchAllData();
+    if (!isAuthenticated) {
+      initialLoadDone.current = false;
+      return;
     }
+    fetchAllData(initialLoadDone.current);
+    initialLoadDone.current = true;
   }, [isAuthenticated, fetchAllData]);
 
-  // Client-side filtering function
-  const applyFilters = useCallback((responses, filters) => {
-    return responses.filter(response => {
-      // Mentor filter
-      if (filters.mentor) {
-        const mentorMatch = response.project_mentor?.toLowerCase().includes(filters.mentor.toLowerCase());
-        if (!mentorMatch) return false;
-      }
-
-      // Project name filter
-      if (filters.projectName) {
-        const projectMatch = response.project_title?.toLowerCase().includes(filters.projectName.toLowerCase());
-        if (!projectMatch) return false;
-      }
-
-      // Topic filter
-      if (filters.topic) {
-        const topicMatch = response.topic === filters.topic;
-        if (!topicMatch) return false;
-      }
-
-      // Date range filter
-      if (filters.startDate) {
-        const responseDate = new Date(response.recorded_date);
-        const startDate = new Date(filters.startDate);
-        if (responseDate < startDate) return false;
-      }
-
-      if (filters.endDate) {
-        const responseDate = new Date(response.recorded_date);
-        const endDate = new Date(filters.endDate);
-        if (responseDate > endDate) return false;
-      }
-
-      return true;
-    });
-  }, []);
-
-  // Calculate stats and analytics from filtered data
-  const calculateFilteredData = useCallback((responses) => {
-    const total_responses = responses.length;
-    const starting_responses = responses.filter(r => r.survey_type === 1).length;
-    const ending_responses = responses.filter(r => r.survey_type === 2).length;
-
-    // Calculate average ratings for ending surveys
-    const ending_surveys = responses.filter(r => r.survey_type === 2);
-    const avg_ratings = {};
-    
-    const rating_fields = [
-      'rating_onboarding', 'rating_initiation', 'rating_mentorship',
-      'rating_team', 'rating_communications', 'rating_expectations',
-      'rating_sponsor', 'rating_workload'
-    ];
-
-    rating_fields.forEach(field => {
-      const values = ending_surveys
-        .map(r => r[field])
-        .filter(val => val !== null && val !== undefined);
-      
-      if (values.length > 0) {
-        avg_ratings[field] = Math.round((values.reduce((sum, val) => sum + val, 0) / values.length) * 100) / 100;
-      }
-    });
-
-    // Average recommendation score
-    const recommend_scores = ending_surveys
-      .map(r => r.recommend_asc)
-      .filter(val => val !== null && val !== undefined);
-    
-    const avg_recommendation = recommend_scores.length > 0 
-      ? Math.round((recommend_scores.reduce((sum, val) => sum + val, 0) / recommend_scores.length) * 100) / 100
-      : null;
-
-    const completion_rate = starting_responses > 0 
-      ? Math.round((ending_responses / starting_responses * 100) * 100) / 100 
-      : 0;
-
-    // Analytics data
-    const topics_starting = responses
-      .filter(r => r.survey_type === 1 && r.topics_working_on)
-      .map(r => r.topics_working_on);
-    
-    const topics_ending = responses
-      .filter(r => r.survey_type === 2 && r.topics_worked_on)
-      .map(r => r.topics_worked_on);
-    
-    const confidence_levels = responses
-      .filter(r => r.survey_type === 2 && r.confidence_job_placement)
-      .map(r => r.confidence_job_placement);
-    
-    const hard_skills_improvement = responses
-      .filter(r => r.survey_type === 2 && r.hard_skills_improved)
-      .map(r => r.hard_skills_improved);
-    
-    const soft_skills_improvement = responses
-      .filter(r => r.survey_type === 2 && r.soft_skills_improved)
-      .map(r => r.soft_skills_improved);
-
-    return {
-      stats: {
-        total_responses,
-        starting_responses,
-        ending_responses,
-        average_ratings: avg_ratings,
-        average_recommendation: avg_recommendation,
-        completion_rate
-      },
-      analytics: {
-        topics_starting,
-        topics_ending,
-        confidence_levels,
-        hard_skills_improvement,
-        soft_skills_improvement
-      }
-    };
-  }, []);
-
-  // Calculate available options based on current filters
-  const calculateAvailableOptions = useCallback((responses, currentFilters) => {
-    // Start with all responses and apply filters one by one to get available options
-    let availableResponses = responses;
-    
-    // Apply mentor filter if present
-    if (currentFilters.mentor) {
-      availableResponses = availableResponses.filter(response => {
-        return response.project_mentor?.toLowerCase().includes(currentFilters.mentor.toLowerCase());
-      });
-    }
-    
-    // Apply topic filter if present
-    if (currentFilters.topic) {
-      availableResponses = availableResponses.filter(response => {
-        return response.topic === currentFilters.topic;
-      });
-    }
-    
-    // Apply project name filter if present
-    if (currentFilters.projectName) {
-      availableResponses = availableResponses.filter(response => {
-        return response.project_title?.toLowerCase().includes(currentFilters.projectName.toLowerCase());
-      });
+  // Clear filter values that are no longer selectable within the other filters
+  // (each facet is counted with every filter except its own)
+  useEffect(() => {
+    const facets = summary?.facets;
+    if (!facets) return;
+    const offered = (facet, value) => facets[facet].some(item => item.value === value);
+    const updatedFilters = { ...filters };
+    if (filters.mentor && !offered('mentor', filters.mentor)) {
+      updatedFilters.mentor = '';
     }
-    
-    // Apply date filters if present
-    if (currentFilters.startDate) {
-      const startDate = new Date(currentFilters.startDate);
-      availableResponses = availableResponses.filter(response => {
-        const responseDate = new Date(response.recorded_date);
-        return responseDate >= startDate;
-      });
+    if (filters.topic && !offered('topic', filters.topic)) {
+      updatedFilters.topic = '';
     }
-    
-    if (currentFilters.endDate) {
-      const endDate = new Date(currentFilters.endDate);
-      availableResponses = availableResponses.filter(response => {
-        const responseDate = new Date(response.recorded_date);
-        return responseDate <= endDate;
-      });
+    if (filters.projectName && !offered('project', filters.projectName)) {
+      updatedFilters.projectName = '';
     }
-    
-    // Now calculate available options from the filtered responses
-    const availableMentors = [...new Set(availableResponses.map(r => r.project_mentor).filter(Boolean))];
-    const availableTopics = [...new Set(availableResponses.map(r => r.topic).filter(Boolean))];
-    const availableProjects = [...new Set(availableResponses.map(r => r.project_title).filter(Boolean))].sort();
-    
-    return {
-      mentors: availableMentors,
-      topics: availableTopics,
-      projects: availableProjects
-    };
-  }, []);
-
-  // Update filtered data when filters or all responses change
-  useEffect(() => {
-    if (allResponses.length > 0) {
-      // First, check if current filter values are still valid and clear invalid ones
-      const availableOptions = calculateAvailableOptions(allResponses, filters);
-      const updatedFilters = { ...filters };
-      
-      // Clear mentor filter if current mentor is not in available mentors
-      if (filters.mentor && !availableOptions.mentors.includes(filters.mentor)) {
-        updatedFilters.mentor = '';
-      }
-      
-      // Clear topic filter if current topic is not in available topics
-      if (filters.topic && !availableOptions.topics.includes(filters.topic)) {
-        updatedFilters.topic = '';
-      }
-      
-      // Clear project filter if current project is not in available projects
-      if (filters.projectName && !availableOptions.projects.includes(filters.projectName)) {
-        updatedFilters.projectName = '';
-      }
-      
-      // Update filters if any were cleared
-      if (JSON.stringify(updatedFilters) !== JSON.stringify(filters)) {
-        setFilters(updatedFilters);
-        return; // Exit early, this will trigger the effect again with updated filters
-      }
-      
-      const filtered = applyFilters(allResponses, updatedFilters);
-      const calculated = calculateFilteredData(filtered);
-      setFilteredData(calculated);
-      
-      // Update available options based on current filters
-      setAvailableData(prevData => ({
-        ...prevData,
-        ...availableOptions
-      }));
+    if (JSON.stringify(updatedFilters) !== JSON.stringify(filters)) {
+      setFilters(updatedFilters);
     }
-  }, [allResponses, filters, applyFilters, calculateFilteredData, calculateAvailableOptions]);
+  }, [summary, filters]);
 
   const handleFiltersChange = useCallback((newFilters) => {
-    setFilters(newFilters);
+    // Skip refetching when nothing the server sees has changed (e.g. the filter panel's
+    // initial empty values)
+    setFilters(prevFilters => (
+      JSON.stringify(filterParams(prevFilters)) === JSON.stringify(filterParams(newFilters))
+        ? prevFilters
+        : newFilters
+    ));
   }, []);
 
   const handleSubmissionUpdate = useCallback(() => {
@@ -352,7 +179,7 @@ function App() {
         <div className="error">
           <h2>Error</h2>
           <p>{error}</p>
-          <button onClick={fetchAllData}>Retry</button>
+          <button onClick={() => fetchAllData()}>Retry</button>
         </div>
       </div>
     );
@@ -372,16 +199,12 @@ function App() {
       <main className="app-main">
         <FilterControls 
           onFiltersChange={handleFiltersChange}
-          availableData={availableData}
-          filteredCount={filteredData.stats?.total_responses || 0}
-        />
-        <SummaryNumbers 
-          dashboardStats={filteredData.stats} 
-          analytics={filteredData.analytics}
-          allResponses={allResponses}
+          facets={summary?.facets}
+          filteredCount={summary?.stats?.total_responses || 0}
         />
+        <SummaryNumbers summary={summary} />
         <SubmissionsList 
-          submissions={allResponses}
+          submissions={submissions}
           onUpdate={handleSubmissionUpdate}
         />
       </main>
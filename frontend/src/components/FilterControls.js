@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import './FilterControls.css';
 
-const FilterControls = ({ onFiltersChange, availableData, filteredCount }) => {
+const FilterControls = ({ onFiltersChange, facets, filteredCount }) => {
   const [filters, setFilters] = useState({
     mentor: '',
     topic: '',
@@ -46,10 +46,11 @@ const FilterControls = ({ onFiltersChange, availableData, filteredCount }) => {
     return mentor;
   };
 
-  // Get unique values for dropdowns and sort them alphabetically
-  const uniqueMentors = (availableData?.mentors || []).sort();
-  const uniqueTopics = (availableData?.topics || []).sort();
-  const uniqueProjects = (availableData?.projects || []).sort();
+  // Dropdown options with response counts, already sorted by the server. Each facet is
+  // counted within the other active filters, so the counts show what picking a value gives.
+  const mentorOptions = facets?.mentor || [];
+  const topicOptions = facets?.topic || [];
+  const projectOptions = facets?.project || [];
 
   return (
     <div className="filter-controls">
@@ -81,8 +82,8 @@ const FilterControls = ({ onFiltersChange, availableData, filteredCount }) => {
                 className="filter-select"
               >
                 <option value="">All Mentors</option>
-                {uniqueMentors.map(mentor => (
-                  <option key={mentor} value={mentor}>{getMentorDisplayName(mentor)}</option>
+                {mentorOptions.map(({ value, count }) => (
+                  <option key={value} value={value}>{getMentorDisplayName(value)} ({count})</option>
                 ))}
               </select>
             </div>
@@ -97,8 +98,8 @@ const FilterControls = ({ onFiltersChange, availableData, filteredCount }) => {
                 className="filter-select"
               >
                 <option value="">All Topics</option>
-                {uniqueTopics.map(topic => (
-                  <option key={topic} value={topic}>{topic}</option>
+                {topicOptions.map(({ value, count }) => (
+                  <option key={value} value={value}>{value} ({count})</option>
                 ))}
               </select>
             </div>
@@ -113,8 +114,8 @@ const FilterControls = ({ onFiltersChange, availableData, filteredCount }) => {
                 className="filter-select"
               >
                 <option value="">All Projects</option>
-                {uniqueProjects.map(project => (
-                  <option key={project} value={project}>{project}</option>
+                {projectOptions.map(({ value, count }) => (
+                  <option key={value} value={value}>{value} ({count})</option>
                 ))}
               </select>
             </div>
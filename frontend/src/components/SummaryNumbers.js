@@ -1,7 +1,7 @@
 import React from 'react';
 import './SummaryNumbers.css';
 
-const SummaryNumbers = ({ dashboardStats, analytics, allResponses }) => {
+const SummaryNumbers = ({ summary }) => {
   // Helper function to transform values to -1 to 1 scale
   const transformToScale = (value, originalMin, originalMax) => {
     if (value === null || value === undefined) return 0;
@@ -38,13 +38,10 @@ const SummaryNumbers = ({ dashboardStats, analytics, allResponses }) => {
     return transformed.toFixed(2);
   };
 
-  // Get average values from analytics data
+  // Likert averages for the current filters (computed by /dashboard/summary/)
   const getAverageValue = (fieldName) => {
-    if (!analytics || !analytics[fieldName] || analytics[fieldName].length === 0) {
-      return null;
-    }
-    const values = analytics[fieldName];
-    return values.reduce((sum, val) => sum + val, 0) / values.length;
+    const value = summary?.averages?.[fieldName];
+    return value === undefined ? null : value;
   };
 
   // Normalize value from original scale to -1 to 1
@@ -53,27 +50,17 @@ const SummaryNumbers = ({ dashboardStats, analytics, allResponses }) => {
     return 2 * (value - minVal) / (maxVal - minVal) - 1;
   };
 
-  // Get overall average from all responses (not just filtered ones) and normalize it
+  // Get overall average over all responses (not just filtered ones) and normalize it
   const getOverallAverage = (fieldName, minVal = 1, maxVal = 5) => {
-    if (!allResponses || allResponses.length === 0) {
-      return null;
-    }
-    
-    // For rating fields, get from ending surveys only
-    const endingSurveys = allResponses.filter(r => r.survey_type === 2);
-    const values = endingSurveys
-      .map(r => r[fieldName])
-      .filter(val => val !== null && val !== undefined);
-    
-    if (values.length === 0) return null;
-    const average = values.reduce((sum, val) => sum + val, 0) / values.length;
+    const average = summary?.overall?.[fieldName];
+    if (average === null || average === undefined) return null;
     return normalizeValue(average, minVal, maxVal);
   };
 
   // Calculate averages for each metric
-  const hardSkillsAvg = getAverageValue('hard_skills_improvement');
-  const softSkillsAvg = getAverageValue('soft_skills_improvement');
-  const confidenceAvg = getAverageValue('confidence_levels');
+  const hardSkillsAvg = getAverageValue('hard_skills_improved');
+  const softSkillsAvg = getAverageValue('soft_skills_improved');
+  const confidenceAvg = getAverageValue('confidence_job_placement');
 
   // Get overall averages for the first three metrics (1-5 scale)
   const overallHardSkills = getOverallAverage('hard_skills_improved', 1, 5);
@@ -81,14 +68,14 @@ const SummaryNumbers = ({ dashboardStats, analytics, allResponses }) => {
   const overallConfidence = getOverallAverage('confidence_job_placement', 1, 5);
   
   // Get rating averages from dashboard stats (filtered data)
-  const ratingOnboarding = dashboardStats?.average_ratings?.rating_onboarding;
-  const ratingInitiation = dashboardStats?.average_ratings?.rating_initiation;
-  const ratingMentorship = dashboardStats?.average_ratings?.rating_mentorship;
-  const ratingTeam = dashboardStats?.average_ratings?.rating_team;
-  const ratingCommunications = dashboardStats?.average_ratings?.rating_communications;
-  const ratingExpectations = dashboardStats?.average_ratings?.rating_expectations;
-  const ratingSponsor = dashboardStats?.average_ratings?.rating_sponsor;
-  const ratingWorkload = dashboardStats?.average_ratings?.rating_workload;
+  const ratingOnboarding = summary?.stats?.average_ratings?.rating_onboarding;
+  const ratingInitiation = summary?.stats?.average_ratings?.rating_initiation;
+  const ratingMentorship = summary?.stats?.average_ratings?.rating_mentorship;
+  const ratingTeam = summary?.stats?.average_ratings?.rating_team;
+  const ratingCommunications = summary?.stats?.average_ratings?.rating_communications;
+  const ratingExpectations = summary?.stats?.average_ratings?.rating_expectations;
+  const ratingSponsor = summary?.stats?.average_ratings?.rating_sponsor;
+  const ratingWorkload = summary?.stats?.average_ratings?.rating_workload;
 
   // Get overall averages for all responses (1-3 scale for ratings)
   const overallRatingOnboarding = getOverallAverage('rating_onboarding', 1, 3);
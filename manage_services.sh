@@ -3,24 +3,28 @@
 
 SERVICE_BACKEND="asc-dashboard-backend.service"
 SERVICE_FRONTEND="asc-dashboard-frontend.service"
+SERVICE_WORKER="asc-dashboard-webhook-worker.service"
 
 case "$1" in
     start)
         echo "Starting ASC Dashboard services..."
         sudo systemctl start $SERVICE_BACKEND
         sudo systemctl start $SERVICE_FRONTEND
+        sudo systemctl start $SERVICE_WORKER
         echo "Services started!"
         ;;
     stop)
         echo "Stopping ASC Dashboard services..."
         sudo systemctl stop $SERVICE_BACKEND
         sudo systemctl stop $SERVICE_FRONTEND
+        sudo systemctl stop $SERVICE_WORKER
         echo "Services stopped!"
         ;;
     restart)
         echo "Restarting ASC Dashboard services..."
         sudo systemctl restart $SERVICE_BACKEND
         sudo systemctl restart $SERVICE_FRONTEND
+        sudo systemctl restart $SERVICE_WORKER
         echo "Services restarted!"
         ;;
     status)
@@ -29,6 +33,9 @@ case "$1" in
         echo ""
         echo "=== Frontend Status ==="
         sudo systemctl status $SERVICE_FRONTEND --no-pager -l
+        echo ""
+        echo "=== Webhook Worker Status ==="
+        sudo systemctl status $SERVICE_WORKER --no-pager -l
         ;;
     logs-backend)
         echo "=== Backend Logs (last 50 lines) ==="
@@ -44,6 +51,13 @@ case "$1" in
         echo "=== Frontend Error Logs (last 50 lines) ==="
         tail -n 50 /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/logs/frontend.error.log
         ;;
+    logs-worker)
+        echo "=== Webhook Worker Logs (last 50 lines) ==="
+        tail -n 50 /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/logs/webhook-worker.log
+        echo ""
+        echo "=== Webhook Worker Error Logs (last 50 lines) ==="
+        tail -n 50 /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/logs/webhook-worker.error.log
+        ;;
     logs)
         echo "=== Backend Logs (last 20 lines) ==="
         tail -n 20 /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/logs/backend.log
@@ -60,16 +74,17 @@ case "$1" in
         tail -f /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/logs/frontend.log
         ;;
     *)
-        echo "Usage: $0 {start|stop|restart|status|logs|logs-backend|logs-frontend|follow-backend|follow-frontend}"
+        echo "Usage: $0 {start|stop|restart|status|logs|logs-backend|logs-frontend|logs-worker|follow-backend|follow-frontend}"
         echo ""
         echo "Commands:"
-        echo "  start           - Start both services"
-        echo "  stop            - Stop both services"
-        echo "  restart         - Restart both services"
-        echo "  status          - Show status of both services"
+        echo "  start           - Start all services"
+        echo "  stop            - Stop all services"
+        echo "  restart         - Restart all services"
+        echo "  status          - Show status of all services"
         echo "  logs            - Show recent logs from both services"
         echo "  logs-backend    - Show recent backend logs"
         echo "  logs-frontend   - Show recent frontend logs"
+        echo "  logs-worker     - Show recent webhook worker logs"
         echo "  follow-backend  - Follow backend logs in real-time"
         echo "  follow-frontend - Follow frontend logs in real-time"
         exit 1
@@ -5,13 +5,14 @@ echo ""
 # Kill any existing processes on ports 8000 and 3000
 echo "Stopping any existing processes..."
 pkill -f "python manage.py runserver" 2>/dev/null
+pkill -f "gunicorn --config python:asc_dashboard" 2>/dev/null
 pkill -f "react-scripts start" 2>/dev/null
 sleep 2
 
 echo "Starting Django Backend..."
 cd /home/ubuntu/ASC-Project-Entry-Exit-Dashboard
 cd backend
-nohup /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/.venv/bin/python manage.py runserver 0.0.0.0:8000 > ../nohup_backend.out 2>&1 &
+nohup /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/.venv/bin/python manage.py serve > ../nohup_backend.out 2>&1 &
 BACKEND_PID=$!
 echo "Backend started (PID: $BACKEND_PID)"
 
@@ -33,5 +34,5 @@ echo ""
 echo "Backend logs: tail -f /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/nohup_backend.out"
 echo "Frontend logs: tail -f /home/ubuntu/ASC-Project-Entry-Exit-Dashboard/nohup_frontend.out"
 echo ""
-echo "To stop: pkill -f 'python manage.py runserver' && pkill -f 'react-scripts start'"
+echo "To stop: pkill -f 'gunicorn --config python:asc_dashboard' && pkill -f 'react-scripts start'"
 